@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""Cluster near-duplicate findings across specialist reports with MinHash/LSH."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import sys
+import tempfile
+import time
+import zlib
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from contract import REQUIRED_REPORT_FILES
+
+CLUSTERS_VERSION = "1"
+CLUSTERS_NAME = "finding-clusters.json"
+BUNDLE_NAME = "audit-bundle.json"
+CONSOLIDATOR_REPORT_ID = Path(REQUIRED_REPORT_FILES[0]).stem
+
+# Text that describes the issue itself; ids, owners and effort differ between
+# lanes even when they report the same problem.
+FINGERPRINT_FIELDS = ("evidence", "impact", "recommendation")
+SEVERITY_RANK = {"critical": 0, "warning": 1, "info": 2}
+CONFIDENCE_RANK = {"high": 0, "medium": 1, "low": 2}
+
+DEFAULT_SIGNATURE_SIZE = 64
+DEFAULT_BANDS = 16
+DEFAULT_SHINGLE_SIZE = 5
+DEFAULT_THRESHOLD = 0.5
+
+TOKEN_RE = re.compile(r"[^0-9a-z]+")
+HASH_MASK = (1 << 64) - 1
+HASH_MULTIPLIER = 0x9E3779B97F4A7C15
+
+
+def utc_now() -> str:
+    return datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+
+
+def fail(message: str, code: int = 1) -> None:
+    print(f"ERROR: {message}", file=sys.stderr)
+    raise SystemExit(code)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Group near-duplicate findings from audit-bundle.json into a consolidated cluster file."
+    )
+    parser.add_argument(
+        "--out-dir",
+        default=".audit-fleet",
+        help=f"Directory containing {BUNDLE_NAME}; {CLUSTERS_NAME} is written here (default: .audit-fleet)",
+    )
+    parser.add_argument("--bundle", help=f"Bundle path (default: <out-dir>/{BUNDLE_NAME})")
+    parser.add_argument("--output", help=f"Cluster file path (default: <out-dir>/{CLUSTERS_NAME})")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help=f"Minimum shingle Jaccard similarity to merge two findings (default: {DEFAULT_THRESHOLD})",
+    )
+    parser.add_argument(
+        "--shingle-size",
+        type=int,
+        default=DEFAULT_SHINGLE_SIZE,
+        help=f"Characters per shingle (default: {DEFAULT_SHINGLE_SIZE})",
+    )
+    parser.add_argument(
+        "--signature-size",
+        type=int,
+        default=DEFAULT_SIGNATURE_SIZE,
+        help=f"MinHash signature length (default: {DEFAULT_SIGNATURE_SIZE})",
+    )
+    parser.add_argument(
+        "--bands",
+        type=int,
+        default=DEFAULT_BANDS,
+        help=f"LSH bands; must divide --signature-size (default: {DEFAULT_BANDS})",
+    )
+    return parser.parse_args()
+
+
+def load_bundle(path: Path) -> dict[str, Any]:
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        fail(f"bundle not found: {path} (run json-mirror.py first)")
+    except OSError as exc:
+        fail(f"cannot read bundle {path}: {exc}")
+    except json.JSONDecodeError as exc:
+        fail(f"invalid JSON in bundle {path}: {exc}")
+    if not isinstance(payload, dict) or not isinstance(payload.get("reports"), list):
+        fail(f"bundle {path} has no 'reports' array")
+    return payload
+
+
+def collect_findings(bundle: dict[str, Any]) -> list[dict[str, Any]]:
+    """Flatten specialist findings, tagging each with its report id.
+
+    The consolidator report restates specialist findings, so it is left out.
+    """
+    findings: list[dict[str, Any]] = []
+    for report in bundle["reports"]:
+        if not isinstance(report, dict):
+            continue
+        report_id = str(report.get("report_id", ""))
+        if report_id == CONSOLIDATOR_REPORT_ID:
+            continue
+        for finding in report.get("findings") or []:
+            if isinstance(finding, dict):
+                findings.append({"report_id": report_id, **finding})
+    return findings
+
+
+def shingles(finding: dict[str, Any], size: int) -> set[int]:
+    """Hash the character shingles of a finding's normalized issue text."""
+    parts = [str(finding.get(field) or "") for field in FINGERPRINT_FIELDS]
+    text = TOKEN_RE.sub(" ", " ".join(parts).lower()).strip()
+    if len(text) <= size:
+        grams = {text} if text else set()
+    else:
+        grams = {text[i : i + size] for i in range(len(text) - size + 1)}
+    # crc32 is stable across processes (unlike hash()); the multiply-xorshift
+    # spreads it over 64 bits so every bit of the result is usable.
+    hashes: set[int] = set()
+    for gram in grams:
+        value = (zlib.crc32(gram.encode("utf-8")) * HASH_MULTIPLIER) & HASH_MASK
+        hashes.add(value ^ (value >> 32))
+    return hashes
+
+
+def minhash(hashes: set[int], size: int) -> tuple[int, ...]:
+    """One-permutation MinHash: each shingle hash lands in one of ``size`` bins.
+
+    Hashing every shingle once (instead of once per permutation) keeps the
+    cost linear in the text length. Empty bins borrow the next non-empty bin
+    to the right, offset by the distance, so that similar sets still agree.
+    """
+    if not hashes:
+        return (0,) * size
+    bins: list[int | None] = [None] * size
+    for value in hashes:
+        rest, slot = divmod(value, size)
+        current = bins[slot]
+        if current is None or rest < current:
+            bins[slot] = rest
+    signature: list[int] = []
+    for slot in range(size):
+        distance = 0
+        while bins[(slot + distance) % size] is None:
+            distance += 1
+        signature.append(bins[(slot + distance) % size] + (distance << 64))
+    return tuple(signature)
+
+
+def jaccard(left: set[int], right: set[int]) -> float:
+    if not left or not right:
+        return 0.0
+    shared = len(left & right)
+    return shared / (len(left) + len(right) - shared)
+
+
+def cluster_findings(
+    sets: list[set[int]],
+    signature_size: int,
+    bands: int,
+    threshold: float,
+) -> tuple[list[int], int]:
+    """Assign every finding to the cluster whose seed it best matches.
+
+    A cluster is seeded by the first finding that matched no earlier seed,
+    and only seeds are entered into the LSH buckets. Each finding is compared
+    once with every seed it shares a band with and joins the most similar one
+    at or above ``threshold``, so members are always close to their seed and
+    unrelated findings cannot chain through intermediate ones. Returns each
+    finding's seed index and the number of exact comparisons made.
+    """
+    rows = signature_size // bands
+    seeds = list(range(len(sets)))
+    buckets: list[dict[tuple[int, ...], list[int]]] = [{} for _ in range(bands)]
+    comparisons = 0
+    for index, hashes in enumerate(sets):
+        if not hashes:
+            continue
+        signature = minhash(hashes, signature_size)
+        keys = [signature[band * rows : (band + 1) * rows] for band in range(bands)]
+        candidates = sorted({seed for band, key in enumerate(keys) for seed in buckets[band].get(key, ())})
+        best, best_similarity = None, 0.0
+        for seed in candidates:
+            comparisons += 1
+            similarity = jaccard(hashes, sets[seed])
+            if similarity >= threshold and similarity > best_similarity:
+                best, best_similarity = seed, similarity
+        if best is not None:
+            seeds[index] = best
+            continue
+        for band, key in enumerate(keys):
+            buckets[band].setdefault(key, []).append(index)
+    return seeds, comparisons
+
+
+def representative_key(finding: dict[str, Any]) -> tuple[int, int, int]:
+    return (
+        SEVERITY_RANK.get(str(finding.get("severity")), len(SEVERITY_RANK)),
+        CONFIDENCE_RANK.get(str(finding.get("confidence")), len(CONFIDENCE_RANK)),
+        -len(str(finding.get("evidence") or "")),
+    )
+
+
+def build_clusters(
+    findings: list[dict[str, Any]], sets: list[set[int]], seeds: list[int]
+) -> list[dict[str, Any]]:
+    members_by_seed: dict[int, list[int]] = {}
+    for index in range(len(findings)):
+        members_by_seed.setdefault(seeds[index], []).append(index)
+
+    clusters: list[dict[str, Any]] = []
+    for members in members_by_seed.values():
+        lead = min(members, key=lambda index: (representative_key(findings[index]), index))
+        representative = findings[lead]
+        clusters.append(
+            {
+                "severity": representative.get("severity"),
+                "size": len(members),
+                "reports": sorted({findings[index]["report_id"] for index in members}),
+                "representative": representative,
+                "members": [
+                    {
+                        "report_id": findings[index]["report_id"],
+                        "finding_id": findings[index].get("finding_id"),
+                        "severity": findings[index].get("severity"),
+                        "similarity": 1.0 if index == lead else round(jaccard(sets[index], sets[lead]), 4),
+                    }
+                    for index in members
+                ],
+            }
+        )
+
+    # Strongest, widest clusters first; the consolidator reads top-down.
+    clusters.sort(
+        key=lambda item: (
+            SEVERITY_RANK.get(str(item["severity"]), len(SEVERITY_RANK)),
+            -len(item["reports"]),
+            -item["size"],
+            item["members"][0]["report_id"],
+            str(item["members"][0]["finding_id"]),
+        )
+    )
+    for number, cluster in enumerate(clusters, start=1):
+        cluster["cluster_id"] = f"C-{number:04d}"
+    return clusters
+
+
+def write_json_atomic(path: Path, payload: dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=str(path.parent))
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle, indent=2, sort_keys=True)
+            handle.write("\n")
+        os.replace(tmp_name, path)
+    except OSError as exc:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        fail(f"cannot write JSON file {path}: {exc}")
+
+
+def main() -> None:
+    args = parse_args()
+    if not 0.0 < args.threshold <= 1.0:
+        fail("--threshold must be in (0, 1]")
+    if args.shingle_size < 1:
+        fail("--shingle-size must be at least 1")
+    if args.bands < 1 or args.signature_size < args.bands or args.signature_size % args.bands:
+        fail("--bands must be a positive divisor of --signature-size")
+
+    out_dir = Path(args.out_dir).expanduser()
+    bundle_path = Path(args.bundle).expanduser() if args.bundle else out_dir / BUNDLE_NAME
+    output_path = Path(args.output).expanduser() if args.output else out_dir / CLUSTERS_NAME
+
+    started = time.perf_counter()
+    bundle = load_bundle(bundle_path)
+    findings = collect_findings(bundle)
+    sets = [shingles(finding, args.shingle_size) for finding in findings]
+    seeds, comparisons = cluster_findings(sets, args.signature_size, args.bands, args.threshold)
+    clusters = build_clusters(findings, sets, seeds)
+    elapsed_ms = round((time.perf_counter() - started) * 1000, 3)
+
+    duplicate_clusters = [cluster for cluster in clusters if cluster["size"] > 1]
+    write_json_atomic(
+        output_path,
+        {
+            "clusters_version": CLUSTERS_VERSION,
+            "generated_at": utc_now(),
+            "source_bundle": str(bundle_path),
+            "bundle_generated_at": bundle.get("generated_at"),
+            "parameters": {
+                "fields": list(FINGERPRINT_FIELDS),
+                "shingle_size": args.shingle_size,
+                "signature_size": args.signature_size,
+                "bands": args.bands,
+                "threshold": args.threshold,
+            },
+            "finding_count": len(findings),
+            "cluster_count": len(clusters),
+            "clusters": clusters,
+        },
+    )
+
+    result = {
+        "ok": True,
+        "bundle": str(bundle_path),
+        "output": str(output_path),
+        "finding_count": len(findings),
+        "cluster_count": len(clusters),
+        "duplicate_clusters": len(duplicate_clusters),
+        "cross_report_clusters": sum(1 for cluster in duplicate_clusters if len(cluster["reports"]) > 1),
+        "merged_findings": len(findings) - len(clusters),
+        "comparisons": comparisons,
+        "elapsed_ms": elapsed_ms,
+    }
+    print(json.dumps(result, indent=2, sort_keys=True))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,424 @@
+#!/usr/bin/env python3
+"""Index findings from many audit-bundle.json files and query them across audits."""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import re
+import sqlite3
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Iterator
+
+from contract import REQUIRED_FINDING_KEYS
+
+INDEX_USER_VERSION = 1
+BUNDLE_NAME = "audit-bundle.json"
+DEFAULT_LIMIT = 50
+
+# Every contract key except the dependencies array is a text column; the
+# array goes to its own table so it can be filtered with an index.
+FINDING_COLUMNS = [key for key in REQUIRED_FINDING_KEYS if key != "dependencies"]
+FTS_COLUMNS = ["finding_id", "dimension", "evidence", "impact", "recommendation", "acceptance_criteria", "owner"]
+FILTER_COLUMNS = ("severity", "confidence", "effort", "dimension", "report_id")
+RELATIVE_SINCE_RE = re.compile(r"^(?P<count>\d+)(?P<unit>[dhm])$")
+
+CREATE_INDEX_SQL = f"""
+CREATE TABLE IF NOT EXISTS bundles (
+  id INTEGER PRIMARY KEY,
+  path TEXT NOT NULL UNIQUE,
+  sha256 TEXT NOT NULL,
+  mode TEXT,
+  generated_at TEXT,
+  finding_count INTEGER NOT NULL,
+  ingested_at TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS findings (
+  id INTEGER PRIMARY KEY,
+  bundle_id INTEGER NOT NULL REFERENCES bundles(id) ON DELETE CASCADE,
+  report_id TEXT NOT NULL,
+  report_title TEXT NOT NULL DEFAULT '',
+  generated_at TEXT,
+  {", ".join(f"{column} TEXT NOT NULL DEFAULT ''" for column in FINDING_COLUMNS)}
+);
+
+CREATE TABLE IF NOT EXISTS finding_dependencies (
+  finding_id INTEGER NOT NULL REFERENCES findings(id) ON DELETE CASCADE,
+  dependency TEXT NOT NULL,
+  PRIMARY KEY (finding_id, dependency)
+);
+
+CREATE INDEX IF NOT EXISTS idx_findings_bundle ON findings(bundle_id);
+CREATE INDEX IF NOT EXISTS idx_findings_severity ON findings(severity, generated_at);
+CREATE INDEX IF NOT EXISTS idx_findings_confidence ON findings(confidence);
+CREATE INDEX IF NOT EXISTS idx_findings_effort ON findings(effort);
+CREATE INDEX IF NOT EXISTS idx_findings_report ON findings(report_id, generated_at);
+CREATE INDEX IF NOT EXISTS idx_findings_generated ON findings(generated_at);
+CREATE INDEX IF NOT EXISTS idx_finding_dependencies_dependency ON finding_dependencies(dependency);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS findings_fts USING fts5(
+  {", ".join(FTS_COLUMNS)},
+  content='findings',
+  content_rowid='id',
+  tokenize='unicode61'
+);
+
+PRAGMA user_version = {INDEX_USER_VERSION};
+"""
+
+
+def utc_now() -> str:
+    return datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+
+
+def fail(message: str, code: int = 1) -> None:
+    print(f"ERROR: {message}", file=sys.stderr)
+    raise SystemExit(code)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Ingest audit bundles into a SQLite findings index and query it across audits."
+    )
+    parser.add_argument(
+        "--index",
+        default=".audit-fleet/findings-index.sqlite3",
+        help="SQLite findings index path (default: .audit-fleet/findings-index.sqlite3)",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    ingest = subparsers.add_parser(
+        "ingest",
+        help="Add bundles to the index; unchanged bundles (same SHA-256) are skipped",
+    )
+    ingest.add_argument(
+        "paths",
+        nargs="+",
+        help=f"Bundle files, or directories searched recursively for {BUNDLE_NAME}",
+    )
+
+    query = subparsers.add_parser("query", help="Search indexed findings")
+    query.add_argument(
+        "--text",
+        help="FTS5 query over finding id, dimension, evidence, impact, recommendation, "
+        "acceptance criteria and owner (e.g. 'auth OR token*'); text that is not valid "
+        "FTS5 syntax, such as a path like 'src/auth.py', is searched as a phrase",
+    )
+    query.add_argument("--severity", action="append", help="Filter by severity (repeatable)")
+    query.add_argument("--confidence", action="append", help="Filter by confidence (repeatable)")
+    query.add_argument("--effort", action="append", help="Filter by effort (repeatable)")
+    query.add_argument("--dimension", action="append", help="Filter by dimension (repeatable)")
+    query.add_argument("--report-id", action="append", help="Filter by report id (repeatable)")
+    query.add_argument("--dependency", help="Only findings that list this dependency")
+    query.add_argument(
+        "--since",
+        help="Only bundles generated at or after this ISO 8601 timestamp, or a relative age like 90d, 12h, 30m",
+    )
+    query.add_argument(
+        "--limit",
+        type=int,
+        default=DEFAULT_LIMIT,
+        help=f"Maximum findings to return (default: {DEFAULT_LIMIT})",
+    )
+
+    subparsers.add_parser("stats", help="Summarize the index contents")
+    return parser.parse_args()
+
+
+def connect(index_path: Path) -> sqlite3.Connection:
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        conn = sqlite3.connect(str(index_path), isolation_level=None)
+    except sqlite3.Error as exc:
+        fail(f"cannot open findings index '{index_path}': {exc}")
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode = WAL;")
+    conn.execute("PRAGMA busy_timeout = 5000;")
+    conn.execute("PRAGMA foreign_keys = ON;")
+    return conn
+
+
+def ensure_index(conn: sqlite3.Connection) -> None:
+    version = int(conn.execute("PRAGMA user_version").fetchone()[0])
+    has_tables = conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'findings'").fetchone() is not None
+    if has_tables and version != INDEX_USER_VERSION:
+        fail(f"findings index has layout version {version}, expected {INDEX_USER_VERSION}; delete it and re-ingest")
+    try:
+        conn.executescript(CREATE_INDEX_SQL)
+    except sqlite3.OperationalError as exc:
+        if "fts5" in str(exc).lower():
+            fail("this Python's SQLite build does not include FTS5, which the findings index requires")
+        raise
+
+
+def iter_bundle_paths(paths: list[str]) -> Iterator[Path]:
+    seen: set[Path] = set()
+    for raw in paths:
+        path = Path(raw).expanduser()
+        if path.is_dir():
+            candidates = sorted(path.rglob(BUNDLE_NAME))
+        elif path.is_file():
+            candidates = [path]
+        else:
+            fail(f"bundle path not found: {path}")
+        for candidate in candidates:
+            resolved = candidate.resolve()
+            if resolved not in seen:
+                seen.add(resolved)
+                yield resolved
+
+
+def finding_rows(bundle: dict[str, Any], bundle_id: int) -> Iterator[tuple[list[Any], list[str]]]:
+    """Yield ``(row values, dependencies)`` for every finding in a bundle payload."""
+    generated_at = bundle.get("generated_at")
+    reports = bundle.get("reports")
+    for report in reports if isinstance(reports, list) else []:
+        if not isinstance(report, dict):
+            continue
+        report_id = str(report.get("report_id") or "")
+        title = str(report.get("title") or "")
+        findings = report.get("findings")
+        for finding in findings if isinstance(findings, list) else []:
+            if not isinstance(finding, dict):
+                continue
+            values = [bundle_id, report_id, title, generated_at]
+            values.extend(str(finding.get(column) or "") for column in FINDING_COLUMNS)
+            dependencies = finding.get("dependencies")
+            if not isinstance(dependencies, list):
+                dependencies = []
+            yield values, sorted({item for item in dependencies if isinstance(item, str) and item.strip()})
+
+
+def drop_bundle(conn: sqlite3.Connection, bundle_id: int) -> None:
+    # External-content FTS rows must be removed with their old values.
+    columns = ", ".join(FTS_COLUMNS)
+    conn.execute(
+        f"""
+        INSERT INTO findings_fts(findings_fts, rowid, {columns})
+        SELECT 'delete', id, {columns} FROM findings WHERE bundle_id = ?
+        """,
+        (bundle_id,),
+    )
+    conn.execute("DELETE FROM bundles WHERE id = ?", (bundle_id,))
+
+
+def ingest_bundle(conn: sqlite3.Connection, path: Path) -> str:
+    """Index one bundle and return ``added``, ``replaced`` or ``unchanged``."""
+    try:
+        data = path.read_bytes()
+    except OSError as exc:
+        fail(f"cannot read bundle {path}: {exc}")
+    digest = hashlib.sha256(data).hexdigest()
+
+    existing = conn.execute("SELECT id, sha256 FROM bundles WHERE path = ?", (str(path),)).fetchone()
+    if existing is not None and existing["sha256"] == digest:
+        return "unchanged"
+
+    try:
+        bundle = json.loads(data)
+    except ValueError as exc:
+        fail(f"invalid JSON in bundle {path}: {exc}")
+    if not isinstance(bundle, dict):
+        fail(f"bundle payload must be a JSON object: {path}")
+
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        if existing is not None:
+            drop_bundle(conn, int(existing["id"]))
+        cursor = conn.execute(
+            """
+            INSERT INTO bundles(path, sha256, mode, generated_at, finding_count, ingested_at)
+            VALUES(?, ?, ?, ?, 0, ?)
+            """,
+            (str(path), digest, bundle.get("mode"), bundle.get("generated_at"), utc_now()),
+        )
+        bundle_id = int(cursor.lastrowid)
+        first_id = int(conn.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM findings").fetchone()[0])
+
+        rows: list[list[Any]] = []
+        dep_rows: list[tuple[int, str]] = []
+        for offset, (values, deps) in enumerate(finding_rows(bundle, bundle_id)):
+            rows.append([first_id + offset, *values])
+            dep_rows.extend((first_id + offset, dep) for dep in deps)
+
+        columns = ["id", "bundle_id", "report_id", "report_title", "generated_at", *FINDING_COLUMNS]
+        conn.executemany(
+            f"INSERT INTO findings({', '.join(columns)}) VALUES({', '.join('?' for _ in columns)})",
+            rows,
+        )
+        conn.executemany(
+            "INSERT OR IGNORE INTO finding_dependencies(finding_id, dependency) VALUES(?, ?)",
+            dep_rows,
+        )
+        fts = ", ".join(FTS_COLUMNS)
+        conn.execute(
+            f"INSERT INTO findings_fts(rowid, {fts}) SELECT id, {fts} FROM findings WHERE bundle_id = ?",
+            (bundle_id,),
+        )
+        conn.execute("UPDATE bundles SET finding_count = ? WHERE id = ?", (len(rows), bundle_id))
+    except BaseException:
+        conn.rollback()
+        raise
+    conn.commit()
+    return "replaced" if existing is not None else "added"
+
+
+def handle_ingest(conn: sqlite3.Connection, paths: list[str]) -> dict[str, Any]:
+    counts = {"added": 0, "replaced": 0, "unchanged": 0}
+    for path in iter_bundle_paths(paths):
+        counts[ingest_bundle(conn, path)] += 1
+    totals = conn.execute(
+        "SELECT COUNT(*) AS bundles, COALESCE(SUM(finding_count), 0) AS findings FROM bundles"
+    ).fetchone()
+    return {
+        "ok": True,
+        "action": "ingested",
+        "bundles_added": counts["added"],
+        "bundles_replaced": counts["replaced"],
+        "bundles_unchanged": counts["unchanged"],
+        "indexed_bundles": int(totals["bundles"]),
+        "indexed_findings": int(totals["findings"]),
+    }
+
+
+def normalize_since(value: str) -> str:
+    """Turn ``90d``/``12h``/``30m`` or an ISO 8601 timestamp into a stored-format UTC timestamp."""
+    relative = RELATIVE_SINCE_RE.match(value.strip())
+    if relative:
+        unit = {"d": "days", "h": "hours", "m": "minutes"}[relative.group("unit")]
+        moment = datetime.now(timezone.utc) - timedelta(**{unit: int(relative.group("count"))})
+    else:
+        try:
+            moment = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+        except ValueError:
+            fail(f"invalid --since value '{value}': use an ISO 8601 timestamp or an age like 90d")
+        if moment.tzinfo is None:
+            moment = moment.replace(tzinfo=timezone.utc)
+    return moment.astimezone(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+
+
+def fts_phrase(text: str) -> str:
+    """Quote ``text`` as one FTS5 phrase so punctuation like ``/`` or ``:`` is not syntax."""
+    return '"' + text.replace('"', '""') + '"'
+
+
+def handle_query(conn: sqlite3.Connection, args: argparse.Namespace) -> dict[str, Any]:
+    if args.limit < 1:
+        fail("--limit must be at least 1")
+    started = time.perf_counter()
+
+    clauses: list[str] = []
+    params: list[Any] = []
+    joins = ""
+    order = "f.generated_at DESC, f.report_id, f.finding_id"
+    if args.text:
+        joins = "JOIN findings_fts ON findings_fts.rowid = f.id"
+        clauses.append("findings_fts MATCH ?")
+        params.append(args.text)
+        order = "bm25(findings_fts), " + order
+    for column in FILTER_COLUMNS:
+        values = getattr(args, column)
+        if values:
+            clauses.append(f"f.{column} IN ({', '.join('?' for _ in values)})")
+            params.extend(values)
+    if args.dependency:
+        clauses.append("f.id IN (SELECT finding_id FROM finding_dependencies WHERE dependency = ?)")
+        params.append(args.dependency)
+    since = normalize_since(args.since) if args.since else None
+    if since is not None:
+        clauses.append("f.generated_at >= ?")
+        params.append(since)
+
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+    columns = ", ".join(f"f.{column}" for column in FINDING_COLUMNS)
+    sql = f"""
+        SELECT f.report_id, f.report_title, f.generated_at, b.path AS bundle, {columns},
+               (SELECT json_group_array(dependency) FROM finding_dependencies d WHERE d.finding_id = f.id)
+                 AS dependencies
+        FROM findings f
+        JOIN bundles b ON b.id = f.bundle_id
+        {joins}
+        {where}
+        ORDER BY {order}
+        LIMIT ?
+    """
+    # One extra row tells a full page apart from a truncated one
+    text_as_phrase = False
+    try:
+        rows = conn.execute(sql, [*params, args.limit + 1]).fetchall()
+    except sqlite3.OperationalError as exc:
+        if not args.text:
+            fail(f"invalid query: {exc}")
+        params[0] = fts_phrase(args.text)
+        try:
+            rows = conn.execute(sql, [*params, args.limit + 1]).fetchall()
+        except sqlite3.OperationalError:
+            fail(f"invalid query: {exc}")
+        text_as_phrase = True
+    truncated = len(rows) > args.limit
+
+    findings = []
+    for row in rows[: args.limit]:
+        item = dict(row)
+        item["dependencies"] = json.loads(item["dependencies"])
+        findings.append(item)
+    return {
+        "ok": True,
+        "action": "query",
+        "since": since,
+        "text_as_phrase": text_as_phrase,
+        "count": len(findings),
+        "truncated": truncated,
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 2),
+        "findings": findings,
+    }
+
+
+def handle_stats(conn: sqlite3.Connection) -> dict[str, Any]:
+    totals = conn.execute(
+        """
+        SELECT COUNT(*) AS bundles, COALESCE(SUM(finding_count), 0) AS findings,
+               MIN(generated_at) AS oldest, MAX(generated_at) AS newest
+        FROM bundles
+        """
+    ).fetchone()
+    by_severity = {
+        str(row["severity"]): int(row["c"])
+        for row in conn.execute("SELECT severity, COUNT(*) AS c FROM findings GROUP BY severity ORDER BY severity")
+    }
+    return {
+        "ok": True,
+        "action": "stats",
+        "bundles": int(totals["bundles"]),
+        "findings": int(totals["findings"]),
+        "oldest_bundle": totals["oldest"],
+        "newest_bundle": totals["newest"],
+        "by_severity": by_severity,
+    }
+
+
+def main() -> None:
+    args = parse_args()
+    conn = connect(Path(args.index).expanduser())
+    try:
+        ensure_index(conn)
+        if args.command == "ingest":
+            result = handle_ingest(conn, args.paths)
+        elif args.command == "query":
+            result = handle_query(conn, args)
+        else:
+            result = handle_stats(conn)
+    except sqlite3.Error as exc:
+        fail(f"findings index operation failed: {exc}")
+    finally:
+        conn.close()
+    print(json.dumps(result, indent=2, sort_keys=True))
+
+
+if __name__ == "__main__":
+    main()
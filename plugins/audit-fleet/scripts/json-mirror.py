@@ -4,12 +4,15 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
+import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator, TextIO
 
 from contract import (
     ALLOWED_CONFIDENCE,
@@ -18,10 +21,14 @@ from contract import (
     REQUIRED_REPORT_FILES,
     REQUIRED_SECTION_ORDER,
     finding_key_deltas,
-    normalize_heading,
     normalize_key,
     section_order_deltas,
 )
+from section_index import SectionIndex, index_bytes, read_sections
+
+
+MIRROR_VERSION = "1"
+MANIFEST_NAME = "json-mirror-manifest.json"
 
 
 def utc_now() -> str:
@@ -53,6 +60,17 @@ def parse_args() -> argparse.Namespace:
         default="balanced",
         help="Validation mode while mirroring (default: balanced)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=0,
+        help="Parallel report parsers; 0 uses one per CPU, 1 parses serially (default: 0)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-parse every report even if the manifest says its source is unchanged",
+    )
     return parser.parse_args()
 
 
@@ -65,39 +83,6 @@ def split_pipe_row(line: str) -> list[str]:
     return [cell.strip() for cell in stripped.split("|")]
 
 
-def parse_markdown_sections(text: str) -> tuple[str, dict[str, str], list[str]]:
-    lines = text.splitlines()
-    title = ""
-
-    heading_matches: list[tuple[int, str, int]] = []
-    for idx, line in enumerate(lines):
-        h1 = re.match(r"^#\s+(.+?)\s*$", line)
-        if h1 and not title:
-            title = h1.group(1).strip()
-
-        h2 = re.match(r"^##\s+(.+?)\s*$", line)
-        if h2:
-            heading_matches.append((idx, h2.group(1).strip(), idx))
-
-    sections: dict[str, str] = {}
-    section_order: list[str] = []
-    expected_map = {normalize_heading(name): name for name in REQUIRED_SECTION_ORDER}
-
-    for i, (_, heading, start_idx) in enumerate(heading_matches):
-        norm = normalize_heading(heading)
-        if norm not in expected_map:
-            continue
-        canonical = expected_map[norm]
-        end_idx = len(lines)
-        if i + 1 < len(heading_matches):
-            end_idx = heading_matches[i + 1][0]
-        body = "\n".join(lines[start_idx + 1 : end_idx]).strip()
-        sections[canonical] = body
-        section_order.append(canonical)
-
-    return title, sections, section_order
-
-
 def parse_json_findings_block(text: str) -> tuple[list[dict[str, Any]] | None, list[str]]:
     warnings: list[str] = []
     blocks = re.findall(r"```json\s*(.*?)```", text, flags=re.DOTALL | re.IGNORECASE)
@@ -292,14 +277,22 @@ def compute_severity_totals(findings: list[dict[str, Any]]) -> dict[str, int]:
     return totals
 
 
-def parse_report(path: Path, mode: str, errors: list[str], warnings: list[str]) -> dict[str, Any] | None:
+def parse_report(
+    path: Path,
+    mode: str,
+    errors: list[str],
+    warnings: list[str],
+    entry: dict[str, Any] | None = None,
+) -> dict[str, Any] | None:
     try:
-        text = path.read_text(encoding="utf-8")
+        if entry is None:
+            entry = index_bytes(path.read_bytes())
+        sections, section_order = read_sections(path, entry)
     except OSError as exc:
         errors.append(f"{path.name}: cannot read report: {exc}")
         return None
 
-    title, sections, section_order = parse_markdown_sections(text)
+    title = entry["title"]
     if not title:
         errors.append(f"{path.name}: missing top-level heading")
 
@@ -396,14 +389,153 @@ def parse_report(path: Path, mode: str, errors: list[str], warnings: list[str])
     return report
 
 
-def write_json(path: Path, payload: Any) -> None:
+def write_text(path: Path, text: str) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     try:
-        path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        path.write_text(text + "\n", encoding="utf-8")
+    except OSError as exc:
+        fail(f"cannot write JSON file {path}: {exc}")
+
+
+ParsedReport = tuple[str, "str | None", "dict[str, int] | None", list[str], list[str]]
+
+
+def parse_report_task(path: str, mode: str, entry: dict[str, Any] | None) -> ParsedReport:
+    """Parse one report in a worker and return it already serialized.
+
+    Serializing in the worker keeps the pickled payload to a single string and
+    lets the parent write it to both the per-report file and the bundle
+    without re-encoding.
+    """
+    errors: list[str] = []
+    warnings: list[str] = []
+    report = parse_report(Path(path), mode, errors, warnings, entry)
+    if report is None:
+        return Path(path).stem, None, None, errors, warnings
+    text = json.dumps(report, indent=2, sort_keys=True)
+    return report["report_id"], text, report["totals"]["by_severity"], errors, warnings
+
+
+def iter_parsed_reports(
+    paths: list[Path], entries: dict[str, dict[str, Any]], mode: str, workers: int
+) -> Iterator[ParsedReport]:
+    """Yield parsed reports in input order, releasing each as soon as its predecessors are done."""
+    if workers <= 1 or len(paths) <= 1:
+        for path in paths:
+            yield parse_report_task(str(path), mode, entries.get(path.name))
+        return
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(paths))) as pool:
+        futures = {
+            pool.submit(parse_report_task, str(path), mode, entries.get(path.name)): idx
+            for idx, path in enumerate(paths)
+        }
+        pending: dict[int, ParsedReport] = {}
+        next_idx = 0
+        for future in as_completed(futures):
+            pending[futures[future]] = future.result()
+            while next_idx in pending:
+                yield pending.pop(next_idx)
+                next_idx += 1
+
+
+def load_manifest(path: Path) -> dict[str, Any]:
+    """Load the source-hash manifest; anything unreadable or stale is treated as empty."""
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(payload, dict) or payload.get("mirror_version") != MIRROR_VERSION:
+        return {}
+    reports = payload.get("reports")
+    return reports if isinstance(reports, dict) else {}
+
+
+def load_cached_report(
+    entry: Any, source: Path, source_sha256: str, mode: str, json_path: Path
+) -> str | None:
+    """Return the mirrored JSON text for ``source`` if the manifest entry still matches it."""
+    if not isinstance(entry, dict):
+        return None
+    if (
+        entry.get("source_sha256") != source_sha256
+        or entry.get("source") != str(source)
+        or entry.get("mode") != mode
+        or not isinstance(entry.get("by_severity"), dict)
+    ):
+        return None
+    try:
+        text = json_path.read_text(encoding="utf-8")
+    except OSError:
+        return None
+    text = text.rstrip("\n")
+    if hashlib.sha256(text.encode("utf-8")).hexdigest() != entry.get("json_sha256"):
+        return None
+    return text
+
+
+def write_manifest(path: Path, reports: dict[str, Any]) -> None:
+    payload = {"mirror_version": MIRROR_VERSION, "reports": reports}
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    try:
+        tmp_path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        os.replace(tmp_path, path)
     except OSError as exc:
         fail(f"cannot write JSON file {path}: {exc}")
 
 
+def nested_json(value: Any, depth: int) -> str:
+    return json.dumps(value, indent=2, sort_keys=True).replace("\n", "\n" + "  " * depth)
+
+
+class BundleWriter:
+    """Incrementally write audit-bundle.json one report at a time.
+
+    Reports are appended to the ``reports`` array as they arrive, so the full
+    bundle never has to be held in memory. ``report_count`` and ``totals`` are
+    only known once every report is in and are written after the array. The
+    bundle is assembled under a temporary name and renamed into place on close.
+    """
+
+    def __init__(self, path: Path, header: dict[str, Any]) -> None:
+        self.path = path
+        self.tmp_path = path.with_name(f".{path.name}.tmp")
+        self.report_count = 0
+        self.by_severity = {"critical": 0, "warning": 0, "info": 0}
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.handle: TextIO = self.tmp_path.open("w", encoding="utf-8")
+        self.handle.write("{\n")
+        for key in sorted(header):
+            self.handle.write(f"  {json.dumps(key)}: {nested_json(header[key], 1)},\n")
+        self.handle.write('  "reports": [')
+
+    def add(self, report_text: str, by_severity: dict[str, int]) -> None:
+        self.handle.write(",\n    " if self.report_count else "\n    ")
+        self.handle.write(report_text.replace("\n", "\n    "))
+        self.report_count += 1
+        for key, value in by_severity.items():
+            self.by_severity[key] += int(value)
+
+    def close(self) -> None:
+        self.handle.write("\n  ]" if self.report_count else "]")
+        trailer = {
+            "report_count": self.report_count,
+            "totals": {
+                "findings_total": sum(self.by_severity.values()),
+                "by_severity": self.by_severity,
+            },
+        }
+        for key in sorted(trailer):
+            self.handle.write(f",\n  {json.dumps(key)}: {nested_json(trailer[key], 1)}")
+        self.handle.write("\n}\n")
+        self.handle.close()
+        os.replace(self.tmp_path, self.path)
+
+    def abort(self) -> None:
+        self.handle.close()
+        self.tmp_path.unlink(missing_ok=True)
+
+
 def main() -> None:
     args = parse_args()
     reports_dir = Path(args.reports_dir).expanduser()
@@ -436,36 +568,85 @@ def main() -> None:
         else:
             warnings.append(message)
 
-    reports_payload: list[dict[str, Any]] = []
-    for report_name in REQUIRED_REPORT_FILES:
-        path = reports_dir / report_name
-        if not path.exists():
-            continue
-        report = parse_report(path, args.mode, errors, warnings)
-        if report is not None:
-            reports_payload.append(report)
-            write_json(reports_json_dir / f"{path.stem}.json", report)
-
-    reports_payload.sort(key=lambda item: item["report_id"])
-
-    bundle_totals = {"critical": 0, "warning": 0, "info": 0}
-    for report in reports_payload:
-        for key, value in report["totals"]["by_severity"].items():
-            bundle_totals[key] += int(value)
+    report_paths = [reports_dir / name for name in REQUIRED_REPORT_FILES if (reports_dir / name).exists()]
+    workers = args.workers if args.workers > 0 else (os.cpu_count() or 1)
+    manifest_path = out_dir / MANIFEST_NAME
+    previous_manifest = {} if args.no_cache else load_manifest(manifest_path)
+    manifest: dict[str, Any] = {}
+
+    # Reuse the mirrored JSON of every report whose source hash is unchanged;
+    # only the rest go to the parser pool.
+    index = SectionIndex(reports_dir)
+    entries: dict[str, dict[str, Any]] = {}
+    cached: dict[str, str] = {}
+    stale_paths: list[Path] = []
+    for path in report_paths:
+        text = None
+        try:
+            entries[path.name] = index.get(path.name)
+        except OSError:
+            pass
+        else:
+            text = load_cached_report(
+                previous_manifest.get(path.name),
+                path,
+                entries[path.name]["sha256"],
+                args.mode,
+                reports_json_dir / f"{path.stem}.json",
+            )
+        if text is None:
+            stale_paths.append(path)
+        else:
+            cached[path.name] = text
+    index.save()
 
-    bundle = {
+    header = {
         "schema_version": "1.0.0",
         "mode": args.mode,
         "generated_at": utc_now(),
         "required_reports": REQUIRED_REPORT_FILES,
-        "report_count": len(reports_payload),
-        "reports": reports_payload,
-        "totals": {
-            "findings_total": sum(bundle_totals.values()),
-            "by_severity": bundle_totals,
-        },
     }
-    write_json(bundle_path, bundle)
+    try:
+        bundle = BundleWriter(bundle_path, header)
+    except OSError as exc:
+        fail(f"cannot write JSON file {bundle_path}: {exc}")
+
+    try:
+        parsed = iter_parsed_reports(stale_paths, entries, args.mode, workers)
+        for path in report_paths:
+            if path.name in cached:
+                entry = previous_manifest[path.name]
+                report_text = cached[path.name]
+                by_severity = entry["by_severity"]
+                report_errors = list(entry.get("errors", []))
+                report_warnings = list(entry.get("warnings", []))
+            else:
+                _, report_text, by_severity, report_errors, report_warnings = next(parsed)
+                if report_text is not None and by_severity is not None:
+                    write_text(reports_json_dir / f"{path.stem}.json", report_text)
+            errors.extend(report_errors)
+            warnings.extend(report_warnings)
+            if report_text is None or by_severity is None:
+                continue
+            bundle.add(report_text, by_severity)
+            manifest[path.name] = {
+                "source": str(path),
+                "source_sha256": entries.get(path.name, {}).get("sha256"),
+                "mode": args.mode,
+                "json_sha256": hashlib.sha256(report_text.encode("utf-8")).hexdigest(),
+                "by_severity": by_severity,
+                "errors": report_errors,
+                "warnings": report_warnings,
+            }
+        bundle.close()
+    except OSError as exc:
+        bundle.abort()
+        fail(f"cannot write JSON file {bundle_path}: {exc}")
+    except BaseException:
+        bundle.abort()
+        raise
+
+    write_manifest(manifest_path, manifest)
 
     ok = not errors and (args.mode == "balanced" or not warnings)
     result = {
@@ -478,7 +659,9 @@ def main() -> None:
         "present_reports": present_reports,
         "missing_reports": missing_reports,
         "unexpected_reports": unexpected_reports,
-        "reports_written": len(reports_payload),
+        "reports_written": bundle.report_count,
+        "reports_parsed": len(stale_paths),
+        "reports_reused": len(cached),
         "errors": errors,
         "warnings": warnings,
     }
@@ -4,11 +4,12 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import os
 import re
 import sys
-from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator
 
 WINDOWS_DRIVE_RE = re.compile(r"^(?P<drive>[A-Za-z]):[\\/]*(?P<rest>.*)$")
 WSL_MOUNT_RE = re.compile(r"^/mnt/(?P<drive>[A-Za-z])(?:/(?P<rest>.*))?$")
@@ -17,6 +18,12 @@ WINDOWS_WSL_UNC_RE = re.compile(
     re.IGNORECASE,
 )
 
+RESOLVE_CACHE_SIZE = 65536
+
+
+class PathConversionError(ValueError):
+    """Raised when a path cannot be converted to the requested format."""
+
 
 def fail(message: str, code: int = 1) -> None:
     print(f"ERROR: {message}", file=sys.stderr)
@@ -27,7 +34,7 @@ def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Convert paths between Windows and WSL forms."
     )
-    parser.add_argument("path", help="Input path")
+    parser.add_argument("path", nargs="?", help="Input path (omit with --stdin)")
     parser.add_argument(
         "--to",
         choices=("auto", "wsl", "windows"),
@@ -53,9 +60,28 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--json",
         action="store_true",
-        help="Print structured JSON output",
+        help="Print structured JSON output (one compact object per line with --stdin)",
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--stdin",
+        action="store_true",
+        help="Stream paths from stdin, one per line, and write one result per line",
+    )
+    parser.add_argument(
+        "--field",
+        help=(
+            "With --stdin: read JSON objects instead of bare paths and normalize this field "
+            "in place (dotted names reach nested objects, e.g. location.path)"
+        ),
+    )
+    args = parser.parse_args()
+    if args.stdin and args.path is not None:
+        parser.error("give either a path argument or --stdin, not both")
+    if not args.stdin and args.path is None:
+        parser.error("a path argument is required unless --stdin is given")
+    if args.field is not None and not args.stdin:
+        parser.error("--field requires --stdin")
+    return args
 
 
 def detect_kind(path_text: str) -> str:
@@ -70,12 +96,18 @@ def detect_kind(path_text: str) -> str:
     return "relative"
 
 
+@functools.lru_cache(maxsize=RESOLVE_CACHE_SIZE)
+def resolve_local(path_text: str) -> str:
+    """``realpath`` of a local path, cached because batches repeat the same files."""
+    return os.path.realpath(os.path.expanduser(path_text))
+
+
 def maybe_resolve(path_text: str, resolve: bool) -> str:
     if not resolve:
         return path_text
     if detect_kind(path_text) in {"windows_drive", "windows_unc"}:
         return path_text
-    return str(Path(path_text).expanduser().resolve())
+    return resolve_local(path_text)
 
 
 def windows_to_wsl(path_text: str) -> str:
@@ -86,7 +118,7 @@ def windows_to_wsl(path_text: str) -> str:
 
     drive_match = WINDOWS_DRIVE_RE.match(path_text)
     if not drive_match:
-        fail(f"cannot convert non-Windows path to WSL format: {path_text}")
+        raise PathConversionError(f"cannot convert non-Windows path to WSL format: {path_text}")
 
     drive = drive_match.group("drive").lower()
     rest = drive_match.group("rest").replace("\\", "/").lstrip("/")
@@ -103,20 +135,19 @@ def wsl_to_windows(path_text: str, distro: str, windows_style: str) -> str:
         rest = path_text.lstrip("/").replace("/", "\\")
         output = f"\\\\wsl$\\{distro}\\{rest}" if rest else f"\\\\wsl$\\{distro}\\"
     else:
-        fail(f"cannot convert non-WSL path to Windows format: {path_text}")
+        raise PathConversionError(f"cannot convert non-WSL path to Windows format: {path_text}")
 
     if windows_style == "forward":
         return output.replace("\\", "/")
     return output
 
 
-def main() -> None:
-    args = parse_args()
-    original = args.path
-    normalized_input = maybe_resolve(original, args.resolve)
+def normalize_path(original: str, to: str, distro: str, windows_style: str, resolve: bool) -> dict[str, str]:
+    """Convert one path and return the structured ``--json`` payload for it."""
+    normalized_input = maybe_resolve(original, resolve)
     source_kind = detect_kind(normalized_input)
 
-    target = args.to
+    target = to
     if target == "auto":
         if source_kind in {"windows_drive", "windows_unc"}:
             target = "wsl"
@@ -131,11 +162,11 @@ def main() -> None:
         elif source_kind in {"wsl_mount", "posix"}:
             converted = normalized_input
         else:
-            converted = str(Path(normalized_input).expanduser().resolve())
+            converted = resolve_local(normalized_input)
     elif target == "windows":
         if source_kind in {"windows_drive", "windows_unc"}:
             converted = normalized_input
-            if args.windows_style == "forward":
+            if windows_style == "forward":
                 converted = converted.replace("\\", "/")
             else:
                 converted = converted.replace("/", "\\")
@@ -143,23 +174,99 @@ def main() -> None:
             absolute_posix = (
                 normalized_input
                 if source_kind in {"wsl_mount", "posix"}
-                else str(Path(normalized_input).expanduser().resolve())
+                else resolve_local(normalized_input)
             )
-            converted = wsl_to_windows(absolute_posix, args.distro, args.windows_style)
+            converted = wsl_to_windows(absolute_posix, distro, windows_style)
     else:
-        fail(f"unsupported target format: {target}")
+        raise PathConversionError(f"unsupported target format: {target}")
+
+    return {
+        "input": original,
+        "normalized_input": normalized_input,
+        "source_kind": source_kind,
+        "target": target,
+        "output": converted,
+    }
+
+
+def get_field(record: dict[str, Any], field: list[str]) -> tuple[dict[str, Any], str]:
+    """Return the object holding the dotted ``field`` and its last key."""
+    holder: Any = record
+    for key in field[:-1]:
+        holder = holder.get(key) if isinstance(holder, dict) else None
+    if not isinstance(holder, dict) or not isinstance(holder.get(field[-1]), str):
+        raise PathConversionError(f"record has no string field '{'.'.join(field)}'")
+    return holder, field[-1]
+
+
+def stream_normalize(
+    lines: Iterable[str],
+    convert: Callable[[str], dict[str, str]],
+    as_json: bool,
+    field: str | None,
+    errors: list[str],
+) -> Iterator[str]:
+    """Yield one output line per input line, so output stays line-aligned with input.
+
+    Blank lines are echoed. A line that cannot be converted is passed through
+    unchanged, and its error is printed to stderr and appended to ``errors``.
+    """
+    field_path = field.split(".") if field else None
+    for line_no, line in enumerate(lines, start=1):
+        text = line.rstrip("\r\n")
+        if not text.strip():
+            yield text + "\n"
+            continue
+        try:
+            if field_path is None:
+                result = convert(text)
+                yield (json.dumps(result, sort_keys=True) if as_json else result["output"]) + "\n"
+                continue
+            try:
+                record = json.loads(text)
+            except json.JSONDecodeError as exc:
+                raise PathConversionError(f"invalid JSON record: {exc}") from exc
+            holder, key = get_field(record, field_path)
+            result = convert(holder[key])
+            holder[key] = result["output"]
+            yield json.dumps(record, ensure_ascii=False) + "\n"
+        except PathConversionError as exc:
+            errors.append(f"line {line_no}: {exc}")
+            print(f"ERROR: {errors[-1]}", file=sys.stderr)
+            yield text + "\n"
+
+
+def main() -> None:
+    args = parse_args()
+
+    if args.stdin:
+        # Conversion is deterministic for a given input within one process,
+        # so repeated paths (the common case in a findings bundle) are free.
+        convert = functools.lru_cache(maxsize=RESOLVE_CACHE_SIZE)(
+            functools.partial(
+                normalize_path,
+                to=args.to,
+                distro=args.distro,
+                windows_style=args.windows_style,
+                resolve=args.resolve,
+            )
+        )
+        errors: list[str] = []
+        sys.stdout.writelines(stream_normalize(sys.stdin, convert, args.json, args.field, errors))
+        sys.stdout.flush()
+        if errors:
+            raise SystemExit(1)
+        return
+
+    try:
+        payload = normalize_path(args.path, args.to, args.distro, args.windows_style, args.resolve)
+    except PathConversionError as exc:
+        fail(str(exc))
 
     if args.json:
-        payload = {
-            "input": original,
-            "normalized_input": normalized_input,
-            "source_kind": source_kind,
-            "target": target,
-            "output": converted,
-        }
         print(json.dumps(payload, indent=2, sort_keys=True))
     else:
-        print(converted)
+        print(payload["output"])
 
 
 if __name__ == "__main__":
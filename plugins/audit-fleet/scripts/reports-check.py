@@ -4,13 +4,14 @@
 from __future__ import annotations
 
 import argparse
-import hashlib
 import json
 import re
 import sys
 from pathlib import Path
 from typing import Any
 
+from section_index import SectionIndex, section_titles
+
 REQUIRED_REPORT_FILES = [
     "00-executive-summary.md",
     "01-solution-auditor.md",
@@ -63,23 +64,10 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
-def sha256_text(text: str) -> str:
-    return hashlib.sha256(text.encode("utf-8")).hexdigest()
-
-
 def normalize_heading(value: str) -> str:
     return re.sub(r"\s+", " ", value.strip().lower())
 
 
-def extract_level2_sections(lines: list[str]) -> list[str]:
-    sections: list[str] = []
-    for line in lines:
-        match = re.match(r"^##\s+(.+?)\s*$", line)
-        if match:
-            sections.append(match.group(1).strip())
-    return sections
-
-
 def write_json(path: Path, payload: Any) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     try:
@@ -120,6 +108,7 @@ def main() -> None:
             warnings.append(message)
 
     expected_section_norm = [normalize_heading(name) for name in REQUIRED_SECTIONS]
+    index = SectionIndex(reports_dir)
 
     for report_name in REQUIRED_REPORT_FILES:
         report_path = reports_dir / report_name
@@ -133,14 +122,13 @@ def main() -> None:
             continue
 
         try:
-            text = report_path.read_text(encoding="utf-8")
+            entry = index.get(report_name)
         except OSError as exc:
             errors.append(f"{report_name}: cannot read file: {exc}")
             checks.append(item)
             continue
 
-        lines = text.splitlines()
-        sections = extract_level2_sections(lines)
+        sections = section_titles(entry)
         sections_norm = [normalize_heading(section) for section in sections]
 
         missing_sections = [
@@ -165,8 +153,8 @@ def main() -> None:
 
         item.update(
             {
-                "size_bytes": len(text.encode("utf-8")),
-                "sha256": sha256_text(text),
+                "size_bytes": entry["size_bytes"],
+                "sha256": entry["sha256"],
                 "sections": sections,
                 "missing_sections": missing_sections,
                 "section_order_ok": order_ok,
@@ -174,6 +162,8 @@ def main() -> None:
         )
         checks.append(item)
 
+    index.save()
+
     ok = not errors and (args.mode == "balanced" or not warnings)
     result = {
         "ok": ok,
@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""Compile the audit-fleet JSON Schemas into plain Python validators.
+
+Each schema becomes one generated function with every check inlined, so a
+report is validated in a single walk with no per-keyword dispatch. Only the
+keywords the bundled schemas use are supported; anything else is rejected
+at compile time rather than silently ignored. The generated source is only
+ever held in memory: it is rebuilt from the schemas on every run (a few
+milliseconds) and never read back from disk before being executed.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from pathlib import Path
+from typing import Any, Callable
+
+# Friendlier messages for patterns that encode a plain-language rule.
+PATTERN_MESSAGES = {r"\S": ": must not be blank"}
+
+Validator = Callable[[Any, str, list[str], list[str]], None]
+
+SUPPORTED_KEYWORDS = {
+    "$schema",
+    "$id",
+    "$ref",
+    "title",
+    "description",
+    "type",
+    "const",
+    "enum",
+    "pattern",
+    "format",
+    "minLength",
+    "minimum",
+    "minItems",
+    "maxItems",
+    "uniqueItems",
+    "items",
+    "required",
+    "properties",
+    "additionalProperties",
+}
+
+TYPE_CHECKS = {
+    "object": ("isinstance({v}, dict)", "an object"),
+    "array": ("isinstance({v}, list)", "an array"),
+    "string": ("isinstance({v}, str)", "a string"),
+    "integer": ("(isinstance({v}, int) and not isinstance({v}, bool))", "an integer"),
+    "number": ("(isinstance({v}, (int, float)) and not isinstance({v}, bool))", "a number"),
+    "boolean": ("isinstance({v}, bool)", "a boolean"),
+    "null": ("{v} is None", "null"),
+}
+
+PRELUDE = '''import json
+import re
+
+DATE_TIME = re.compile(r"^\\d{4}-\\d{2}-\\d{2}[Tt ]\\d{2}:\\d{2}:\\d{2}(\\.\\d+)?([Zz]|[+-]\\d{2}:\\d{2})$")
+
+
+def has_duplicates(items):
+    try:
+        return len(set(items)) != len(items)
+    except TypeError:
+        keys = [json.dumps(item, sort_keys=True) for item in items]
+        return len(set(keys)) != len(keys)
+'''
+
+
+class SchemaCompileError(ValueError):
+    """Raised when a schema uses a keyword or value the compiler cannot handle."""
+
+
+def load_schema_closure(paths: dict[str, Path]) -> dict[Path, dict[str, Any]]:
+    """Load the named schemas plus every sibling schema they ``$ref``, transitively."""
+    loaded: dict[Path, dict[str, Any]] = {}
+    queue = [path.resolve() for path in paths.values()]
+    while queue:
+        path = queue.pop()
+        if path in loaded:
+            continue
+        try:
+            schema = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as exc:
+            raise SchemaCompileError(f"cannot load schema {path}: {exc}") from exc
+        if not isinstance(schema, dict):
+            raise SchemaCompileError(f"schema {path} must be a JSON object")
+        loaded[path] = schema
+        queue.extend(path.parent / ref for ref in iter_refs(schema))
+    return loaded
+
+
+def iter_refs(node: Any) -> list[str]:
+    refs: list[str] = []
+    if isinstance(node, dict):
+        ref = node.get("$ref")
+        if isinstance(ref, str):
+            refs.append(ref)
+        for value in node.values():
+            refs.extend(iter_refs(value))
+    elif isinstance(node, list):
+        for value in node:
+            refs.extend(iter_refs(value))
+    return refs
+
+
+def function_name(path: Path) -> str:
+    stem = path.name.split(".")[0]
+    return "validate_" + re.sub(r"[^0-9A-Za-z_]", "_", stem)
+
+
+class Emitter:
+    """Generate one ``validate_<schema>(value, path, errors, soft)`` per schema file.
+
+    ``path`` is only concatenated on the error branches, so valid payloads
+    never pay for building location strings. ``additionalProperties``
+    violations go to ``soft`` so callers can downgrade them in balanced mode.
+    """
+
+    def __init__(self, closure: dict[Path, dict[str, Any]]) -> None:
+        self.closure = closure
+        self.constants: list[str] = []
+        self.lines: list[str] = []
+        self.counter = 0
+
+    def fresh(self, prefix: str) -> str:
+        self.counter += 1
+        return f"{prefix}{self.counter}"
+
+    def constant(self, prefix: str, expression: str) -> str:
+        name = self.fresh(prefix.upper())
+        self.constants.append(f"{name} = {expression}")
+        return name
+
+    def emit(self, depth: int, line: str) -> None:
+        self.lines.append("    " * depth + line)
+
+    def fail(self, depth: int, path: str, message: str, target: str = "errors") -> None:
+        self.emit(depth, f"{target}.append({path} + {message!r})")
+
+    def compile_file(self, path: Path) -> None:
+        self.emit(0, f"def {function_name(path)}(value, path, errors, soft):")
+        start = len(self.lines)
+        self.node(self.closure[path], path, "value", "path", 1)
+        if len(self.lines) == start:
+            self.emit(1, "pass")
+        self.emit(0, "")
+        self.emit(0, "")
+
+    def node(self, schema: Any, origin: Path, v: str, p: str, depth: int) -> None:
+        if not isinstance(schema, dict):
+            raise SchemaCompileError(f"{origin.name}: subschema must be an object, found {schema!r}")
+        unsupported = sorted(set(schema) - SUPPORTED_KEYWORDS)
+        if unsupported:
+            raise SchemaCompileError(f"{origin.name}: unsupported keywords: {', '.join(unsupported)}")
+        if schema.get("additionalProperties", False) is not False:
+            raise SchemaCompileError(f"{origin.name}: only 'additionalProperties: false' is supported")
+
+        ref = schema.get("$ref")
+        if ref is not None:
+            target = (origin.parent / ref).resolve()
+            self.emit(depth, f"{function_name(target)}({v}, {p}, errors, soft)")
+            return
+
+        types = schema.get("type")
+        if isinstance(types, str):
+            types = [types]
+        if types is not None:
+            unknown = [name for name in types if name not in TYPE_CHECKS]
+            if unknown:
+                raise SchemaCompileError(f"{origin.name}: unsupported types: {', '.join(unknown)}")
+            checks = " or ".join(TYPE_CHECKS[name][0].format(v=v) for name in types)
+            expected = " or ".join(TYPE_CHECKS[name][1] for name in types)
+            self.emit(depth, f"if not ({checks}):")
+            self.fail(depth + 1, p, f": must be {expected}")
+            self.emit(depth, "else:")
+            body_start = len(self.lines)
+            self.keywords(schema, origin, v, p, depth + 1, set(types))
+            if len(self.lines) == body_start:
+                self.emit(depth + 1, "pass")
+        else:
+            self.keywords(schema, origin, v, p, depth, set(TYPE_CHECKS))
+
+    def guarded(self, kinds: set[str], kind: str, v: str, depth: int) -> int:
+        """Open an ``isinstance`` guard when the value may not be of ``kind``."""
+        if kinds == {kind} or (kind == "integer" and kinds <= {"integer"}):
+            return depth
+        check = TYPE_CHECKS["number" if kind == "integer" else kind][0].format(v=v)
+        self.emit(depth, f"if {check}:")
+        return depth + 1
+
+    def keywords(
+        self, schema: dict[str, Any], origin: Path, v: str, p: str, depth: int, kinds: set[str]
+    ) -> None:
+        if "const" in schema:
+            value = schema["const"]
+            self.emit(depth, f"if {v} != {value!r}:")
+            self.fail(depth + 1, p, f": must equal {json.dumps(value)}")
+
+        if "enum" in schema:
+            options = schema["enum"]
+            if not isinstance(options, list) or not options:
+                raise SchemaCompileError(f"{origin.name}: enum must be a non-empty array")
+            hashable = all(isinstance(item, (str, int, float, bool)) or item is None for item in options)
+            allowed = self.constant(
+                "enum", f"frozenset({options!r})" if hashable else repr(options)
+            )
+            self.emit(depth, f"if {v} not in {allowed}:")
+            listing = ", ".join(str(item) for item in options)
+            self.emit(
+                depth + 1,
+                f"errors.append({p} + ': invalid value ' + repr({v}) + {f'; allowed: {listing}'!r})",
+            )
+
+        if {"minLength", "pattern", "format"} & set(schema):
+            inner = self.guarded(kinds, "string", v, depth)
+            min_length = schema.get("minLength")
+            if min_length is not None:
+                self.emit(inner, f"if len({v}) < {int(min_length)}:")
+                message = (
+                    ": must be a non-empty string"
+                    if min_length == 1
+                    else f": must be at least {int(min_length)} characters"
+                )
+                self.fail(inner + 1, p, message)
+            pattern = schema.get("pattern")
+            if pattern is not None:
+                compiled = self.constant("pattern", f"re.compile({pattern!r})")
+                # elif: an empty string already failed minLength; one error is enough.
+                keyword = "elif" if min_length is not None else "if"
+                self.emit(inner, f"{keyword} not {compiled}.search({v}):")
+                self.fail(inner + 1, p, PATTERN_MESSAGES.get(pattern, f": does not match pattern {pattern}"))
+            fmt = schema.get("format")
+            if fmt is not None:
+                if fmt != "date-time":
+                    raise SchemaCompileError(f"{origin.name}: unsupported format '{fmt}'")
+                self.emit(inner, f"if not DATE_TIME.match({v}):")
+                self.fail(inner + 1, p, ": must be an RFC 3339 date-time")
+
+        if "minimum" in schema:
+            inner = self.guarded(kinds, "integer", v, depth)
+            minimum = schema["minimum"]
+            self.emit(inner, f"if {v} < {minimum!r}:")
+            self.fail(inner + 1, p, f": must be >= {minimum}")
+
+        if {"minItems", "maxItems", "uniqueItems", "items"} & set(schema):
+            inner = self.guarded(kinds, "array", v, depth)
+            if "minItems" in schema:
+                self.emit(inner, f"if len({v}) < {int(schema['minItems'])}:")
+                self.fail(inner + 1, p, f": must contain at least {int(schema['minItems'])} items")
+            if "maxItems" in schema:
+                self.emit(inner, f"if len({v}) > {int(schema['maxItems'])}:")
+                self.fail(inner + 1, p, f": must contain at most {int(schema['maxItems'])} items")
+            if schema.get("uniqueItems"):
+                self.emit(inner, f"if has_duplicates({v}):")
+                self.fail(inner + 1, p, ": items must be unique")
+            if "items" in schema:
+                index = self.fresh("i")
+                item = self.fresh("x")
+                self.emit(inner, f"for {index}, {item} in enumerate({v}):")
+                self.node(schema["items"], origin, item, f"{p} + '[' + str({index}) + ']'", inner + 1)
+
+        if {"required", "properties", "additionalProperties"} & set(schema):
+            inner = self.guarded(kinds, "object", v, depth)
+            for key in schema.get("required", []):
+                self.emit(inner, f"if {key!r} not in {v}:")
+                self.fail(inner + 1, p, f": missing required field '{key}'")
+            properties = schema.get("properties", {})
+            for key, subschema in properties.items():
+                child = self.fresh("x")
+                suffix = f".{key}" if re.fullmatch(r"[A-Za-z_][A-Za-z0-9_]*", key) else f"[{json.dumps(key)}]"
+                self.emit(inner, f"{child} = {v}.get({key!r}, MISSING)")
+                self.emit(inner, f"if {child} is not MISSING:")
+                self.node(subschema, origin, child, f"{p} + {suffix!r}", inner + 1)
+            if schema.get("additionalProperties") is False:
+                allowed = self.constant("keys", f"frozenset({sorted(properties)!r})")
+                extra = self.fresh("extra")
+                self.emit(inner, f"{extra} = {v}.keys() - {allowed}")
+                self.emit(inner, f"if {extra}:")
+                self.emit(
+                    inner + 1,
+                    f"soft.append({p} + ': unexpected keys: ' + ', '.join(sorted({extra})))",
+                )
+
+
+def generate_source(paths: dict[str, Path], closure: dict[Path, dict[str, Any]]) -> str:
+    emitter = Emitter(closure)
+    for path in sorted(closure):
+        emitter.compile_file(path)
+    exports = ", ".join(f"{name!r}: {function_name(paths[name].resolve())}" for name in sorted(paths))
+    return "\n".join(
+        [
+            PRELUDE,
+            "MISSING = object()",
+            *emitter.constants,
+            "",
+            "",
+            *emitter.lines,
+            f"VALIDATORS = {{{exports}}}",
+            "",
+        ]
+    )
+
+
+def validators_from_source(source: str) -> dict[str, Validator]:
+    namespace: dict[str, Any] = {}
+    exec(compile(source, "<audit-fleet-schema-validators>", "exec"), namespace)
+    return namespace["VALIDATORS"]
+
+
+def compile_validators(paths: dict[str, Path]) -> str:
+    """Return the generated validator source for the named schema files.
+
+    Raises ``SchemaCompileError`` if a schema cannot be loaded or compiled.
+    """
+    return generate_source(paths, load_schema_closure(paths))
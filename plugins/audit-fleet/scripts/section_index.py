@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""Single-pass markdown section index shared by the audit-fleet report scripts.
+
+Each report is tokenized once into its title, level-2 headings and the byte
+range of every section body. The index is persisted to a sidecar file in the
+reports directory and revalidated by size and mtime, so reports-check,
+schema-validate and json-mirror share one read of every report per run.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+from typing import Any
+
+from contract import REQUIRED_SECTION_ORDER, normalize_heading
+
+INDEX_VERSION = "1"
+SIDECAR_NAME = ".section-index.json"
+
+H1_PATTERN = re.compile(r"^#\s+(.+?)\s*$")
+H2_PATTERN = re.compile(r"^##\s+(.+?)\s*$")
+
+
+def normalize_newlines(data: bytes) -> tuple[bytes, bool]:
+    """Apply the same newline translation as ``Path.read_text``."""
+    if b"\r" not in data:
+        return data, False
+    return data.replace(b"\r\n", b"\n").replace(b"\r", b"\n"), True
+
+
+def index_bytes(data: bytes) -> dict[str, Any]:
+    """Tokenize one report and return its JSON-serializable index entry.
+
+    Offsets are byte offsets into the newline-normalized UTF-8 content, which
+    is the file itself unless ``newlines_normalized`` is set.
+    """
+    normalized, translated = normalize_newlines(data)
+    text = normalized.decode("utf-8")
+
+    title = ""
+    headings: list[dict[str, Any]] = []
+    offset = 0
+    for line, raw_line in zip(text.splitlines(), text.splitlines(keepends=True)):
+        line_start = offset
+        offset += len(raw_line.encode("utf-8"))
+        if not title:
+            h1 = H1_PATTERN.match(line)
+            if h1:
+                title = h1.group(1).strip()
+        h2 = H2_PATTERN.match(line)
+        if h2:
+            if headings:
+                headings[-1]["end"] = line_start
+            heading = h2.group(1).strip()
+            headings.append(
+                {
+                    "title": heading,
+                    "name": normalize_heading(heading),
+                    "start": line_start,
+                    "body_start": offset,
+                    "end": len(normalized),
+                }
+            )
+
+    return {
+        "sha256": hashlib.sha256(normalized).hexdigest(),
+        "size_bytes": len(normalized),
+        "newlines_normalized": translated,
+        "title": title,
+        "headings": headings,
+    }
+
+
+def section_titles(entry: dict[str, Any]) -> list[str]:
+    return [heading["title"] for heading in entry["headings"]]
+
+
+def read_sections(
+    path: Path, entry: dict[str, Any], wanted: list[str] | None = None
+) -> tuple[dict[str, str], list[str]]:
+    """Return ``{canonical name: body}`` and the order the wanted sections appear in.
+
+    Only the byte ranges of the wanted sections are read from disk. A section
+    that appears twice keeps its last body, matching the original parser.
+    """
+    expected_map = {normalize_heading(name): name for name in (wanted or REQUIRED_SECTION_ORDER)}
+    selected = [heading for heading in entry["headings"] if heading["name"] in expected_map]
+    sections: dict[str, str] = {}
+    order: list[str] = []
+    if not selected:
+        return sections, order
+
+    with path.open("rb") as handle:
+        data = None
+        if entry.get("newlines_normalized"):
+            data, _ = normalize_newlines(handle.read())
+        for heading in selected:
+            if data is None:
+                handle.seek(heading["body_start"])
+                chunk = handle.read(heading["end"] - heading["body_start"])
+            else:
+                chunk = data[heading["body_start"] : heading["end"]]
+            canonical = expected_map[heading["name"]]
+            sections[canonical] = "\n".join(chunk.decode("utf-8").splitlines()).strip()
+            order.append(canonical)
+    return sections, order
+
+
+class SectionIndex:
+    """Per-directory section index backed by a sidecar cache.
+
+    ``get`` returns the cached entry while the file's size and mtime match,
+    and re-indexes it otherwise. Call ``save`` once after the lookups; the
+    sidecar is best-effort and an unwritable directory only costs a re-read.
+    """
+
+    def __init__(self, reports_dir: Path, use_cache: bool = True) -> None:
+        self.reports_dir = reports_dir
+        self.sidecar = reports_dir / SIDECAR_NAME
+        self.entries: dict[str, dict[str, Any]] = {}
+        self.dirty = False
+        if use_cache:
+            self.entries = self._load()
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        try:
+            payload = json.loads(self.sidecar.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(payload, dict) or payload.get("index_version") != INDEX_VERSION:
+            return {}
+        entries = payload.get("files")
+        return entries if isinstance(entries, dict) else {}
+
+    def get(self, name: str) -> dict[str, Any]:
+        """Return the index entry for ``name``; raises ``OSError`` if it cannot be read."""
+        path = self.reports_dir / name
+        stat = path.stat()
+        entry = self.entries.get(name)
+        if (
+            isinstance(entry, dict)
+            and entry.get("mtime_ns") == stat.st_mtime_ns
+            and entry.get("file_size") == stat.st_size
+        ):
+            return entry
+
+        data = path.read_bytes()
+        entry = index_bytes(data)
+        entry["mtime_ns"] = stat.st_mtime_ns
+        entry["file_size"] = len(data)
+        self.entries[name] = entry
+        self.dirty = True
+        return entry
+
+    def save(self) -> None:
+        if not self.dirty:
+            return
+        payload = {"index_version": INDEX_VERSION, "files": self.entries}
+        tmp_path = self.sidecar.with_name(f"{self.sidecar.name}.tmp")
+        try:
+            tmp_path.write_text(json.dumps(payload, sort_keys=True) + "\n", encoding="utf-8")
+            os.replace(tmp_path, self.sidecar)
+        except OSError:
+            return
+        self.dirty = False
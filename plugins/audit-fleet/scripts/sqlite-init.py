@@ -7,58 +7,113 @@ import argparse
 import json
 import sqlite3
 import sys
-from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+
+from todo_seed import iter_seed_records, load_seed_records, seed_fleet
 
 ALLOWED_STATUSES = ("pending", "in_progress", "done", "blocked")
 
-REQUIRED_REPORT_FILES = [
-    "00-executive-summary.md",
-    "01-solution-auditor.md",
-    "02-coherence-analyzer.md",
-    "03-architect-review.md",
-    "04-security-auditor.md",
-    "05-test-engineer.md",
-    "06-devops.md",
-    "07-deployment-engineer.md",
-    "08-ux-reviewer.md",
-    "09-business-analyst.md",
-    "10-architect-roadmap.md",
-    "11-evolution-audit.md",
-    "12-documentation-auditor.md",
-    "13-cost-efficiency-auditor.md",
-]
+SCHEMA_VERSION = "2.1.0"
+DEFAULT_AUDIT_ID = "default"
 
 CREATE_TABLES_SQL = """
 PRAGMA foreign_keys = ON;
 
 CREATE TABLE IF NOT EXISTS todos (
-  id TEXT PRIMARY KEY,
+  audit_id TEXT NOT NULL DEFAULT 'default',
+  id TEXT NOT NULL,
   title TEXT NOT NULL,
   description TEXT NOT NULL DEFAULT '',
   status TEXT NOT NULL CHECK(status IN ('pending', 'in_progress', 'done', 'blocked')),
   created_at TEXT NOT NULL,
-  updated_at TEXT NOT NULL
+  updated_at TEXT NOT NULL,
+  PRIMARY KEY (audit_id, id)
 );
 
 CREATE TABLE IF NOT EXISTS todo_deps (
+  audit_id TEXT NOT NULL DEFAULT 'default',
   todo_id TEXT NOT NULL,
   depends_on TEXT NOT NULL,
   created_at TEXT NOT NULL,
-  PRIMARY KEY (todo_id, depends_on),
-  FOREIGN KEY (todo_id) REFERENCES todos(id) ON DELETE CASCADE,
-  FOREIGN KEY (depends_on) REFERENCES todos(id) ON DELETE CASCADE,
+  PRIMARY KEY (audit_id, todo_id, depends_on),
+  FOREIGN KEY (audit_id, todo_id) REFERENCES todos(audit_id, id) ON DELETE CASCADE,
+  FOREIGN KEY (audit_id, depends_on) REFERENCES todos(audit_id, id) ON DELETE CASCADE,
   CHECK (todo_id <> depends_on)
 );
 
-CREATE INDEX IF NOT EXISTS idx_todos_status ON todos(status);
-CREATE INDEX IF NOT EXISTS idx_todo_deps_depends_on ON todo_deps(depends_on);
+CREATE INDEX IF NOT EXISTS idx_todos_audit_status ON todos(audit_id, status);
+CREATE INDEX IF NOT EXISTS idx_todo_deps_audit_depends_on ON todo_deps(audit_id, depends_on);
+
+CREATE VIEW IF NOT EXISTS lane_status AS
+SELECT audit_id, substr(id, 6) AS lane, status, updated_at
+FROM todos
+WHERE id LIKE 'lane-%';
+
+-- Append-only status history. The triggers write each transition inside the
+-- statement that makes it, so every writer (set-status, next, seeding) is
+-- covered and no event can be committed without its status change.
+CREATE TABLE IF NOT EXISTS todo_events (
+  seq INTEGER PRIMARY KEY,
+  audit_id TEXT NOT NULL,
+  todo_id TEXT NOT NULL,
+  from_status TEXT CHECK(from_status IN ('pending', 'in_progress', 'done', 'blocked')),
+  to_status TEXT NOT NULL CHECK(to_status IN ('pending', 'in_progress', 'done', 'blocked')),
+  at TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_todo_events_audit_todo ON todo_events(audit_id, todo_id, seq);
+
+CREATE TRIGGER IF NOT EXISTS todo_events_insert AFTER INSERT ON todos
+BEGIN
+  INSERT INTO todo_events(audit_id, todo_id, from_status, to_status, at)
+  VALUES (NEW.audit_id, NEW.id, NULL, NEW.status, NEW.updated_at);
+END;
+
+CREATE TRIGGER IF NOT EXISTS todo_events_status AFTER UPDATE OF status ON todos
+WHEN OLD.status <> NEW.status
+BEGIN
+  INSERT INTO todo_events(audit_id, todo_id, from_status, to_status, at)
+  VALUES (NEW.audit_id, NEW.id, OLD.status, NEW.status, NEW.updated_at);
+END;
+
+CREATE TRIGGER IF NOT EXISTS todo_events_append_only BEFORE UPDATE ON todo_events
+BEGIN
+  SELECT RAISE(ABORT, 'todo_events is append-only');
+END;
+
+PRAGMA user_version = 3;
 """
 
+# 1.0.0 had one audit per file with global todo ids. Existing rows move to
+# the 'default' audit so single-audit callers keep working unchanged.
+MIGRATE_1_0_0_SQL = """
+PRAGMA foreign_keys = OFF;
+BEGIN;
+DROP VIEW IF EXISTS lane_status;
+DROP INDEX IF EXISTS idx_todos_status;
+DROP INDEX IF EXISTS idx_todo_deps_depends_on;
+ALTER TABLE todo_deps RENAME TO todo_deps_v1;
+ALTER TABLE todos RENAME TO todos_v1;
+{create_tables}
+INSERT INTO todos(audit_id, id, title, description, status, created_at, updated_at)
+SELECT 'default', id, title, description, status, created_at, updated_at FROM todos_v1;
+INSERT INTO todo_deps(audit_id, todo_id, depends_on, created_at)
+SELECT 'default', todo_id, depends_on, created_at FROM todo_deps_v1;
+DROP TABLE todo_deps_v1;
+DROP TABLE todos_v1;
+COMMIT;
+PRAGMA foreign_keys = ON;
+"""
 
-def utc_now() -> str:
-    return datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+# 2.0.0 had no status history. Each todo starts its log with its current
+# status at its last update, so open intervals are still measured.
+MIGRATE_2_0_0_SQL = """
+BEGIN;
+{create_tables}
+INSERT INTO todo_events(audit_id, todo_id, from_status, to_status, at)
+SELECT audit_id, id, NULL, status, updated_at FROM todos ORDER BY audit_id, id;
+COMMIT;
+"""
 
 
 def fail(message: str, code: int = 1) -> None:
@@ -68,7 +123,10 @@ def fail(message: str, code: int = 1) -> None:
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
-        description="Initialize audit-fleet SQLite DB with tables todos + todo_deps."
+        description=(
+            "Initialize audit-fleet SQLite DB with tables todos + todo_deps + todo_events, "
+            "migrating 1.0.0 and 2.0.0 databases in place."
+        )
     )
     parser.add_argument(
         "--db",
@@ -81,9 +139,17 @@ def parse_args() -> argparse.Namespace:
         default="keep",
         help="Behavior when schema already exists (default: keep)",
     )
+    parser.add_argument(
+        "--audit-id",
+        default=DEFAULT_AUDIT_ID,
+        help=f"Audit run that seeded todos belong to (default: {DEFAULT_AUDIT_ID})",
+    )
     parser.add_argument(
         "--seed-json",
-        help="Optional JSON payload {'todos': [...], 'todo_deps': [...]} for seed data",
+        help=(
+            "Optional JSON payload {'todos': [...], 'todo_deps': [...]} for seed data, or a .jsonl "
+            "file streamed one todo or dependency per line. Existing todos are updated in place"
+        ),
     )
     parser.add_argument(
         "--seed-fleet",
@@ -110,172 +176,43 @@ def ensure_parent_dir(db_path: Path) -> None:
     db_path.parent.mkdir(parents=True, exist_ok=True)
 
 
-def init_schema(conn: sqlite3.Connection, if_exists: str) -> None:
-    schema_exists = table_exists(conn, "todos") or table_exists(conn, "todo_deps")
+def existing_schema_version(conn: sqlite3.Connection) -> str | None:
+    if not (table_exists(conn, "todos") or table_exists(conn, "todo_deps")):
+        return None
+    columns = {str(row[1]) for row in conn.execute("PRAGMA table_info(todos)")}
+    if "audit_id" not in columns:
+        return "1.0.0"
+    return SCHEMA_VERSION if table_exists(conn, "todo_events") else "2.0.0"
+
 
-    if schema_exists and if_exists == "fail":
+def init_schema(conn: sqlite3.Connection, if_exists: str) -> str | None:
+    """Create or upgrade the schema and return the version migrated from, if any."""
+    existing_version = existing_schema_version(conn)
+
+    if existing_version and if_exists == "fail":
         fail("schema already exists; use --if-exists keep or --if-exists reset")
 
-    if schema_exists and if_exists == "reset":
+    if existing_version and if_exists == "reset":
         conn.executescript(
             """
+            DROP VIEW IF EXISTS lane_status;
+            DROP TABLE IF EXISTS todo_events;
             DROP TABLE IF EXISTS todo_deps;
             DROP TABLE IF EXISTS todos;
             """
         )
+        existing_version = None
 
-    conn.executescript(CREATE_TABLES_SQL)
+    if existing_version == "1.0.0":
+        conn.executescript(MIGRATE_1_0_0_SQL.format(create_tables=CREATE_TABLES_SQL))
+        return existing_version
 
+    if existing_version == "2.0.0":
+        conn.executescript(MIGRATE_2_0_0_SQL.format(create_tables=CREATE_TABLES_SQL))
+        return existing_version
 
-def read_seed_payload(seed_path: Path) -> dict[str, Any]:
-    try:
-        raw = seed_path.read_text(encoding="utf-8")
-    except OSError as exc:
-        fail(f"cannot read seed file {seed_path}: {exc}")
-
-    try:
-        payload = json.loads(raw)
-    except json.JSONDecodeError as exc:
-        fail(f"invalid seed JSON in {seed_path}: {exc}")
-
-    if not isinstance(payload, dict):
-        fail("seed payload must be a JSON object")
-    return payload
-
-
-def seed_todos(conn: sqlite3.Connection, todos: Any) -> int:
-    if todos is None:
-        return 0
-    if not isinstance(todos, list):
-        fail("'todos' in seed payload must be a list")
-
-    inserted = 0
-    for item in todos:
-        if not isinstance(item, dict):
-            fail("each todo seed entry must be an object")
-
-        todo_id = item.get("id")
-        title = item.get("title")
-        description = item.get("description", "")
-        status = item.get("status", "pending")
-
-        if not isinstance(todo_id, str) or not todo_id.strip():
-            fail("seed todo entry requires non-empty string 'id'")
-        if not isinstance(title, str) or not title.strip():
-            fail(f"seed todo '{todo_id}' requires non-empty string 'title'")
-        if not isinstance(description, str):
-            fail(f"seed todo '{todo_id}' has non-string 'description'")
-        if status not in ALLOWED_STATUSES:
-            fail(
-                f"seed todo '{todo_id}' has invalid status '{status}'. "
-                f"Allowed: {', '.join(ALLOWED_STATUSES)}"
-            )
-
-        now = utc_now()
-        conn.execute(
-            """
-            INSERT INTO todos(id, title, description, status, created_at, updated_at)
-            VALUES(?, ?, ?, ?, ?, ?)
-            """,
-            (todo_id.strip(), title.strip(), description, status, now, now),
-        )
-        inserted += 1
-    return inserted
-
-
-def seed_todo_deps(conn: sqlite3.Connection, deps: Any) -> int:
-    if deps is None:
-        return 0
-    if not isinstance(deps, list):
-        fail("'todo_deps' in seed payload must be a list")
-
-    inserted = 0
-    for item in deps:
-        if not isinstance(item, dict):
-            fail("each todo_deps seed entry must be an object")
-
-        todo_id = item.get("todo_id")
-        depends_on = item.get("depends_on")
-        if not isinstance(todo_id, str) or not todo_id.strip():
-            fail("seed dependency requires non-empty string 'todo_id'")
-        if not isinstance(depends_on, str) or not depends_on.strip():
-            fail("seed dependency requires non-empty string 'depends_on'")
-        if todo_id.strip() == depends_on.strip():
-            fail("seed dependency cannot reference itself")
-
-        now = utc_now()
-        conn.execute(
-            """
-            INSERT INTO todo_deps(todo_id, depends_on, created_at)
-            VALUES(?, ?, ?)
-            """,
-            (todo_id.strip(), depends_on.strip(), now),
-        )
-        inserted += 1
-    return inserted
-
-
-def lane_todo_id(report_file: str) -> str:
-    return f"lane-{Path(report_file).stem}"
-
-
-def seed_fleet(conn: sqlite3.Connection, replace_seed: bool) -> dict[str, int]:
-    now = utc_now()
-    inserted_todos = 0
-    updated_todos = 0
-    inserted_deps = 0
-
-    for report_file in REQUIRED_REPORT_FILES:
-        lane_id = Path(report_file).stem
-        todo_id = lane_todo_id(report_file)
-        title = f"Audit lane {lane_id}"
-        description = f"Produce {report_file} aligned to the audit-fleet output contract"
-
-        existing = conn.execute("SELECT id FROM todos WHERE id = ?", (todo_id,)).fetchone()
-        if existing is None:
-            conn.execute(
-                """
-                INSERT INTO todos(id, title, description, status, created_at, updated_at)
-                VALUES(?, ?, ?, 'pending', ?, ?)
-                """,
-                (todo_id, title, description, now, now),
-            )
-            inserted_todos += 1
-        elif replace_seed:
-            conn.execute(
-                """
-                UPDATE todos
-                SET title = ?, description = ?, status = 'pending', updated_at = ?
-                WHERE id = ?
-                """,
-                (title, description, now, todo_id),
-            )
-            updated_todos += 1
-
-    consolidator = lane_todo_id("00-executive-summary.md")
-    for report_file in REQUIRED_REPORT_FILES:
-        if report_file.startswith("00-"):
-            continue
-        specialist = lane_todo_id(report_file)
-        existing_dep = conn.execute(
-            "SELECT 1 FROM todo_deps WHERE todo_id = ? AND depends_on = ?",
-            (consolidator, specialist),
-        ).fetchone()
-        if existing_dep is None:
-            conn.execute(
-                """
-                INSERT INTO todo_deps(todo_id, depends_on, created_at)
-                VALUES(?, ?, ?)
-                """,
-                (consolidator, specialist, now),
-            )
-            inserted_deps += 1
-
-    return {
-        "seeded_todos": inserted_todos,
-        "updated_todos": updated_todos,
-        "seeded_dependencies": inserted_deps,
-    }
+    conn.executescript(CREATE_TABLES_SQL)
+    return None
 
 
 def main() -> None:
@@ -285,25 +222,31 @@ def main() -> None:
 
     try:
         conn = sqlite3.connect(str(db_path))
+        # WAL is persistent; enabling it here means concurrent lane writers never race to switch modes.
+        conn.execute("PRAGMA journal_mode = WAL;")
     except sqlite3.Error as exc:
         fail(f"cannot open database '{db_path}': {exc}")
 
+    audit_id = args.audit_id.strip()
+    if not audit_id:
+        fail("--audit-id cannot be empty")
+
     todos_seeded = 0
     deps_seeded = 0
+    migrated_from: str | None = None
     fleet_result = {"seeded_todos": 0, "updated_todos": 0, "seeded_dependencies": 0}
 
     try:
         with conn:
             conn.execute("PRAGMA foreign_keys = ON;")
-            init_schema(conn, args.if_exists)
+            migrated_from = init_schema(conn, args.if_exists)
 
             if args.seed_json:
-                payload = read_seed_payload(Path(args.seed_json).expanduser())
-                todos_seeded = seed_todos(conn, payload.get("todos"))
-                deps_seeded = seed_todo_deps(conn, payload.get("todo_deps"))
+                records = iter_seed_records(Path(args.seed_json).expanduser())
+                todos_seeded, deps_seeded = load_seed_records(conn, audit_id, records)
 
             if args.seed_fleet:
-                fleet_result = seed_fleet(conn, args.replace_seed)
+                fleet_result = seed_fleet(conn, audit_id, args.replace_seed)
 
     except sqlite3.IntegrityError as exc:
         fail(f"seed data violates database constraints: {exc}")
@@ -315,7 +258,10 @@ def main() -> None:
     result = {
         "ok": True,
         "database": str(db_path),
-        "tables": ["todos", "todo_deps"],
+        "schema_version": SCHEMA_VERSION,
+        "migrated_from": migrated_from,
+        "audit_id": audit_id,
+        "tables": ["todos", "todo_deps", "todo_events"],
         "allowed_statuses": list(ALLOWED_STATUSES),
         "todos_seeded": todos_seeded,
         "todo_deps_seeded": deps_seeded,
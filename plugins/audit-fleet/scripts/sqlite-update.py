@@ -4,13 +4,23 @@
 from __future__ import annotations
 
 import argparse
+import contextlib
+import io
 import json
+import os
+import random
+import signal
+import socket
+import socketserver
 import sqlite3
 import sys
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from todo_seed import seed_fleet
+
 ALLOWED_STATUSES = ("pending", "in_progress", "done", "blocked")
 ALLOWED_TRANSITIONS: dict[str, set[str]] = {
     "pending": {"in_progress", "blocked"},
@@ -19,6 +29,17 @@ ALLOWED_TRANSITIONS: dict[str, set[str]] = {
     "done": {"pending"},
 }
 
+WRITE_COMMANDS = {"create-todo", "add-dependency", "set-status", "seed-fleet", "batch", "next"}
+BATCH_COMMANDS = ("create-todo", "add-dependency", "set-status", "seed-fleet")
+SCHEMA_VERSION = "2.1.0"
+SCHEMA_USER_VERSION = 3
+DEFAULT_AUDIT_ID = "default"
+DEFAULT_BUSY_TIMEOUT_MS = 5000
+DEFAULT_LOCK_RETRIES = 5
+RETRY_BASE_DELAY = 0.05
+RETRY_MAX_DELAY = 2.0
+EXPORT_FORMATS = ("json", "jsonl")
+
 REQUIRED_REPORT_FILES = [
     "00-executive-summary.md",
     "01-solution-auditor.md",
@@ -41,16 +62,16 @@ def utc_now() -> str:
     return datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
 
 
+def parse_timestamp(value: str) -> datetime:
+    return datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+
+
 def fail(message: str, code: int = 1) -> None:
     print(f"ERROR: {message}", file=sys.stderr)
     raise SystemExit(code)
 
 
-def lane_todo_id(report_file: str) -> str:
-    return f"lane-{Path(report_file).stem}"
-
-
-def parse_args() -> argparse.Namespace:
+def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Manage todos and lifecycle transitions for audit-fleet orchestration."
     )
@@ -59,6 +80,37 @@ def parse_args() -> argparse.Namespace:
         default=".audit-fleet/audit-fleet.sqlite3",
         help="SQLite database path (default: .audit-fleet/audit-fleet.sqlite3)",
     )
+    parser.add_argument(
+        "--socket",
+        default=os.environ.get("AUDIT_FLEET_SOCKET"),
+        help=(
+            "Unix socket of a running 'serve' daemon. Commands are forwarded to it and fall back "
+            "to direct mode when no daemon is listening (default: $AUDIT_FLEET_SOCKET)"
+        ),
+    )
+
+    parser.add_argument(
+        "--audit-id",
+        help=(
+            f"Audit run to operate on (default: {DEFAULT_AUDIT_ID}). "
+            "export-contract and metrics cover every audit unless this is given"
+        ),
+    )
+    parser.add_argument(
+        "--busy-timeout",
+        type=int,
+        default=DEFAULT_BUSY_TIMEOUT_MS,
+        help=f"Milliseconds SQLite waits on a locked database (default: {DEFAULT_BUSY_TIMEOUT_MS})",
+    )
+    parser.add_argument(
+        "--lock-retries",
+        type=int,
+        default=DEFAULT_LOCK_RETRIES,
+        help=(
+            "Extra attempts, with jittered exponential backoff, to start a transaction "
+            f"that is still locked after --busy-timeout (default: {DEFAULT_LOCK_RETRIES})"
+        ),
+    )
 
     subparsers = parser.add_subparsers(dest="command", required=True)
 
@@ -92,6 +144,22 @@ def parse_args() -> argparse.Namespace:
         "--output",
         help="Optional JSON output file. If omitted, prints to stdout only",
     )
+    barrier.add_argument(
+        "--watch",
+        action="store_true",
+        help="Block until ready_for_fan_in is true, re-evaluating only when the database changes",
+    )
+    barrier.add_argument(
+        "--timeout",
+        type=float,
+        help="With --watch: give up after this many seconds and exit 1 (default: wait forever)",
+    )
+    barrier.add_argument(
+        "--interval",
+        type=float,
+        default=0.25,
+        help="With --watch: seconds between PRAGMA data_version checks (default: 0.25)",
+    )
 
     export_contract = subparsers.add_parser("export-contract", help="Export sqlite-contract JSON")
     export_contract.add_argument(
@@ -99,6 +167,21 @@ def parse_args() -> argparse.Namespace:
         default=".audit-fleet/sqlite-contract.json",
         help="Output JSON path (default: .audit-fleet/sqlite-contract.json)",
     )
+    export_contract.add_argument(
+        "--format",
+        choices=EXPORT_FORMATS,
+        default="json",
+        help="json writes one contract document; jsonl writes a header line and one line per row (default: json)",
+    )
+    export_contract.add_argument(
+        "--compact",
+        action="store_true",
+        help="Write json without indentation (jsonl is always compact)",
+    )
+    export_contract.add_argument(
+        "--since",
+        help="Only export todos updated and dependencies created at or after this ISO 8601 timestamp",
+    )
 
     status = subparsers.add_parser("status", help="Generate deterministic orchestration status")
     status.add_argument(
@@ -128,19 +211,111 @@ def parse_args() -> argparse.Namespace:
         help="Deterministic status output path (default: .audit-fleet/status.json)",
     )
 
-    return parser.parse_args()
+    metrics = subparsers.add_parser(
+        "metrics",
+        help="Report per-lane queue/run/blocked time and fan-in latency from the todo_events log",
+    )
+    metrics.add_argument(
+        "--output",
+        help="Optional JSON output file. If omitted, prints to stdout only",
+    )
+
+    subparsers.add_parser(
+        "ready",
+        help="List pending todos whose dependencies are all done, plus the remaining critical path",
+    )
+
+    next_parser = subparsers.add_parser(
+        "next",
+        help="Atomically claim up to --slots ready todos by moving them to in_progress",
+    )
+    next_parser.add_argument(
+        "--slots",
+        type=int,
+        default=1,
+        help="Number of free worker slots to fill (default: 1)",
+    )
+
+    batch = subparsers.add_parser(
+        "batch",
+        help="Apply a JSON array of create-todo/add-dependency/set-status/seed-fleet operations in one transaction",
+    )
+    batch.add_argument(
+        "--file",
+        default="-",
+        help=(
+            "JSON file with the operations, '-' for stdin (default: -). Each operation is an argv "
+            'array or an object such as {"command": "set-status", "todo_id": "...", "to_status": "done"}'
+        ),
+    )
+
+    subparsers.add_parser(
+        "serve",
+        help=(
+            "Keep one connection open and execute newline-delimited JSON requests from --socket, "
+            "or from stdin when no socket is given"
+        ),
+    )
+
+    # Accept --audit-id after the subcommand too (e.g. export-contract --audit-id run-2).
+    # SUPPRESS keeps the global value unless the subcommand form is given.
+    for subparser in subparsers.choices.values():
+        subparser.add_argument(
+            "--audit-id",
+            default=argparse.SUPPRESS,
+            help="Same as the global --audit-id",
+        )
 
+    return parser
 
-def connect(db_path: Path) -> sqlite3.Connection:
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    return build_parser().parse_args(argv)
+
+
+def connect(db_path: Path, busy_timeout_ms: int = DEFAULT_BUSY_TIMEOUT_MS) -> sqlite3.Connection:
+    """Open the DB in WAL mode with explicit transaction control.
+
+    WAL lets readers proceed while a lane writes, and the busy timeout makes
+    concurrent writers queue inside SQLite instead of failing immediately.
+    """
     try:
-        conn = sqlite3.connect(str(db_path))
+        conn = sqlite3.connect(str(db_path), timeout=busy_timeout_ms / 1000, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute(f"PRAGMA busy_timeout = {int(busy_timeout_ms)};")
+        conn.execute("PRAGMA foreign_keys = ON;")
+        conn.execute("PRAGMA journal_mode = WAL;")
     except sqlite3.Error as exc:
         fail(f"cannot open database '{db_path}': {exc}")
-    conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA foreign_keys = ON;")
     return conn
 
 
+def is_lock_error(exc: sqlite3.Error) -> bool:
+    message = str(exc).lower()
+    return isinstance(exc, sqlite3.OperationalError) and ("locked" in message or "busy" in message)
+
+
+def begin_transaction(conn: sqlite3.Connection, immediate: bool, retries: int) -> None:
+    """Start a transaction, retrying lock contention with jittered exponential backoff.
+
+    Writers use ``BEGIN IMMEDIATE`` so the write lock is taken up front: once
+    it succeeds the handler cannot hit ``database is locked`` halfway through,
+    and only this statement ever needs to be retried.
+    """
+    statement = "BEGIN IMMEDIATE" if immediate else "BEGIN"
+    attempt = 0
+    while True:
+        try:
+            conn.execute(statement)
+            return
+        except sqlite3.OperationalError as exc:
+            if not is_lock_error(exc) or attempt >= retries:
+                raise
+        delay = min(RETRY_BASE_DELAY * (2**attempt), RETRY_MAX_DELAY)
+        time.sleep(delay * random.uniform(0.5, 1.0))
+        attempt += 1
+
+
 def ensure_schema(conn: sqlite3.Connection) -> None:
     rows = conn.execute(
         """
@@ -158,14 +333,30 @@ def ensure_schema(conn: sqlite3.Connection) -> None:
             + ", ".join(missing)
             + ". Run sqlite-init.py first."
         )
+    version = int(conn.execute("PRAGMA user_version").fetchone()[0])
+    if version < SCHEMA_USER_VERSION:
+        found = "1.0.0" if version < 2 else "2.0.0"
+        fail(
+            f"database uses the {found} schema; run sqlite-init.py to migrate it to {SCHEMA_VERSION}"
+        )
 
 
-def todo_exists(conn: sqlite3.Connection, todo_id: str) -> bool:
-    row = conn.execute("SELECT 1 FROM todos WHERE id = ?", (todo_id,)).fetchone()
+def audit_id_of(args: argparse.Namespace) -> str:
+    audit_id = (args.audit_id or DEFAULT_AUDIT_ID).strip()
+    if not audit_id:
+        fail("--audit-id cannot be empty")
+    return audit_id
+
+
+def todo_exists(conn: sqlite3.Connection, audit_id: str, todo_id: str) -> bool:
+    row = conn.execute(
+        "SELECT 1 FROM todos WHERE audit_id = ? AND id = ?", (audit_id, todo_id)
+    ).fetchone()
     return row is not None
 
 
 def handle_create_todo(conn: sqlite3.Connection, args: argparse.Namespace) -> dict[str, Any]:
+    audit_id = audit_id_of(args)
     todo_id = args.todo_id.strip()
     title = args.title.strip()
     if not todo_id:
@@ -174,7 +365,7 @@ def handle_create_todo(conn: sqlite3.Connection, args: argparse.Namespace) -> di
         fail("--title cannot be empty")
 
     now = utc_now()
-    existing = conn.execute("SELECT id FROM todos WHERE id = ?", (todo_id,)).fetchone()
+    existing = todo_exists(conn, audit_id, todo_id)
 
     if existing and not args.replace:
         fail(f"todo '{todo_id}' already exists; use --replace to overwrite")
@@ -184,18 +375,18 @@ def handle_create_todo(conn: sqlite3.Connection, args: argparse.Namespace) -> di
             """
             UPDATE todos
             SET title = ?, description = ?, status = ?, updated_at = ?
-            WHERE id = ?
+            WHERE audit_id = ? AND id = ?
             """,
-            (title, args.description, args.status, now, todo_id),
+            (title, args.description, args.status, now, audit_id, todo_id),
         )
         action = "updated"
     else:
         conn.execute(
             """
-            INSERT INTO todos(id, title, description, status, created_at, updated_at)
-            VALUES(?, ?, ?, ?, ?, ?)
+            INSERT INTO todos(audit_id, id, title, description, status, created_at, updated_at)
+            VALUES(?, ?, ?, ?, ?, ?, ?)
             """,
-            (todo_id, title, args.description, args.status, now, now),
+            (audit_id, todo_id, title, args.description, args.status, now, now),
         )
         action = "created"
 
@@ -208,26 +399,45 @@ def handle_create_todo(conn: sqlite3.Connection, args: argparse.Namespace) -> di
     }
 
 
+def depends_on_transitively(conn: sqlite3.Connection, audit_id: str, todo_id: str, target: str) -> bool:
+    row = conn.execute(
+        """
+        WITH RECURSIVE upstream(id) AS (
+            SELECT depends_on FROM todo_deps WHERE audit_id = ?1 AND todo_id = ?2
+            UNION
+            SELECT d.depends_on
+            FROM todo_deps d JOIN upstream u ON d.audit_id = ?1 AND d.todo_id = u.id
+        )
+        SELECT 1 FROM upstream WHERE id = ?3 LIMIT 1
+        """,
+        (audit_id, todo_id, target),
+    ).fetchone()
+    return row is not None
+
+
 def handle_add_dependency(conn: sqlite3.Connection, args: argparse.Namespace) -> dict[str, Any]:
+    audit_id = audit_id_of(args)
     todo_id = args.todo_id.strip()
     depends_on = args.depends_on.strip()
     if not todo_id or not depends_on:
         fail("--todo-id and --depends-on must be non-empty")
     if todo_id == depends_on:
         fail("dependency cannot reference the same todo")
-    if not todo_exists(conn, todo_id):
+    if not todo_exists(conn, audit_id, todo_id):
         fail(f"todo '{todo_id}' does not exist")
-    if not todo_exists(conn, depends_on):
+    if not todo_exists(conn, audit_id, depends_on):
         fail(f"dependency target '{depends_on}' does not exist")
+    if depends_on_transitively(conn, audit_id, depends_on, todo_id):
+        fail(f"cannot add dependency {todo_id} -> {depends_on}: it would create a cycle")
 
     now = utc_now()
     try:
         conn.execute(
             """
-            INSERT INTO todo_deps(todo_id, depends_on, created_at)
-            VALUES(?, ?, ?)
+            INSERT INTO todo_deps(audit_id, todo_id, depends_on, created_at)
+            VALUES(?, ?, ?, ?)
             """,
-            (todo_id, depends_on, now),
+            (audit_id, todo_id, depends_on, now),
         )
     except sqlite3.IntegrityError as exc:
         fail(f"cannot add dependency {todo_id} -> {depends_on}: {exc}")
@@ -241,9 +451,12 @@ def handle_add_dependency(conn: sqlite3.Connection, args: argparse.Namespace) ->
 
 
 def handle_set_status(conn: sqlite3.Connection, args: argparse.Namespace) -> dict[str, Any]:
+    audit_id = audit_id_of(args)
     todo_id = args.todo_id.strip()
     target = args.to_status
-    row = conn.execute("SELECT status FROM todos WHERE id = ?", (todo_id,)).fetchone()
+    row = conn.execute(
+        "SELECT status FROM todos WHERE audit_id = ? AND id = ?", (audit_id, todo_id)
+    ).fetchone()
     if row is None:
         fail(f"todo '{todo_id}' not found")
     current = row["status"]
@@ -272,9 +485,10 @@ def handle_set_status(conn: sqlite3.Connection, args: argparse.Namespace) -> dic
         )
 
     now = utc_now()
+    # The todo_events_status trigger logs the transition in this same statement.
     conn.execute(
-        "UPDATE todos SET status = ?, updated_at = ? WHERE id = ?",
-        (target, now, todo_id),
+        "UPDATE todos SET status = ?, updated_at = ? WHERE audit_id = ? AND id = ?",
+        (target, now, audit_id, todo_id),
     )
     return {
         "ok": True,
@@ -288,81 +502,35 @@ def handle_set_status(conn: sqlite3.Connection, args: argparse.Namespace) -> dic
     }
 
 
-def handle_seed_fleet(conn: sqlite3.Connection, replace: bool) -> dict[str, Any]:
-    now = utc_now()
-    inserted_todos = 0
-    updated_todos = 0
-    inserted_deps = 0
-
-    for report_file in REQUIRED_REPORT_FILES:
-        lane = Path(report_file).stem
-        todo_id = lane_todo_id(report_file)
-        title = f"Audit lane {lane}"
-        description = f"Produce {report_file} aligned to the audit-fleet output contract"
-
-        existing = conn.execute("SELECT id FROM todos WHERE id = ?", (todo_id,)).fetchone()
-        if existing is None:
-            conn.execute(
-                """
-                INSERT INTO todos(id, title, description, status, created_at, updated_at)
-                VALUES(?, ?, ?, 'pending', ?, ?)
-                """,
-                (todo_id, title, description, now, now),
-            )
-            inserted_todos += 1
-        elif replace:
-            conn.execute(
-                """
-                UPDATE todos
-                SET title = ?, description = ?, status = 'pending', updated_at = ?
-                WHERE id = ?
-                """,
-                (title, description, now, todo_id),
-            )
-            updated_todos += 1
-
-    consolidator = lane_todo_id("00-executive-summary.md")
-    for report_file in REQUIRED_REPORT_FILES:
-        if report_file.startswith("00-"):
-            continue
-        specialist = lane_todo_id(report_file)
-        row = conn.execute(
-            "SELECT 1 FROM todo_deps WHERE todo_id = ? AND depends_on = ?",
-            (consolidator, specialist),
-        ).fetchone()
-        if row is None:
-            conn.execute(
-                """
-                INSERT INTO todo_deps(todo_id, depends_on, created_at)
-                VALUES(?, ?, ?)
-                """,
-                (consolidator, specialist, now),
-            )
-            inserted_deps += 1
-
+def handle_seed_fleet(conn: sqlite3.Connection, audit_id: str, replace: bool) -> dict[str, Any]:
+    counts = seed_fleet(conn, audit_id, replace)
     return {
         "ok": True,
         "action": "fleet_seeded",
-        "seeded_todos": inserted_todos,
-        "updated_todos": updated_todos,
-        "seeded_dependencies": inserted_deps,
+        "audit_id": audit_id,
+        **counts,
     }
 
 
-def compute_barrier_snapshot(conn: sqlite3.Connection) -> dict[str, Any]:
+def compute_barrier_snapshot(conn: sqlite3.Connection, audit_id: str) -> dict[str, Any]:
     lane_ids = [Path(name).stem for name in REQUIRED_REPORT_FILES]
     specialist_ids = [lane for lane in lane_ids if not lane.startswith("00-")]
 
+    placeholders = ", ".join("?" for _ in lane_ids)
+    rows = conn.execute(
+        f"SELECT id, status FROM todos WHERE audit_id = ? AND id IN ({placeholders})",
+        [audit_id, *[f"lane-{lane}" for lane in lane_ids]],
+    ).fetchall()
+    found = {str(row["id"]): str(row["status"]) for row in rows}
+
     status_by_lane: dict[str, str] = {}
     missing_lanes: list[str] = []
-
     for lane in lane_ids:
-        todo_id = f"lane-{lane}"
-        row = conn.execute("SELECT status FROM todos WHERE id = ?", (todo_id,)).fetchone()
-        if row is None:
+        status = found.get(f"lane-{lane}")
+        if status is None:
             missing_lanes.append(lane)
         else:
-            status_by_lane[lane] = str(row["status"])
+            status_by_lane[lane] = status
 
     specialist_counts = {status: 0 for status in ALLOWED_STATUSES}
     specialist_missing = 0
@@ -378,6 +546,7 @@ def compute_barrier_snapshot(conn: sqlite3.Connection) -> dict[str, Any]:
     ready_for_fan_in = all_specialists_done and consolidator_status != "missing"
 
     return {
+        "audit_id": audit_id,
         "required_reports": REQUIRED_REPORT_FILES,
         "lanes": lane_ids,
         "status_by_lane": status_by_lane,
@@ -399,6 +568,252 @@ def compute_barrier_snapshot(conn: sqlite3.Connection) -> dict[str, Any]:
     }
 
 
+READY_TODOS_SQL = """
+WITH RECURSIVE waiting(id) AS (
+    SELECT d.todo_id
+    FROM todo_deps d
+    JOIN todos dep ON dep.audit_id = d.audit_id AND dep.id = d.depends_on
+    WHERE d.audit_id = :audit_id AND dep.status <> 'done'
+    UNION
+    SELECT d.todo_id
+    FROM waiting w
+    -- Without stats the planner prefers the covering primary key and scans
+    -- every edge of the audit per step; pin the reverse-edge index instead.
+    JOIN todo_deps d INDEXED BY idx_todo_deps_audit_depends_on
+      ON d.audit_id = :audit_id AND d.depends_on = w.id
+)
+SELECT id
+FROM todos
+WHERE audit_id = :audit_id AND status = 'pending' AND id NOT IN (SELECT id FROM waiting)
+ORDER BY id
+"""
+
+
+def analyze_remaining_work(conn: sqlite3.Connection, audit_id: str) -> dict[str, Any]:
+    """Topologically order the todos that are not done yet.
+
+    Returns each todo's height (length of the longest chain of remaining work
+    starting at it), the critical path through the remaining graph, and any
+    todos caught in a dependency cycle.
+    """
+    remaining = [
+        str(row["id"])
+        for row in conn.execute(
+            "SELECT id FROM todos WHERE audit_id = ? AND status <> 'done' ORDER BY id", (audit_id,)
+        )
+    ]
+    remaining_set = set(remaining)
+    successors: dict[str, list[str]] = {todo_id: [] for todo_id in remaining}
+    indegree = {todo_id: 0 for todo_id in remaining}
+    for row in conn.execute(
+        "SELECT todo_id, depends_on FROM todo_deps WHERE audit_id = ? ORDER BY todo_id, depends_on",
+        (audit_id,),
+    ):
+        todo_id, depends_on = str(row["todo_id"]), str(row["depends_on"])
+        if todo_id in remaining_set and depends_on in remaining_set:
+            successors[depends_on].append(todo_id)
+            indegree[todo_id] += 1
+
+    order = [todo_id for todo_id in remaining if indegree[todo_id] == 0]
+    for todo_id in order:
+        for successor in successors[todo_id]:
+            indegree[successor] -= 1
+            if indegree[successor] == 0:
+                order.append(successor)
+
+    cycle = sorted(todo_id for todo_id, degree in indegree.items() if degree > 0)
+    height: dict[str, int] = {}
+    for todo_id in reversed(order):
+        height[todo_id] = 1 + max((height.get(item, 0) for item in successors[todo_id]), default=0)
+
+    path: list[str] = []
+    if height:
+        current: str | None = max(sorted(height), key=lambda item: height[item])
+        while current is not None:
+            path.append(current)
+            candidates = [item for item in successors[current] if item in height]
+            current = max(sorted(candidates), key=lambda item: height[item]) if candidates else None
+
+    return {
+        "height": height,
+        "critical_path": {"length": len(path), "todos": path},
+        "cycle": cycle,
+    }
+
+
+def ready_todos(conn: sqlite3.Connection, audit_id: str, height: dict[str, int]) -> list[str]:
+    """Runnable todos, longest remaining chain first so the critical path starts early."""
+    ready = [str(row["id"]) for row in conn.execute(READY_TODOS_SQL, {"audit_id": audit_id})]
+    return sorted(ready, key=lambda todo_id: (-height.get(todo_id, 1), todo_id))
+
+
+def handle_ready(conn: sqlite3.Connection, audit_id: str) -> dict[str, Any]:
+    analysis = analyze_remaining_work(conn, audit_id)
+    ready = ready_todos(conn, audit_id, analysis["height"])
+    return {
+        "ok": True,
+        "action": "ready",
+        "audit_id": audit_id,
+        "ready": ready,
+        "ready_count": len(ready),
+        "critical_path": analysis["critical_path"],
+        "cycle_detected": bool(analysis["cycle"]),
+        "cycle_todos": analysis["cycle"],
+    }
+
+
+def handle_next(conn: sqlite3.Connection, audit_id: str, slots: int) -> dict[str, Any]:
+    if slots < 1:
+        fail("--slots must be at least 1")
+
+    # Runs under BEGIN IMMEDIATE, so concurrent claimers are serialized and
+    # never see the same pending todo.
+    analysis = analyze_remaining_work(conn, audit_id)
+    ready = ready_todos(conn, audit_id, analysis["height"])
+    claimed = ready[:slots]
+    now = utc_now()
+    conn.executemany(
+        """
+        UPDATE todos SET status = 'in_progress', updated_at = ?
+        WHERE audit_id = ? AND id = ? AND status = 'pending'
+        """,
+        [(now, audit_id, todo_id) for todo_id in claimed],
+    )
+    return {
+        "ok": True,
+        "action": "claimed",
+        "audit_id": audit_id,
+        "requested_slots": slots,
+        "claimed": claimed,
+        "claimed_count": len(claimed),
+        "remaining_ready": len(ready) - len(claimed),
+        "critical_path": analysis["critical_path"],
+        "cycle_detected": bool(analysis["cycle"]),
+        "updated_at": now,
+    }
+
+
+LANE_DURATIONS_SQL = """
+SELECT audit_id, todo_id, to_status,
+       SUM(MAX(0.0, (julianday(COALESCE(next_at, :now)) - julianday(at)) * 86400.0)) AS seconds
+FROM (
+    SELECT audit_id, todo_id, to_status, at,
+           LEAD(at) OVER (PARTITION BY audit_id, todo_id ORDER BY seq) AS next_at
+    FROM todo_events
+    WHERE todo_id IN ({lanes}) {audit_filter}
+)
+WHERE to_status <> 'done'
+GROUP BY audit_id, todo_id, to_status
+"""
+
+LANE_MILESTONES_SQL = """
+SELECT e.audit_id, e.todo_id, t.status,
+       MIN(CASE WHEN e.to_status = 'in_progress' THEN e.at END) AS first_started_at,
+       MAX(CASE WHEN e.to_status = 'in_progress' THEN e.at END) AS last_started_at,
+       MAX(CASE WHEN e.to_status = 'done' THEN e.at END) AS done_at
+FROM todo_events e
+JOIN todos t ON t.audit_id = e.audit_id AND t.id = e.todo_id
+WHERE e.todo_id IN ({lanes}) {audit_filter}
+GROUP BY e.audit_id, e.todo_id
+"""
+
+STATUS_METRICS = {"pending": "queue_seconds", "in_progress": "run_seconds", "blocked": "blocked_seconds"}
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Linearly interpolated percentile of a non-empty list."""
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100.0
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def summarize_seconds(values: list[float]) -> dict[str, Any]:
+    if not values:
+        return {"p50": None, "p95": None, "max": None}
+    return {
+        "p50": round(percentile(values, 50), 1),
+        "p95": round(percentile(values, 95), 1),
+        "max": round(max(values), 1),
+    }
+
+
+def seconds_between(start: str, end: str) -> float:
+    return (parse_timestamp(end) - parse_timestamp(start)).total_seconds()
+
+
+def handle_metrics(conn: sqlite3.Connection, audit_id: str | None, output: str | None) -> dict[str, Any]:
+    """Derive lane timings from the status event log.
+
+    Time spent in each status runs from its event to the next one, or to now
+    while the lane is still there, so a stuck lane shows up before it finishes.
+    Fan-in latency runs from the last specialist reaching ``done`` to the
+    consolidator reaching ``done``; end-to-end from the first lane start.
+    Both are only measured for audits whose whole fleet is done.
+    """
+    lane_ids = [Path(name).stem for name in REQUIRED_REPORT_FILES]
+    consolidator = "lane-00-executive-summary"
+    placeholders = ", ".join(f":lane{index}" for index in range(len(lane_ids)))
+    params: dict[str, Any] = {f"lane{index}": f"lane-{lane}" for index, lane in enumerate(lane_ids)}
+    params.update({"audit_id": audit_id, "now": utc_now()})
+    audit_filter = "AND audit_id = :audit_id" if audit_id is not None else ""
+    event_filter = "AND e.audit_id = :audit_id" if audit_id is not None else ""
+
+    durations: dict[tuple[str, str], dict[str, float]] = {}
+    for row in conn.execute(
+        LANE_DURATIONS_SQL.format(lanes=placeholders, audit_filter=audit_filter), params
+    ):
+        per_lane = durations.setdefault((str(row["audit_id"]), str(row["todo_id"])), {})
+        per_lane[STATUS_METRICS[str(row["to_status"])]] = float(row["seconds"])
+
+    lanes: dict[str, Any] = {}
+    for lane in lane_ids:
+        samples = [value for (_, todo_id), value in durations.items() if todo_id == f"lane-{lane}"]
+        lanes[lane] = {"audits": len(samples)}
+        for metric in STATUS_METRICS.values():
+            lanes[lane][metric] = summarize_seconds([sample.get(metric, 0.0) for sample in samples])
+
+    milestones: dict[str, dict[str, sqlite3.Row]] = {}
+    for row in conn.execute(
+        LANE_MILESTONES_SQL.format(lanes=placeholders, audit_filter=event_filter), params
+    ):
+        milestones.setdefault(str(row["audit_id"]), {})[str(row["todo_id"])] = row
+
+    latencies: list[float] = []
+    end_to_end: list[float] = []
+    for by_lane in milestones.values():
+        if len(by_lane) != len(lane_ids) or any(row["status"] != "done" for row in by_lane.values()):
+            continue
+        specialists = [row for todo_id, row in by_lane.items() if todo_id != consolidator]
+        barrier_at = max(str(row["done_at"]) for row in specialists)
+        done_at = str(by_lane[consolidator]["done_at"])
+        started = [str(row["first_started_at"]) for row in by_lane.values() if row["first_started_at"]]
+        latencies.append(max(0.0, seconds_between(barrier_at, done_at)))
+        if started:
+            end_to_end.append(seconds_between(min(started), done_at))
+
+    run_p50 = {lane: values["run_seconds"]["p50"] for lane, values in lanes.items()}
+    measured = [lane for lane, value in run_p50.items() if value is not None]
+    result = {
+        "ok": True,
+        "action": "metrics",
+        "audit_id": audit_id,
+        "generated_at": params["now"],
+        "audits": len({key[0] for key in durations}),
+        "lanes": lanes,
+        "slowest_lane": max(measured, key=lambda lane: (run_p50[lane], lane)) if measured else None,
+        "fan_in": {
+            "audits": len(latencies),
+            "latency_seconds": summarize_seconds(latencies),
+            "end_to_end_seconds": summarize_seconds(end_to_end),
+        },
+    }
+    if output:
+        write_json(Path(output).expanduser(), result)
+    return result
+
+
 def write_json(path: Path, payload: Any) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     try:
@@ -425,15 +840,57 @@ def load_optional_json(path: Path, label: str, warnings: list[str], errors: list
     return payload
 
 
-def handle_barrier_status(conn: sqlite3.Connection, output: str | None) -> dict[str, Any]:
-    snapshot = compute_barrier_snapshot(conn)
-    result = {
-        "ok": True,
-        "generated_at": utc_now(),
-        "barrier": snapshot,
-    }
-    if output:
-        write_json(Path(output).expanduser(), result)
+def data_version(conn: sqlite3.Connection) -> int:
+    return int(conn.execute("PRAGMA data_version").fetchone()[0])
+
+
+def watch_barrier(
+    conn: sqlite3.Connection, audit_id: str, timeout: float | None, interval: float
+) -> tuple[dict[str, Any], bool, float]:
+    """Wait for the fan-in barrier without re-running the query on every tick.
+
+    ``PRAGMA data_version`` changes only when another connection commits, so
+    the snapshot is recomputed once per external write rather than once per
+    poll. Must run outside a transaction, or the version never moves.
+    """
+    started = time.monotonic()
+    last_version: int | None = None
+    snapshot: dict[str, Any] = {}
+    while True:
+        version = data_version(conn)
+        if version != last_version:
+            last_version = version
+            snapshot = compute_barrier_snapshot(conn, audit_id)
+            if snapshot["ready_for_fan_in"]:
+                return snapshot, True, time.monotonic() - started
+        elapsed = time.monotonic() - started
+        if timeout is not None and elapsed >= timeout:
+            return snapshot, False, elapsed
+        time.sleep(max(interval, 0.01))
+
+
+def handle_barrier_status(conn: sqlite3.Connection, args: argparse.Namespace) -> dict[str, Any]:
+    audit_id = audit_id_of(args)
+    if args.watch:
+        snapshot, ready, waited = watch_barrier(conn, audit_id, args.timeout, args.interval)
+        result = {
+            "ok": ready,
+            "generated_at": utc_now(),
+            "barrier": snapshot,
+            "watch": {
+                "ready": ready,
+                "timed_out": not ready,
+                "waited_seconds": round(waited, 3),
+            },
+        }
+    else:
+        result = {
+            "ok": True,
+            "generated_at": utc_now(),
+            "barrier": compute_barrier_snapshot(conn, audit_id),
+        }
+    if args.output:
+        write_json(Path(args.output).expanduser(), result)
     return result
 
 
@@ -444,62 +901,222 @@ def serialize_transitions() -> list[dict[str, Any]]:
     ]
 
 
-def handle_export_contract(conn: sqlite3.Connection, output: str, db_path: Path) -> dict[str, Any]:
-    todos_rows = conn.execute(
-        """
-        SELECT id, title, description, status, created_at, updated_at
-        FROM todos
-        ORDER BY id
-        """
-    ).fetchall()
-    deps_rows = conn.execute(
-        """
-        SELECT todo_id, depends_on, created_at
-        FROM todo_deps
-        ORDER BY todo_id, depends_on
-        """
-    ).fetchall()
+def normalize_since(value: str) -> str:
+    """Return ``value`` as a UTC timestamp comparable with the stored ``...Z`` strings."""
+    try:
+        parsed = parse_timestamp(value)
+    except ValueError:
+        fail(f"invalid --since timestamp '{value}': expected ISO 8601, e.g. 2026-01-31T12:00:00Z")
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+
+
+class ContractWriter:
+    """Stream an export contract to disk one row at a time.
+
+    ``json`` output is identical to ``write_json`` of the whole contract, or
+    minified with ``compact``; ``jsonl`` writes a ``contract`` header record
+    followed by one ``todo``/``todo_dep`` record per row. Output is written
+    under a temporary name and renamed into place on close.
+    """
+
+    def __init__(self, path: Path, header: dict[str, Any], fmt: str, compact: bool) -> None:
+        self.path = path
+        self.tmp_path = path.with_name(f".{path.name}.tmp")
+        self.fmt = fmt
+        self.pretty = fmt == "json" and not compact
+        self.fields = 0
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.handle = self.tmp_path.open("w", encoding="utf-8")
+        if fmt == "jsonl":
+            self.handle.write(self.dumps({"record": "contract", **header}, 0) + "\n")
+            return
+        for key in sorted(header):
+            self.begin_field(key)
+            self.handle.write(self.dumps(header[key], 1))
+
+    def dumps(self, value: Any, depth: int) -> str:
+        if not self.pretty:
+            return json.dumps(value, separators=(",", ":"), sort_keys=True)
+        return json.dumps(value, indent=2, sort_keys=True).replace("\n", "\n" + "  " * depth)
+
+    def begin_field(self, key: str) -> None:
+        if self.pretty:
+            self.handle.write(",\n  " if self.fields else "{\n  ")
+            self.handle.write(f"{json.dumps(key)}: ")
+        else:
+            self.handle.write("," if self.fields else "{")
+            self.handle.write(f"{json.dumps(key)}:")
+        self.fields += 1
+
+    def write_rows(self, key: str, record: str, rows: Any) -> int:
+        """Write ``rows`` as the ``key`` array (json) or as ``record`` lines (jsonl)."""
+        count = 0
+        if self.fmt == "jsonl":
+            for row in rows:
+                self.handle.write(self.dumps({"record": record, **dict(row)}, 0) + "\n")
+                count += 1
+            return count
+
+        self.begin_field(key)
+        self.handle.write("[")
+        for row in rows:
+            if self.pretty:
+                self.handle.write(",\n    " if count else "\n    ")
+            elif count:
+                self.handle.write(",")
+            self.handle.write(self.dumps(dict(row), 2))
+            count += 1
+        if self.pretty and count:
+            self.handle.write("\n  ")
+        self.handle.write("]")
+        return count
+
+    def close(self) -> None:
+        if self.fmt == "json":
+            self.handle.write("\n}\n" if self.pretty else "}\n")
+        self.handle.close()
+        os.replace(self.tmp_path, self.path)
+
+    def abort(self) -> None:
+        self.handle.close()
+        self.tmp_path.unlink(missing_ok=True)
+
+
+def handle_export_contract(
+    conn: sqlite3.Connection,
+    output: str,
+    db_path: Path,
+    audit_id: str | None,
+    fmt: str = "json",
+    compact: bool = False,
+    since: str | None = None,
+) -> dict[str, Any]:
+    """Stream the contract straight from the table cursors.
+
+    With ``since``, only rows changed at or after that instant are exported,
+    and ``watermark`` in the result is the latest timestamp seen, to pass as
+    the next ``--since``. Boundary rows may repeat across runs; consumers
+    should upsert by key.
+    """
+    since_ts = normalize_since(since) if since else None
+    params = {"audit_id": audit_id, "since": since_ts}
+    todo_filters: list[str] = []
+    dep_filters: list[str] = []
+    if audit_id is not None:
+        todo_filters.append("audit_id = :audit_id")
+        dep_filters.append("audit_id = :audit_id")
+    if since_ts is not None:
+        todo_filters.append("updated_at >= :since")
+        dep_filters.append("created_at >= :since")
+    todo_where = f"WHERE {' AND '.join(todo_filters)}" if todo_filters else ""
+    dep_where = f"WHERE {' AND '.join(dep_filters)}" if dep_filters else ""
+
+    watermark = since_ts
+
+    def tracked(rows: sqlite3.Cursor, column: str) -> Any:
+        nonlocal watermark
+        for row in rows:
+            if watermark is None or row[column] > watermark:
+                watermark = row[column]
+            yield row
+
+    def todo_rows() -> Any:
+        return tracked(
+            conn.execute(
+                f"""
+                SELECT audit_id, id, title, description, status, created_at, updated_at
+                FROM todos
+                {todo_where}
+                ORDER BY audit_id, id
+                """,
+                params,
+            ),
+            "updated_at",
+        )
+
+    def dep_rows() -> Any:
+        return tracked(
+            conn.execute(
+                f"""
+                SELECT audit_id, todo_id, depends_on, created_at
+                FROM todo_deps
+                {dep_where}
+                ORDER BY audit_id, todo_id, depends_on
+                """,
+                params,
+            ),
+            "created_at",
+        )
 
-    contract = {
-        "schema_version": "1.0.0",
+    header = {
+        "schema_version": SCHEMA_VERSION,
         "database": str(db_path),
+        "audit_id": audit_id,
+        "since": since_ts,
         "generated_at": utc_now(),
         "lifecycle": {
             "statuses": list(ALLOWED_STATUSES),
             "transitions": serialize_transitions(),
         },
-        "todos": [dict(row) for row in todos_rows],
-        "todo_deps": [dict(row) for row in deps_rows],
     }
 
     output_path = Path(output).expanduser()
-    write_json(output_path, contract)
+    try:
+        writer = ContractWriter(output_path, header, fmt, compact)
+    except OSError as exc:
+        fail(f"cannot write contract file '{output_path}': {exc}")
+    try:
+        # json keys are sorted, so todo_deps precedes todos; jsonl emits todos
+        # first so a streaming consumer never sees an edge before its nodes.
+        if fmt == "json":
+            dependency_count = writer.write_rows("todo_deps", "todo_dep", dep_rows())
+            todo_count = writer.write_rows("todos", "todo", todo_rows())
+        else:
+            todo_count = writer.write_rows("todos", "todo", todo_rows())
+            dependency_count = writer.write_rows("todo_deps", "todo_dep", dep_rows())
+        writer.close()
+    except OSError as exc:
+        writer.abort()
+        fail(f"cannot write contract file '{output_path}': {exc}")
+    except BaseException:
+        writer.abort()
+        raise
 
     return {
         "ok": True,
         "action": "contract_exported",
+        "audit_id": audit_id,
+        "format": fmt,
+        "since": since_ts,
+        "watermark": watermark,
         "output": str(output_path),
-        "todo_count": len(contract["todos"]),
-        "dependency_count": len(contract["todo_deps"]),
+        "todo_count": todo_count,
+        "dependency_count": dependency_count,
     }
 
 
 def handle_status(conn: sqlite3.Connection, args: argparse.Namespace) -> dict[str, Any]:
     warnings: list[str] = []
     errors: list[str] = []
+    audit_id = audit_id_of(args)
 
     todo_counts = {status: 0 for status in ALLOWED_STATUSES}
     for row in conn.execute(
-        "SELECT status, COUNT(*) AS c FROM todos GROUP BY status ORDER BY status"
+        "SELECT status, COUNT(*) AS c FROM todos WHERE audit_id = ? GROUP BY status ORDER BY status",
+        (audit_id,),
     ).fetchall():
         status = str(row["status"])
         if status in todo_counts:
             todo_counts[status] = int(row["c"])
 
-    dep_count_row = conn.execute("SELECT COUNT(*) AS c FROM todo_deps").fetchone()
+    dep_count_row = conn.execute(
+        "SELECT COUNT(*) AS c FROM todo_deps WHERE audit_id = ?", (audit_id,)
+    ).fetchone()
     dep_count = int(dep_count_row["c"]) if dep_count_row else 0
 
-    barrier = compute_barrier_snapshot(conn)
+    barrier = compute_barrier_snapshot(conn, audit_id)
 
     reports_check_payload = load_optional_json(
         Path(args.reports_check).expanduser(), "reports-check", warnings, errors
@@ -545,6 +1162,7 @@ def handle_status(conn: sqlite3.Connection, args: argparse.Namespace) -> dict[st
         "mode": args.mode,
         "generated_at": utc_now(),
         "database": str(Path(args.db).expanduser()),
+        "audit_id": audit_id,
         "todo_counts": todo_counts,
         "dependency_count": dep_count,
         "barrier": barrier,
@@ -566,30 +1184,315 @@ def handle_status(conn: sqlite3.Connection, args: argparse.Namespace) -> dict[st
     return result
 
 
+def operation_argv(operation: Any, index: int) -> tuple[list[str], list[str]]:
+    """Translate one batch operation into ``(global options, command argv)``.
+
+    An object may carry ``audit_id`` to target another audit run than the
+    batch default; it becomes the global ``--audit-id`` option.
+    """
+    if isinstance(operation, list) and all(isinstance(item, str) for item in operation):
+        return [], list(operation)
+    if not isinstance(operation, dict) or not isinstance(operation.get("command"), str):
+        fail(f"batch operation {index} must be an argv array or an object with a 'command'")
+
+    global_argv: list[str] = []
+    argv = [operation["command"]]
+    for key, value in operation.items():
+        if key == "command":
+            continue
+        if key == "audit_id":
+            global_argv = ["--audit-id", str(value)]
+            continue
+        flag = "--" + key.replace("_", "-")
+        if isinstance(value, bool):
+            if value:
+                argv.append(flag)
+        elif isinstance(value, (str, int, float)):
+            argv.extend([flag, str(value)])
+        else:
+            fail(f"batch operation {index}: value for '{key}' must be a string, number or boolean")
+    return global_argv, argv
+
+
+def read_batch_payload(source: str) -> Any:
+    try:
+        if source == "-":
+            return json.load(sys.stdin)
+        return json.loads(Path(source).expanduser().read_text(encoding="utf-8"))
+    except OSError as exc:
+        fail(f"cannot read batch file '{source}': {exc}")
+    except json.JSONDecodeError as exc:
+        fail(f"invalid JSON in batch file '{source}': {exc}")
+
+
+def parse_batch_operations(payload: Any, args: argparse.Namespace) -> list[argparse.Namespace]:
+    """Validate every operation before the transaction starts."""
+    if not isinstance(payload, list):
+        fail("batch payload must be a JSON array of operations")
+
+    defaults = ["--db", args.db, "--audit-id", audit_id_of(args)]
+    operations: list[argparse.Namespace] = []
+    for index, operation in enumerate(payload):
+        global_argv, argv = operation_argv(operation, index)
+        if not argv or argv[0] not in BATCH_COMMANDS:
+            fail(f"batch operation {index}: command must be one of {', '.join(BATCH_COMMANDS)}")
+        operations.append(parse_args([*defaults, *global_argv, *argv]))
+    return operations
+
+
+def handle_batch(conn: sqlite3.Connection, args: argparse.Namespace) -> dict[str, Any]:
+    operations = getattr(args, "operations", None)
+    if operations is None:
+        operations = parse_batch_operations(read_batch_payload(args.file), args)
+
+    results: list[dict[str, Any]] = []
+    for index, operation in enumerate(operations):
+        try:
+            results.append(dispatch_command(conn, operation))
+        except SystemExit:
+            print(
+                f"ERROR: batch operation {index} ({operation.command}) failed; no operations were applied",
+                file=sys.stderr,
+            )
+            raise
+
+    return {
+        "ok": True,
+        "action": "batch_applied",
+        "operation_count": len(results),
+        "results": results,
+    }
+
+
+def dispatch_command(conn: sqlite3.Connection, args: argparse.Namespace) -> dict[str, Any]:
+    db_path = Path(args.db).expanduser()
+    if args.command == "create-todo":
+        return handle_create_todo(conn, args)
+    if args.command == "add-dependency":
+        return handle_add_dependency(conn, args)
+    if args.command == "set-status":
+        return handle_set_status(conn, args)
+    if args.command == "seed-fleet":
+        return handle_seed_fleet(conn, audit_id_of(args), args.replace)
+    if args.command == "barrier-status":
+        return handle_barrier_status(conn, args)
+    if args.command == "export-contract":
+        audit_filter = args.audit_id.strip() if args.audit_id else None
+        return handle_export_contract(
+            conn, args.output, db_path, audit_filter, args.format, args.compact, args.since
+        )
+    if args.command == "status":
+        return handle_status(conn, args)
+    if args.command == "metrics":
+        metrics_filter = args.audit_id.strip() if args.audit_id else None
+        return handle_metrics(conn, metrics_filter, args.output)
+    if args.command == "ready":
+        return handle_ready(conn, audit_id_of(args))
+    if args.command == "next":
+        return handle_next(conn, audit_id_of(args), args.slots)
+    if args.command == "batch":
+        return handle_batch(conn, args)
+    fail(f"unsupported command: {args.command}")
+    return {}
+
+
+def is_barrier_watch(args: argparse.Namespace) -> bool:
+    return args.command == "barrier-status" and bool(args.watch)
+
+
+def run_command(conn: sqlite3.Connection, args: argparse.Namespace) -> tuple[dict[str, Any], int]:
+    """Execute one parsed command in its own transaction and return ``(result, exit_code)``."""
+    if is_barrier_watch(args):
+        result = dispatch_command(conn, args)
+        return result, 0 if result["ok"] else 1
+
+    begin_transaction(conn, args.command in WRITE_COMMANDS, args.lock_retries)
+    try:
+        result = dispatch_command(conn, args)
+    except BaseException:
+        conn.rollback()
+        raise
+    conn.commit()
+
+    exit_code = 0
+    if args.command == "status" and args.mode == "strict":
+        status_failed = not bool(result.get("ok", False))
+        strict_warnings = bool(result.get("warnings"))
+        if status_failed or strict_warnings:
+            exit_code = 1
+    return result, exit_code
+
+
+def error_response(message: str, exit_code: int = 1) -> dict[str, Any]:
+    return {"ok": False, "exit_code": exit_code, "result": None, "stderr": f"ERROR: {message}\n"}
+
+
+def execute_request(conn: sqlite3.Connection, db_path: Path, request: Any) -> dict[str, Any]:
+    """Run one daemon request exactly as the CLI would and capture its outcome.
+
+    A request is ``{"argv": [...], "cwd": "..."}``. Relative paths in ``argv``
+    are resolved against ``cwd``; ``batch`` requests carry their payload in
+    ``operations``. Anything the command would have written to
+    stderr, including ``fail()`` messages and argparse usage errors, is
+    returned in ``stderr`` together with the exit code.
+    """
+    if not isinstance(request, dict) or not isinstance(request.get("argv"), list):
+        return error_response("request must be an object with an argv array", 2)
+
+    stderr = io.StringIO()
+    result: dict[str, Any] | None = None
+    exit_code = 0
+    daemon_cwd = os.getcwd()
+    try:
+        with contextlib.redirect_stderr(stderr):
+            os.chdir(request.get("cwd") or daemon_cwd)
+            args = parse_args([str(item) for item in request["argv"]])
+            if Path(args.db).expanduser().resolve() != db_path:
+                response = error_response(f"daemon serves '{db_path}', not '{args.db}'")
+                response["db_mismatch"] = True
+                return response
+            if args.command == "serve":
+                fail("serve cannot be forwarded to a running daemon")
+            if is_barrier_watch(args):
+                fail("barrier-status --watch would block the daemon; run it directly")
+            if args.command == "batch":
+                if "operations" not in request and args.file == "-":
+                    fail("batch requests must carry their operations inline")
+                payload = request["operations"] if "operations" in request else read_batch_payload(args.file)
+                args.operations = parse_batch_operations(payload, args)
+            result, exit_code = run_command(conn, args)
+    except SystemExit as exc:
+        exit_code = exc.code if isinstance(exc.code, int) else 1
+    except sqlite3.Error as exc:
+        stderr.write(f"ERROR: database operation failed: {exc}\n")
+        exit_code = 1
+    except (OSError, ValueError) as exc:
+        stderr.write(f"ERROR: {exc}\n")
+        exit_code = 1
+    finally:
+        os.chdir(daemon_cwd)
+
+    return {"ok": exit_code == 0, "exit_code": exit_code, "result": result, "stderr": stderr.getvalue()}
+
+
+def handle_request_line(conn: sqlite3.Connection, db_path: Path, line: str) -> str:
+    try:
+        request = json.loads(line)
+    except json.JSONDecodeError as exc:
+        response = error_response(f"invalid request JSON: {exc}", 2)
+    else:
+        response = execute_request(conn, db_path, request)
+    return json.dumps(response, sort_keys=True) + "\n"
+
+
+def serve(db_path: Path, socket_path: str | None, busy_timeout_ms: int) -> None:
+    conn = connect(db_path, busy_timeout_ms)
+    try:
+        ensure_schema(conn)
+        db_path = db_path.resolve()
+        if socket_path is None:
+            for line in sys.stdin:
+                if line.strip():
+                    sys.stdout.write(handle_request_line(conn, db_path, line))
+                    sys.stdout.flush()
+            return
+        serve_socket(conn, db_path, Path(socket_path).expanduser())
+    finally:
+        conn.close()
+
+
+def serve_socket(conn: sqlite3.Connection, db_path: Path, socket_path: Path) -> None:
+    if not hasattr(socket, "AF_UNIX"):
+        fail("unix sockets are not supported on this platform; use 'serve' without --socket")
+    if socket_path.exists():
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            try:
+                probe.connect(str(socket_path))
+            except OSError:
+                socket_path.unlink()
+            else:
+                fail(f"a daemon is already listening on {socket_path}")
+
+    class RequestHandler(socketserver.StreamRequestHandler):
+        def handle(self) -> None:
+            for raw in self.rfile:
+                line = raw.decode("utf-8")
+                if line.strip():
+                    self.wfile.write(handle_request_line(conn, db_path, line).encode("utf-8"))
+                    self.wfile.flush()
+
+    previous_umask = os.umask(0o177)
+    try:
+        server = socketserver.UnixStreamServer(str(socket_path), RequestHandler)
+    except OSError as exc:
+        fail(f"cannot listen on {socket_path}: {exc}")
+    finally:
+        os.umask(previous_umask)
+
+    ready = {"ok": True, "action": "serving", "database": str(db_path), "socket": str(socket_path)}
+    print(json.dumps(ready, sort_keys=True), flush=True)
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        with contextlib.suppress(OSError):
+            socket_path.unlink()
+
+
+def forward_to_daemon(socket_path: str, request: dict[str, Any]) -> dict[str, Any] | None:
+    """Send one request to a daemon; ``None`` means no daemon answered."""
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(socket_path)
+            client.sendall((json.dumps(request) + "\n").encode("utf-8"))
+            client.shutdown(socket.SHUT_WR)
+            with client.makefile("rb") as reader:
+                line = reader.readline()
+    except OSError:
+        return None
+    try:
+        response = json.loads(line)
+    except json.JSONDecodeError:
+        return None
+    return response if isinstance(response, dict) else None
+
+
 def main() -> None:
     args = parse_args()
     db_path = Path(args.db).expanduser()
-    conn = connect(db_path)
 
+    if args.command == "serve":
+        serve(db_path, args.socket, args.busy_timeout)
+        return
+
+    batch_payload = None
+    if args.command == "batch":
+        batch_payload = read_batch_payload(args.file)
+        args.operations = parse_batch_operations(batch_payload, args)
+
+    if args.socket and not is_barrier_watch(args):
+        request: dict[str, Any] = {"argv": sys.argv[1:], "cwd": os.getcwd()}
+        if batch_payload is not None:
+            request["operations"] = batch_payload
+        response = forward_to_daemon(args.socket, request)
+        if response is not None and not response.get("db_mismatch"):
+            if response.get("result") is not None:
+                print(json.dumps(response["result"], indent=2, sort_keys=True))
+            sys.stderr.write(str(response.get("stderr") or ""))
+            exit_code = int(response.get("exit_code") or 0)
+            if exit_code:
+                raise SystemExit(exit_code)
+            return
+
+    conn = connect(db_path, args.busy_timeout)
     try:
         ensure_schema(conn)
-        with conn:
-            if args.command == "create-todo":
-                result = handle_create_todo(conn, args)
-            elif args.command == "add-dependency":
-                result = handle_add_dependency(conn, args)
-            elif args.command == "set-status":
-                result = handle_set_status(conn, args)
-            elif args.command == "seed-fleet":
-                result = handle_seed_fleet(conn, args.replace)
-            elif args.command == "barrier-status":
-                result = handle_barrier_status(conn, args.output)
-            elif args.command == "export-contract":
-                result = handle_export_contract(conn, args.output, db_path)
-            elif args.command == "status":
-                result = handle_status(conn, args)
-            else:
-                fail(f"unsupported command: {args.command}")
+        result, exit_code = run_command(conn, args)
     except sqlite3.Error as exc:
         fail(f"database operation failed: {exc}")
     finally:
@@ -597,11 +1500,8 @@ def main() -> None:
 
     print(json.dumps(result, indent=2, sort_keys=True))
 
-    if args.command == "status" and args.mode == "strict":
-        status_failed = not bool(result.get("ok", False))
-        strict_warnings = bool(result.get("warnings"))
-        if status_failed or strict_warnings:
-            raise SystemExit(1)
+    if exit_code:
+        raise SystemExit(exit_code)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""Bulk todo/dependency loader shared by sqlite-init.py and sqlite-update.py."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from contract import REQUIRED_REPORT_FILES
+
+ALLOWED_STATUSES = ("pending", "in_progress", "done", "blocked")
+SEED_CHUNK_ROWS = 1000
+JSONL_SUFFIXES = {".jsonl", ".ndjson"}
+
+UPSERT_TODO_SQL = """
+INSERT INTO todos(audit_id, id, title, description, status, created_at, updated_at)
+VALUES(?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(audit_id, id) DO UPDATE SET
+  title = excluded.title,
+  description = excluded.description,
+  status = excluded.status,
+  updated_at = excluded.updated_at
+"""
+
+INSERT_TODO_IF_MISSING_SQL = """
+INSERT INTO todos(audit_id, id, title, description, status, created_at, updated_at)
+VALUES(?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(audit_id, id) DO NOTHING
+"""
+
+INSERT_DEP_SQL = """
+INSERT INTO todo_deps(audit_id, todo_id, depends_on, created_at)
+VALUES(?, ?, ?, ?)
+ON CONFLICT(audit_id, todo_id, depends_on) DO NOTHING
+"""
+
+TodoRow = tuple[str, str, str, str, str, str, str]
+DepRow = tuple[str, str, str, str]
+
+
+def utc_now() -> str:
+    return datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+
+
+def fail(message: str, code: int = 1) -> None:
+    print(f"ERROR: {message}", file=sys.stderr)
+    raise SystemExit(code)
+
+
+def lane_todo_id(report_file: str) -> str:
+    return f"lane-{Path(report_file).stem}"
+
+
+def todo_row(item: Any, audit_id: str, now: str) -> TodoRow:
+    if not isinstance(item, dict):
+        fail("each todo seed entry must be an object")
+
+    todo_id = item.get("id")
+    title = item.get("title")
+    description = item.get("description", "")
+    status = item.get("status", "pending")
+
+    if not isinstance(todo_id, str) or not todo_id.strip():
+        fail("seed todo entry requires non-empty string 'id'")
+    if not isinstance(title, str) or not title.strip():
+        fail(f"seed todo '{todo_id}' requires non-empty string 'title'")
+    if not isinstance(description, str):
+        fail(f"seed todo '{todo_id}' has non-string 'description'")
+    if status not in ALLOWED_STATUSES:
+        fail(
+            f"seed todo '{todo_id}' has invalid status '{status}'. "
+            f"Allowed: {', '.join(ALLOWED_STATUSES)}"
+        )
+    return (audit_id, todo_id.strip(), title.strip(), description, status, now, now)
+
+
+def dep_row(item: Any, audit_id: str, now: str) -> DepRow:
+    if not isinstance(item, dict):
+        fail("each todo_deps seed entry must be an object")
+
+    todo_id = item.get("todo_id")
+    depends_on = item.get("depends_on")
+    if not isinstance(todo_id, str) or not todo_id.strip():
+        fail("seed dependency requires non-empty string 'todo_id'")
+    if not isinstance(depends_on, str) or not depends_on.strip():
+        fail("seed dependency requires non-empty string 'depends_on'")
+    if todo_id.strip() == depends_on.strip():
+        fail("seed dependency cannot reference itself")
+    return (audit_id, todo_id.strip(), depends_on.strip(), now)
+
+
+def iter_jsonl_records(path: Path) -> Iterator[tuple[str, Any]]:
+    """Stream a JSONL seed file as ``("todo" | "todo_dep", object)`` records.
+
+    Lines with a ``depends_on`` key are dependencies; every other object is a
+    todo. Blank lines are skipped.
+    """
+    try:
+        with path.open("r", encoding="utf-8") as handle:
+            for line_no, line in enumerate(handle, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    item = json.loads(line)
+                except json.JSONDecodeError as exc:
+                    fail(f"invalid seed JSON in {path} line {line_no}: {exc}")
+                kind = "todo_dep" if isinstance(item, dict) and "depends_on" in item else "todo"
+                yield kind, item
+    except OSError as exc:
+        fail(f"cannot read seed file {path}: {exc}")
+
+
+def iter_json_records(path: Path) -> Iterator[tuple[str, Any]]:
+    try:
+        raw = path.read_text(encoding="utf-8")
+    except OSError as exc:
+        fail(f"cannot read seed file {path}: {exc}")
+
+    try:
+        payload = json.loads(raw)
+    except json.JSONDecodeError as exc:
+        fail(f"invalid seed JSON in {path}: {exc}")
+
+    if not isinstance(payload, dict):
+        fail("seed payload must be a JSON object")
+    todos = payload.get("todos")
+    deps = payload.get("todo_deps")
+    if todos is not None and not isinstance(todos, list):
+        fail("'todos' in seed payload must be a list")
+    if deps is not None and not isinstance(deps, list):
+        fail("'todo_deps' in seed payload must be a list")
+    for item in todos or []:
+        yield "todo", item
+    for item in deps or []:
+        yield "todo_dep", item
+
+
+def iter_seed_records(path: Path) -> Iterator[tuple[str, Any]]:
+    if path.suffix.lower() in JSONL_SUFFIXES:
+        return iter_jsonl_records(path)
+    return iter_json_records(path)
+
+
+def begin_bulk(conn: sqlite3.Connection) -> None:
+    """Make sure a transaction is open and defer foreign-key checks to commit.
+
+    Deferring lets a dependency arrive before the todo it references, which
+    a streamed file cannot rule out; violations still abort the commit.
+    """
+    if not conn.in_transaction:
+        conn.execute("BEGIN")
+    conn.execute("PRAGMA defer_foreign_keys = ON;")
+
+
+def load_seed_records(
+    conn: sqlite3.Connection, audit_id: str, records: Iterable[tuple[str, Any]]
+) -> tuple[int, int]:
+    """Upsert todos and insert dependencies in chunks of ``executemany`` calls.
+
+    Every record is validated before its chunk is written, and the audit's
+    dependency graph is checked for cycles once the load finishes. The
+    caller's transaction makes the load all-or-nothing. Returns ``(todos, deps)`` counts.
+    """
+    begin_bulk(conn)
+    now = utc_now()
+    todo_rows: list[TodoRow] = []
+    dep_rows: list[DepRow] = []
+    todos_loaded = 0
+    deps_loaded = 0
+
+    def flush() -> None:
+        nonlocal todos_loaded, deps_loaded
+        if todo_rows:
+            conn.executemany(UPSERT_TODO_SQL, todo_rows)
+            todos_loaded += len(todo_rows)
+            todo_rows.clear()
+        if dep_rows:
+            before = conn.total_changes
+            conn.executemany(INSERT_DEP_SQL, dep_rows)
+            deps_loaded += conn.total_changes - before
+            dep_rows.clear()
+
+    for kind, item in records:
+        if kind == "todo_dep":
+            dep_rows.append(dep_row(item, audit_id, now))
+        else:
+            todo_rows.append(todo_row(item, audit_id, now))
+        if len(todo_rows) + len(dep_rows) >= SEED_CHUNK_ROWS:
+            flush()
+    flush()
+    if deps_loaded:
+        cycle = dependency_cycle(conn, audit_id)
+        if cycle:
+            fail(f"seed dependencies form a cycle between todos: {', '.join(cycle)}")
+    return todos_loaded, deps_loaded
+
+
+def dependency_cycle(conn: sqlite3.Connection, audit_id: str) -> list[str]:
+    """Return the sorted ids of todos on a dependency cycle, or ``[]``.
+
+    Kahn's algorithm strips todos whose dependencies can all be ordered; a
+    reverse pass then strips those that merely depend on a cycle, leaving
+    the todos on one (or on a path between two).
+    """
+    depends: dict[str, set[str]] = {}
+    dependents: dict[str, set[str]] = {}
+    for todo_id, depends_on in conn.execute(
+        "SELECT todo_id, depends_on FROM todo_deps WHERE audit_id = ?", (audit_id,)
+    ):
+        depends.setdefault(todo_id, set()).add(depends_on)
+        dependents.setdefault(depends_on, set()).add(todo_id)
+
+    for forward, backward in ((depends, dependents), (dependents, depends)):
+        nodes = set(depends) | set(dependents)
+        degree = {node: len(forward.get(node, ())) for node in nodes}
+        queue = [node for node, count in degree.items() if count == 0]
+        for node in queue:
+            for other in backward.get(node, ()):
+                degree[other] -= 1
+                if degree[other] == 0:
+                    queue.append(other)
+        for node in queue:
+            for other in depends.pop(node, ()):
+                dependents[other].discard(node)
+            for other in dependents.pop(node, ()):
+                depends[other].discard(node)
+    return sorted(set(depends) | set(dependents))
+
+
+def seed_fleet(conn: sqlite3.Connection, audit_id: str, replace: bool) -> dict[str, int]:
+    """Seed the fixed lane todos and the consolidator fan-in dependencies in bulk."""
+    begin_bulk(conn)
+    now = utc_now()
+    lane_rows: list[TodoRow] = []
+    for report_file in REQUIRED_REPORT_FILES:
+        lane = Path(report_file).stem
+        lane_rows.append(
+            (
+                audit_id,
+                lane_todo_id(report_file),
+                f"Audit lane {lane}",
+                f"Produce {report_file} aligned to the audit-fleet output contract",
+                "pending",
+                now,
+                now,
+            )
+        )
+
+    placeholders = ", ".join("?" for _ in lane_rows)
+    existing = {
+        str(row[0])
+        for row in conn.execute(
+            f"SELECT id FROM todos WHERE audit_id = ? AND id IN ({placeholders})",
+            [audit_id, *[row[1] for row in lane_rows]],
+        )
+    }
+    conn.executemany(UPSERT_TODO_SQL if replace else INSERT_TODO_IF_MISSING_SQL, lane_rows)
+
+    consolidator = lane_todo_id("00-executive-summary.md")
+    dep_rows = [
+        (audit_id, consolidator, lane_todo_id(report_file), now)
+        for report_file in REQUIRED_REPORT_FILES
+        if not report_file.startswith("00-")
+    ]
+    before = conn.total_changes
+    conn.executemany(INSERT_DEP_SQL, dep_rows)
+    inserted_deps = conn.total_changes - before
+
+    return {
+        "seeded_todos": len(lane_rows) - len(existing),
+        "updated_todos": len(existing) if replace else 0,
+        "seeded_dependencies": inserted_deps,
+    }
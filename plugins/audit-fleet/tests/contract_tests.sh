@@ -0,0 +1,449 @@
+#!/usr/bin/env bash
+# contract_tests.sh — Contract tests for the audit-fleet scripts.
+#
+# Builds a fixture of the 14 fixed markdown reports, mirrors them with
+# json-mirror.py, then checks that schema-validate.py:
+#   1. accepts the clean mirror
+#   2. rejects whitespace-only finding fields and action-item entries
+#   3. reports a boolean finding_count once, as a type error
+# and that sqlite-update.py:
+#   4. accepts --audit-id after the subcommand (export-contract, metrics)
+# and that sqlite-init.py:
+#   5. rejects --seed-json dependencies that form a cycle, loading nothing
+# and that findings-index.py:
+#   6. adds, skips unchanged and replaces bundles, and queries them
+# and that findings-dedup.py:
+#   7. clusters known duplicates, keeps distinct findings apart and never chains
+# and that the sqlite-update.py scheduler:
+#   8. orders a diamond by critical path, claims at most --slots, reports cycles
+#   9. forwards commands to a serve daemon with the same output and exit code
+#      as a direct run, and runs directly when no daemon is listening
+#
+# Usage:
+#   bash tests/contract_tests.sh          # from plugin root
+#   bash tests/contract_tests.sh --verbose
+
+set -uo pipefail
+cd "$(dirname "$0")/.." || exit 1
+
+VERBOSE=false
+[[ "${1:-}" == "--verbose" ]] && VERBOSE=true
+
+PASS=0
+FAIL=0
+ERRORS=()
+
+_TMP_DIR=$(mktemp -d "${TMPDIR:-/tmp}/audit-fleet-contract.XXXXXX") || exit 1
+DAEMON_PID=""
+trap '[[ -n "$DAEMON_PID" ]] && kill "$DAEMON_PID" 2>/dev/null; rm -rf "$_TMP_DIR"' EXIT
+
+assert() {
+    local name="$1"
+    local cmd="$2"
+    local expect_exit="${3:-0}"
+
+    local actual_exit=0
+    eval "$cmd" > /dev/null 2>&1 || actual_exit=$?
+
+    if [[ $actual_exit -eq $expect_exit ]]; then
+        PASS=$((PASS + 1))
+        $VERBOSE && echo "PASS [$name]"
+    else
+        FAIL=$((FAIL + 1))
+        ERRORS+=("FAIL [$name]: expected exit=$expect_exit, got exit=$actual_exit  cmd: $cmd")
+    fi
+}
+
+assert_file_contains() {
+    local name="$1"
+    local file="$2"
+    local pattern="$3"
+
+    if grep -qF -- "$pattern" "$file" 2>/dev/null; then
+        PASS=$((PASS + 1))
+        $VERBOSE && echo "PASS [$name]"
+    else
+        FAIL=$((FAIL + 1))
+        ERRORS+=("FAIL [$name]: expected '$pattern' in $file")
+    fi
+}
+
+# assert_json NAME FILE EXPR — passes when Python EXPR over the JSON `d` is truthy
+assert_json() {
+    local name="$1"
+    local file="$2"
+    local expr="$3"
+
+    if python3 -c "import json, sys; d = json.load(open(sys.argv[1])); sys.exit(not ($expr))" "$file" 2>/dev/null; then
+        PASS=$((PASS + 1))
+        $VERBOSE && echo "PASS [$name]"
+    else
+        FAIL=$((FAIL + 1))
+        ERRORS+=("FAIL [$name]: expected $expr in $file")
+    fi
+}
+
+# ---------------------------------------------------------------------------
+# Fixture: 14 fixed reports mirrored to JSON
+# ---------------------------------------------------------------------------
+
+REPORTS_DIR="$_TMP_DIR/reports"
+OUT_DIR="$_TMP_DIR/out"
+
+python3 - "$REPORTS_DIR" <<'PYEOF'
+import json, sys
+from pathlib import Path
+
+sys.path.insert(0, "scripts")
+from contract import REQUIRED_REPORT_FILES
+
+reports_dir = Path(sys.argv[1])
+reports_dir.mkdir(parents=True)
+for number, name in enumerate(REQUIRED_REPORT_FILES):
+    finding = {
+        "finding_id": f"F-{number:02d}-1",
+        "severity": "warning",
+        "dimension": "security",
+        "evidence": f"src/app.py:{number + 1} token logged",
+        "impact": "Credential leak",
+        "recommendation": "Redact tokens",
+        "effort": "S",
+        "owner": "platform",
+        "dependencies": [],
+        "confidence": "high",
+        "acceptance_criteria": "No tokens in logs",
+    }
+    block = json.dumps({"findings": [finding]}, indent=2)
+    (reports_dir / name).write_text(
+        f"# {name}\n\n## Executive Summary\n\nSummary.\n\n## Findings\n\n```json\n{block}\n```\n\n"
+        "## Quick Wins\n\n- Redact tokens\n\n## High-Impact Expansions\n\n- Central secret store\n",
+        encoding="utf-8",
+    )
+PYEOF
+
+python3 scripts/json-mirror.py --reports-dir "$REPORTS_DIR" --out-dir "$OUT_DIR" --workers 1 > /dev/null
+
+validate() {
+    local json_dir="$1"
+    local output="$2"
+    python3 scripts/schema-validate.py \
+        --reports-dir "$REPORTS_DIR" \
+        --json-dir "$json_dir" \
+        --bundle "$OUT_DIR/audit-bundle.json" \
+        --output "$output" \
+        --mode strict \
+        --workers 1
+}
+
+# --- 1. Clean mirror validates ---
+assert "clean mirror passes strict validation" \
+    "validate '$OUT_DIR/reports-json' '$_TMP_DIR/clean.json'"
+
+# --- 2. Whitespace-only values are rejected ---
+BLANK_DIR="$_TMP_DIR/blank"
+cp -r "$OUT_DIR/reports-json" "$BLANK_DIR"
+python3 - "$BLANK_DIR/01-solution-auditor.json" <<'PYEOF'
+import json, sys
+path = sys.argv[1]
+report = json.load(open(path))
+report["findings"][0]["owner"] = "   "
+report["quick_wins"] = ["  "]
+json.dump(report, open(path, "w"), indent=2)
+PYEOF
+
+assert "whitespace-only values fail strict validation" \
+    "validate '$BLANK_DIR' '$_TMP_DIR/blank.json'" 1
+assert_file_contains "blank owner is reported" \
+    "$_TMP_DIR/blank.json" "findings[0].owner: must not be blank"
+assert_file_contains "blank quick_wins entry is reported" \
+    "$_TMP_DIR/blank.json" "quick_wins[0]: must not be blank"
+
+# --- 3. Boolean finding_count is a type error, not a count mismatch ---
+BOOL_DIR="$_TMP_DIR/bool"
+cp -r "$OUT_DIR/reports-json" "$BOOL_DIR"
+python3 - "$BOOL_DIR/01-solution-auditor.json" <<'PYEOF'
+import json, sys
+path = sys.argv[1]
+report = json.load(open(path))
+report["finding_count"] = False
+json.dump(report, open(path, "w"), indent=2)
+PYEOF
+
+assert "boolean finding_count fails strict validation" \
+    "validate '$BOOL_DIR' '$_TMP_DIR/bool.json'" 1
+assert "boolean finding_count yields exactly one error" \
+    "python3 -c \"import json, sys; d = json.load(open('$_TMP_DIR/bool.json')); e = [m for m in d['errors'] if 'finding_count' in m]; sys.exit(len(e) != 1 or 'does not match' in e[0])\""
+
+# --- 4. --audit-id after the subcommand scopes export-contract and metrics ---
+DB="$_TMP_DIR/audit-fleet.sqlite3"
+python3 scripts/sqlite-init.py --db "$DB" --seed-fleet --audit-id run-1 > /dev/null
+python3 scripts/sqlite-init.py --db "$DB" --seed-fleet --audit-id run-2 > /dev/null
+
+assert "export-contract accepts --audit-id after the subcommand" \
+    "python3 scripts/sqlite-update.py --db '$DB' export-contract --audit-id run-2 --output '$_TMP_DIR/contract.json'"
+assert "export-contract --audit-id exports only that run" \
+    "python3 -c \"import json, sys; d = json.load(open('$_TMP_DIR/contract.json')); sys.exit({t['audit_id'] for t in d['todos']} != {'run-2'})\""
+assert "metrics accepts --audit-id after the subcommand" \
+    "python3 scripts/sqlite-update.py --db '$DB' metrics --audit-id run-1"
+
+# --- 5. A seed whose dependencies form a cycle is rejected before commit ---
+CYCLE_DB="$_TMP_DIR/cycle.sqlite3"
+cat > "$_TMP_DIR/cycle.jsonl" <<'EOF'
+{"id": "a", "title": "A"}
+{"id": "b", "title": "B"}
+{"id": "c", "title": "C"}
+{"id": "d", "title": "D"}
+{"todo_id": "a", "depends_on": "b"}
+{"todo_id": "b", "depends_on": "c"}
+{"todo_id": "c", "depends_on": "a"}
+{"todo_id": "d", "depends_on": "a"}
+EOF
+
+assert "cyclic seed dependencies are rejected" \
+    "python3 scripts/sqlite-init.py --db '$CYCLE_DB' --seed-json '$_TMP_DIR/cycle.jsonl' 2> '$_TMP_DIR/cycle.err'" 1
+assert_file_contains "cycle error names only the todos on the cycle" \
+    "$_TMP_DIR/cycle.err" "cycle between todos: a, b, c"
+assert "rejected seed leaves no todos behind" \
+    "python3 -c \"import sqlite3, sys; sys.exit(sqlite3.connect('$CYCLE_DB').execute('SELECT COUNT(*) FROM todos').fetchone()[0] != 0)\""
+
+# --- 6. findings-index.py ingests bundles once and queries them ---
+INDEX="$_TMP_DIR/findings-index.sqlite3"
+BUNDLE_COPY="$_TMP_DIR/bundle-copy"
+mkdir -p "$BUNDLE_COPY"
+cp "$OUT_DIR/audit-bundle.json" "$BUNDLE_COPY/audit-bundle.json"
+findings_index() {
+    python3 scripts/findings-index.py --index "$INDEX" "$@"
+}
+
+findings_index ingest "$BUNDLE_COPY" > "$_TMP_DIR/ingest.json"
+assert_json "first ingest adds the bundle" "$_TMP_DIR/ingest.json" \
+    "d['bundles_added'] == 1 and d['indexed_findings'] == 14"
+findings_index ingest "$BUNDLE_COPY" > "$_TMP_DIR/reingest.json"
+assert_json "unchanged bundle is skipped" "$_TMP_DIR/reingest.json" \
+    "d['bundles_unchanged'] == 1 and d['bundles_added'] == 0 and d['indexed_findings'] == 14"
+
+python3 - "$BUNDLE_COPY/audit-bundle.json" <<'PYEOF'
+import json, sys
+path = sys.argv[1]
+bundle = json.load(open(path))
+bundle["reports"][0]["findings"][0]["evidence"] = "src/auth.py:7 session fixation"
+json.dump(bundle, open(path, "w"), indent=2)
+PYEOF
+findings_index ingest "$BUNDLE_COPY" > "$_TMP_DIR/replace.json"
+assert_json "changed bundle is replaced" "$_TMP_DIR/replace.json" \
+    "d['bundles_replaced'] == 1 and d['indexed_bundles'] == 1 and d['indexed_findings'] == 14"
+
+findings_index query --text 'src/auth.py' > "$_TMP_DIR/query-path.json"
+assert_json "path-shaped text is searched as a phrase" "$_TMP_DIR/query-path.json" \
+    "d['text_as_phrase'] and [f['evidence'] for f in d['findings']] == ['src/auth.py:7 session fixation']"
+findings_index query --text 'logged' > "$_TMP_DIR/query-replaced.json"
+assert_json "replaced findings leave the full-text index" "$_TMP_DIR/query-replaced.json" \
+    "d['count'] == 13 and not d['text_as_phrase']"
+findings_index query --limit 14 > "$_TMP_DIR/query-full.json"
+assert_json "a page holding every row is not truncated" "$_TMP_DIR/query-full.json" \
+    "d['count'] == 14 and not d['truncated']"
+findings_index query --limit 13 > "$_TMP_DIR/query-short.json"
+assert_json "a page with rows left over is truncated" "$_TMP_DIR/query-short.json" \
+    "d['count'] == 13 and d['truncated']"
+
+# --- 7. findings-dedup.py clusters against each cluster's seed finding ---
+DEDUP_BUNDLE="$_TMP_DIR/dedup-bundle.json"
+python3 - "$DEDUP_BUNDLE" <<'PYEOF'
+import json, sys
+
+words = ("alpha bravo charlie delta echo foxtrot golf hotel india juliet kilo lima mike "
+         "november oscar papa quebec romeo sierra tango").split()
+# (report, finding id, evidence, impact, recommendation)
+rows = [
+    ("01-solution-auditor", "DUP-A", "src/auth.py:12 session token written to debug log",
+     "Credential leak via logs", "Redact tokens before logging"),
+    ("04-security-auditor", "DUP-B", "src/auth.py:12 session token is written to the debug log",
+     "Credentials leak through logs", "Redact tokens before logging them"),
+    ("06-devops", "LONE", "Dockerfile:3 base image pinned to latest",
+     "Unreproducible builds", "Pin the base image digest"),
+    # CHAIN-X~CHAIN-Y and CHAIN-Y~CHAIN-Z pass the threshold, CHAIN-X~CHAIN-Z does not
+    ("02-coherence-analyzer", "CHAIN-X", " ".join(words[0:14]), "", ""),
+    ("03-architect-review", "CHAIN-Y", " ".join(words[2:16]), "", ""),
+    ("05-test-engineer", "CHAIN-Z", " ".join(words[5:19]), "", ""),
+]
+reports = {}
+for report_id, finding_id, evidence, impact, recommendation in rows:
+    reports.setdefault(report_id, []).append({
+        "finding_id": finding_id, "severity": "warning", "dimension": "security",
+        "evidence": evidence, "impact": impact, "recommendation": recommendation,
+        "effort": "S", "owner": "platform", "dependencies": [], "confidence": "high",
+        "acceptance_criteria": "Done",
+    })
+bundle = {"reports": [{"report_id": rid, "findings": items} for rid, items in reports.items()]}
+json.dump(bundle, open(sys.argv[1], "w"))
+PYEOF
+
+assert "findings-dedup.py clusters the fixture bundle" \
+    "python3 scripts/findings-dedup.py --bundle '$DEDUP_BUNDLE' --output '$_TMP_DIR/clusters.json' --threshold 0.55"
+assert_json "duplicates cluster, distinct findings stay apart, no chaining" "$_TMP_DIR/clusters.json" \
+    "sorted(sorted(m['finding_id'] for m in c['members']) for c in d['clusters']) == [['CHAIN-X', 'CHAIN-Y'], ['CHAIN-Z'], ['DUP-A', 'DUP-B'], ['LONE']]"
+assert "a duplicate is found however crowded its bucket is" \
+    "python3 -c \"
+import importlib.util, sys
+sys.path.insert(0, 'scripts')
+spec = importlib.util.spec_from_file_location('dedup', 'scripts/findings-dedup.py')
+dedup = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(dedup)
+dedup.minhash = lambda hashes, size: (0,) * size  # every finding shares every bucket
+sets = [set(range(100))] + [set(range(1000 * n, 1000 * n + 100)) for n in range(1, 21)] + [set(range(100))]
+seeds, _ = dedup.cluster_findings(sets, 64, 16, 0.5)
+sys.exit(seeds[-1] != 0 or len(set(seeds)) != 21)
+\""
+
+# --- 8. ready/next schedule a diamond and report cycles ---
+SCHED_DB="$_TMP_DIR/scheduler.sqlite3"
+cat > "$_TMP_DIR/diamond.json" <<'EOF'
+{
+  "todos": [
+    {"id": "base", "title": "Base"},
+    {"id": "left", "title": "Left"},
+    {"id": "right", "title": "Right"},
+    {"id": "top", "title": "Top"},
+    {"id": "solo", "title": "Solo"}
+  ],
+  "todo_deps": [
+    {"todo_id": "left", "depends_on": "base"},
+    {"todo_id": "right", "depends_on": "base"},
+    {"todo_id": "top", "depends_on": "left"},
+    {"todo_id": "top", "depends_on": "right"}
+  ]
+}
+EOF
+python3 scripts/sqlite-init.py --db "$SCHED_DB" --seed-json "$_TMP_DIR/diamond.json" > /dev/null
+sched() {
+    python3 scripts/sqlite-update.py --db "$SCHED_DB" "$@"
+}
+
+sched ready > "$_TMP_DIR/ready-1.json"
+assert_json "only dependency-free todos are ready, critical path first" "$_TMP_DIR/ready-1.json" \
+    "d['ready'] == ['base', 'solo'] and d['critical_path'] == {'length': 3, 'todos': ['base', 'left', 'top']} and not d['cycle_detected']"
+sched next --slots 1 > "$_TMP_DIR/next-1.json"
+assert_json "next claims no more than --slots" "$_TMP_DIR/next-1.json" \
+    "d['claimed'] == ['base'] and d['remaining_ready'] == 1"
+sched ready > "$_TMP_DIR/ready-2.json"
+assert_json "a claimed todo is no longer ready and still blocks dependents" "$_TMP_DIR/ready-2.json" \
+    "d['ready'] == ['solo']"
+sched set-status --todo-id base --to-status done > /dev/null
+sched next --slots 2 > "$_TMP_DIR/next-2.json"
+assert_json "both diamond arms are claimed ahead of the shorter chain" "$_TMP_DIR/next-2.json" \
+    "d['claimed'] == ['left', 'right'] and d['remaining_ready'] == 1"
+sched set-status --todo-id left --to-status done > /dev/null
+sched ready > "$_TMP_DIR/ready-3.json"
+assert_json "the join waits for every arm" "$_TMP_DIR/ready-3.json" "d['ready'] == ['solo']"
+sched set-status --todo-id right --to-status done > /dev/null
+sched ready > "$_TMP_DIR/ready-4.json"
+assert_json "the join is ready once every arm is done" "$_TMP_DIR/ready-4.json" \
+    "d['ready'] == ['solo', 'top']"
+
+# Cycles cannot be added through the CLI, so write one straight into the table
+python3 - "$SCHED_DB" <<'PYEOF'
+import sqlite3, sys
+conn = sqlite3.connect(sys.argv[1])
+with conn:
+    for todo_id in ("loop-a", "loop-b"):
+        conn.execute(
+            "INSERT INTO todos(audit_id, id, title, description, status, created_at, updated_at) "
+            "VALUES('default', ?, ?, '', 'pending', '2026-01-01T00:00:00Z', '2026-01-01T00:00:00Z')",
+            (todo_id, todo_id),
+        )
+    conn.executemany(
+        "INSERT INTO todo_deps(audit_id, todo_id, depends_on, created_at) "
+        "VALUES('default', ?, ?, '2026-01-01T00:00:00Z')",
+        [("loop-a", "loop-b"), ("loop-b", "loop-a")],
+    )
+PYEOF
+sched ready > "$_TMP_DIR/ready-cycle.json"
+assert_json "ready reports the todos on a cycle and never offers them" "$_TMP_DIR/ready-cycle.json" \
+    "d['cycle_detected'] and d['cycle_todos'] == ['loop-a', 'loop-b'] and d['ready'] == ['solo', 'top']"
+
+# --- 9. serve daemon forwarding matches direct runs ---
+DAEMON_DB="$_TMP_DIR/daemon.sqlite3"
+DIRECT_DB="$_TMP_DIR/direct.sqlite3"
+SOCKET="$_TMP_DIR/todo.sock"
+python3 scripts/sqlite-init.py --db "$DAEMON_DB" --seed-fleet > /dev/null
+python3 scripts/sqlite-init.py --db "$DIRECT_DB" --seed-fleet > /dev/null
+
+python3 scripts/sqlite-update.py --db "$DAEMON_DB" --socket "$SOCKET" serve > "$_TMP_DIR/serve.out" 2>&1 &
+DAEMON_PID=$!
+for _ in $(seq 50); do
+    [[ -S "$SOCKET" ]] && break
+    sleep 0.1
+done
+
+# run_pair NAME ARGS... — the same command via the daemon and directly
+run_pair() {
+    local name="$1"
+    shift
+    local forwarded_exit=0 direct_exit=0
+    python3 scripts/sqlite-update.py --db "$DAEMON_DB" --socket "$SOCKET" "$@" \
+        > "$_TMP_DIR/$name.forwarded.out" 2> "$_TMP_DIR/$name.forwarded.err" || forwarded_exit=$?
+    python3 scripts/sqlite-update.py --db "$DIRECT_DB" "$@" \
+        > "$_TMP_DIR/$name.direct.out" 2> "$_TMP_DIR/$name.direct.err" || direct_exit=$?
+    echo "$forwarded_exit $direct_exit" > "$_TMP_DIR/$name.exits"
+}
+
+# same_run NAME EXIT — both runs exited EXIT with equal stdout (timestamps aside) and stderr
+same_run() {
+    local name="$1"
+    local expect_exit="$2"
+    assert "$name: forwarded and direct exit $expect_exit" \
+        "[[ \"\$(cat '$_TMP_DIR/$name.exits')\" == '$expect_exit $expect_exit' ]]"
+    assert "$name: forwarded and direct stdout match" \
+        "python3 -c \"import json, sys
+def load(path):
+    text = open(path).read()
+    data = json.loads(text) if text.strip() else None
+    if isinstance(data, dict):
+        data.pop('updated_at', None)
+    return data
+sys.exit(load('$_TMP_DIR/$name.forwarded.out') != load('$_TMP_DIR/$name.direct.out'))\""
+    assert "$name: forwarded and direct stderr match" \
+        "cmp -s '$_TMP_DIR/$name.forwarded.err' '$_TMP_DIR/$name.direct.err'"
+}
+
+assert "serve announces the socket it listens on" \
+    "[[ -S '$SOCKET' ]] && grep -q '\"action\": \"serving\"' '$_TMP_DIR/serve.out'"
+assert "the daemon answers a request itself" \
+    "python3 -c \"import os, sys
+sys.path.insert(0, 'scripts')
+import importlib.util
+spec = importlib.util.spec_from_file_location('sqlite_update', 'scripts/sqlite-update.py')
+module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(module)
+response = module.forward_to_daemon('$SOCKET', {'argv': ['--db', '$DAEMON_DB', 'ready'], 'cwd': os.getcwd()})
+sys.exit(response is None or response['exit_code'] != 0 or response['result']['action'] != 'ready')\""
+
+run_pair set-status set-status --todo-id lane-01-solution-auditor --to-status in_progress
+same_run set-status 0
+run_pair bad-transition set-status --todo-id lane-02-coherence-analyzer --to-status done
+same_run bad-transition 1
+assert_json "the forwarded set-status reached the daemon's database" "$_TMP_DIR/set-status.forwarded.out" \
+    "d['changed'] and d['to_status'] == 'in_progress'"
+
+kill "$DAEMON_PID" 2>/dev/null
+wait "$DAEMON_PID" 2>/dev/null
+DAEMON_PID=""
+assert "the daemon removes its socket on shutdown" "[[ ! -e '$SOCKET' ]]"
+assert "with no daemon listening the command runs directly" \
+    "python3 scripts/sqlite-update.py --db '$DAEMON_DB' --socket '$SOCKET' set-status --todo-id lane-01-solution-auditor --to-status done > '$_TMP_DIR/fallback.json'"
+assert_json "the direct fallback updates the database" "$_TMP_DIR/fallback.json" \
+    "d['from_status'] == 'in_progress' and d['to_status'] == 'done'"
+
+# ---------------------------------------------------------------------------
+# Results
+# ---------------------------------------------------------------------------
+
+echo ""
+echo "Contract tests: $PASS passed, $FAIL failed"
+
+if [[ $FAIL -gt 0 ]]; then
+    for err in "${ERRORS[@]}"; do
+        echo "$err"
+    done
+    exit 1
+fi
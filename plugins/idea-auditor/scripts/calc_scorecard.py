@@ -28,6 +28,20 @@ Design:
 Usage:
   python3 calc_scorecard.py --scores '{"wedge":{"score_bruto":3},...}' --evidence ev.json --mode OSS_CLI
   python3 calc_scorecard.py --scores '{"wedge":{"score_bruto":3,"confidence":0.8},...}' --mode B2B_SaaS
+  python3 calc_scorecard.py --scores '...' --sensitivity --samples 5000 --score-jitter 0.5
+
+Sensitivity (--sensitivity, optional NumPy dependency):
+  Scores thousands of what-if scenarios under every mode in one vectorized pass and adds
+  a "sensitivity" block: per mode, decision stability under random jitter of score_bruto and
+  confidence, and per dimension the smallest single-input change that flips the decision.
+  The scorecard itself is unchanged; without NumPy only --sensitivity and --monte-carlo
+  are unavailable.
+
+Confidence propagation (--monte-carlo, optional NumPy dependency):
+  Treats each dimension's confidence components (aggregated_components_by_dimension from
+  grade_evidence.py) as Beta distributions, scores 100k samples in one vectorized pass and
+  adds an "uncertainty" block: the probability of each gate decision and credible intervals
+  for score_total and confidence_global.
 """
 
 import argparse
@@ -74,6 +88,20 @@ GATES = {
     "KILL": {"score_max": 40},
 }
 
+# Sensitivity analysis (--sensitivity). Decision codes index DECISIONS.
+DIMENSIONS = list(dict.fromkeys(dim for weights in WEIGHTS.values() for dim in weights))
+DECISIONS = ("PROCEED", "ITERATE", "KILL", "INSUFFICIENT_EVIDENCE")
+INPUT_BOUNDS = {"score_bruto": (0.0, 5.0), "confidence": (0.0, 1.0)}
+SWING_STEPS = {"score_bruto": 0.01, "confidence": 0.001}
+DEFAULT_SAMPLES = 2000
+DEFAULT_JITTER = {"score_bruto": 0.5, "confidence": 0.1}
+
+# Confidence propagation (--monte-carlo). ConfDim weights mirror grade_evidence.py.
+CONF_DIM_WEIGHTS = {"source_diversity": 0.2, "recency": 0.3, "commitment": 0.3, "consistency": 0.2}
+DEFAULT_MC_SAMPLES = 100_000
+DEFAULT_CONCENTRATION = 10.0
+BETA_MEAN_EPS = 1e-3
+
 
 def decide(score_total: float | None, confidence_global: float | None, any_null: bool) -> str:
     if any_null or score_total is None or confidence_global is None:
@@ -137,6 +165,226 @@ def calc(dim_scores: dict[str, dict], mode: str) -> dict:
     }
 
 
+def load_numpy(flag: str):
+    try:
+        import numpy
+    except ImportError:
+        print(f"ERROR: {flag} requires NumPy (pip install numpy)", file=sys.stderr)
+        sys.exit(1)
+    return numpy
+
+
+def round_like_python(np, values, digits: int):
+    """np.round() rounds the scaled value half-to-even, which differs from round()
+    when scaling lands exactly on .5 (e.g. 27.55 * 10); redo those few with round()."""
+    rounded = np.round(values, digits)
+    scaled = values * 10**digits
+    for i in np.flatnonzero(np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6):
+        rounded[i] = round(float(values[i]), digits)
+    return rounded
+
+
+def calc_matrix(np, score_bruto, confidence, mode: str):
+    """Vectorized calc(): one row per scenario, one column per DIMENSIONS entry.
+
+    Nulls are NaN. Sums run dimension by dimension in WEIGHTS order, like calc(),
+    so each row gets the same score_total and decision calc() would give it.
+    Returns (score_total, confidence_global, decision codes) as row vectors.
+    """
+    weights = WEIGHTS.get(mode, WEIGHTS["OSS_CLI"])
+    rows = score_bruto.shape[0]
+    weighted_sum = np.zeros(rows)
+    confidence_sum = np.zeros(rows)
+    any_null = np.zeros(rows, dtype=bool)
+    total_weight = 0.0
+    for dim, w in weights.items():
+        col = DIMENSIONS.index(dim)
+        any_null |= np.isnan(score_bruto[:, col]) | np.isnan(confidence[:, col])
+        score_efetivo = round_like_python(np, score_bruto[:, col] * confidence[:, col], 3)
+        weighted_sum += w * np.nan_to_num(score_efetivo)
+        confidence_sum += np.nan_to_num(confidence[:, col])
+        total_weight += w
+
+    score_total = round_like_python(np, (weighted_sum / total_weight) * 20, 1)
+    confidence_global = round_like_python(np, confidence_sum / len(weights), 3)
+    proceed = GATES["PROCEED"]
+    codes = np.select(
+        [
+            any_null,
+            (score_total >= proceed["score_min"]) & (confidence_global >= proceed["confidence_min"]),
+            score_total >= GATES["ITERATE"]["score_min"],
+        ],
+        [DECISIONS.index("INSUFFICIENT_EVIDENCE"), DECISIONS.index("PROCEED"), DECISIONS.index("ITERATE")],
+        default=DECISIONS.index("KILL"),
+    )
+    score_total[any_null] = np.nan
+    confidence_global[any_null] = np.nan
+    return score_total, confidence_global, codes
+
+
+def sensitivity(dim_scores: dict[str, dict], samples: int, jitter: dict[str, float], seed: int) -> dict:
+    """Evaluate random what-if scenarios and per-dimension sweeps under every mode.
+
+    All scenarios are stacked into one matrix and scored with calc_matrix():
+      row 0            the inputs as given
+      random rows      every known score_bruto/confidence jittered uniformly by ±jitter
+      sweep rows       one input of one dimension moved in SWING_STEPS increments,
+                       everything else as given
+    Stability is the share of random rows that keep the row-0 decision; swing is
+    the smallest change to a single input that flips it (null if none does).
+    """
+    np = load_numpy("--sensitivity")
+    base = {
+        field: np.array(
+            [np.nan if dim_scores.get(dim, {}).get(field) is None else float(dim_scores[dim][field]) for dim in DIMENSIONS]
+        )
+        for field in INPUT_BOUNDS
+    }
+
+    rng = np.random.default_rng(seed)
+    blocks = {field: [base[field][None, :]] for field in INPUT_BOUNDS}
+    for field, (low, high) in INPUT_BOUNDS.items():
+        noise = rng.uniform(-jitter[field], jitter[field], size=(samples, len(DIMENSIONS)))
+        blocks[field].append(np.clip(base[field] + noise, low, high))
+
+    # One sweep block per (field, dimension); remember where each starts.
+    sweeps: list[tuple] = []
+    offset = 1 + samples
+    for field, (low, high) in INPUT_BOUNDS.items():
+        for col, dim in enumerate(DIMENSIONS):
+            if np.isnan(base[field][col]):
+                continue
+            values = np.round(np.arange(low, high + SWING_STEPS[field] / 2, SWING_STEPS[field]), 6)
+            block = {name: np.repeat(base[name][None, :], len(values), axis=0) for name in INPUT_BOUNDS}
+            block[field][:, col] = values
+            for name in INPUT_BOUNDS:
+                blocks[name].append(block[name])
+            sweeps.append((field, dim, offset, values - base[field][col]))
+            offset += len(values)
+
+    score_bruto = np.concatenate(blocks["score_bruto"])
+    confidence = np.concatenate(blocks["confidence"])
+
+    modes: dict = {}
+    for mode, weights in WEIGHTS.items():
+        score_total, _, codes = calc_matrix(np, score_bruto, confidence, mode)
+        base_code = int(codes[0])
+        sampled = codes[1 : 1 + samples]
+        counts = np.bincount(sampled, minlength=len(DECISIONS))
+        sampled_scores = score_total[1 : 1 + samples]
+        sampled_scores = sampled_scores[~np.isnan(sampled_scores)]
+
+        swing: dict = {dim: {field: None for field in INPUT_BOUNDS} for dim in weights}
+        for field, dim, start, deltas in sweeps:
+            if dim not in weights:
+                continue
+            flipped = np.flatnonzero(codes[start : start + len(deltas)] != base_code)
+            if flipped.size:
+                nearest = flipped[np.argmin(np.abs(deltas[flipped]))]
+                swing[dim][field] = {
+                    "delta": round(float(deltas[nearest]), 3),
+                    "flips_to": DECISIONS[int(codes[start + nearest])],
+                }
+
+        modes[mode] = {
+            "decision": DECISIONS[base_code],
+            "score_total": None if np.isnan(score_total[0]) else float(score_total[0]),
+            "stability": round(float(counts[base_code]) / samples, 4),
+            "decision_share": {name: round(float(count) / samples, 4) for name, count in zip(DECISIONS, counts)},
+            "score_total_p5_p50_p95": (
+                [round(float(value), 1) for value in np.percentile(sampled_scores, [5, 50, 95])]
+                if sampled_scores.size
+                else None
+            ),
+            "swing": swing,
+        }
+
+    return {
+        "samples": samples,
+        "seed": seed,
+        "jitter": jitter,
+        "scenarios_evaluated": int(score_bruto.shape[0]) * len(WEIGHTS),
+        "modes": modes,
+    }
+
+
+def beta_around(np, rng, mean: float, concentration: float, samples: int):
+    """Beta draws with the given mean; concentration is alpha + beta (higher → tighter)."""
+    mean = min(max(mean, BETA_MEAN_EPS), 1 - BETA_MEAN_EPS)
+    return rng.beta(mean * concentration, (1 - mean) * concentration, size=samples)
+
+
+def credible(np, values) -> dict | None:
+    values = values[~np.isnan(values)]
+    if not values.size:
+        return None
+    p5, p25, p50, p75, p95 = (round(float(v), 3) for v in np.percentile(values, [5, 25, 50, 75, 95]))
+    return {"mean": round(float(values.mean()), 3), "median": p50, "ci50": [p25, p75], "ci90": [p5, p95]}
+
+
+def propagate_confidence(
+    dim_scores: dict[str, dict],
+    components: dict[str, dict],
+    mode: str,
+    samples: int,
+    concentration: float,
+    seed: int,
+) -> dict:
+    """Monte Carlo over confidence: score_bruto stays fixed, confidence becomes a distribution.
+
+    A dimension graded by grade_evidence.py has each confidence component (source
+    diversity, recency, commitment, consistency) drawn from a Beta around its mean,
+    with concentration * item count pseudo-observations, and recombined with the
+    ConfDim weights. A dimension with only a point confidence gets one Beta around it
+    with concentration pseudo-observations. Every sample is scored by calc_matrix().
+    """
+    np = load_numpy("--monte-carlo")
+    rng = np.random.default_rng(seed)
+    weights = WEIGHTS.get(mode, WEIGHTS["OSS_CLI"])
+    score_bruto = np.full((samples, len(DIMENSIONS)), np.nan)
+    confidence = np.full((samples, len(DIMENSIONS)), np.nan)
+    dimensions: dict = {}
+
+    for dim in weights:
+        col = DIMENSIONS.index(dim)
+        raw = dim_scores.get(dim, {})
+        graded = components.get(dim)
+        if raw.get("score_bruto") is not None:
+            score_bruto[:, col] = float(raw["score_bruto"])
+        if graded and graded.get("items"):
+            strength = concentration * graded["items"]
+            draws = sum(
+                w * beta_around(np, rng, float(graded[key]), strength, samples)
+                for key, w in CONF_DIM_WEIGHTS.items()
+            )
+            confidence[:, col] = np.clip(draws, 0.0, 1.0)
+            source, items = "components", graded["items"]
+        elif raw.get("confidence") is not None:
+            confidence[:, col] = beta_around(np, rng, float(raw["confidence"]), concentration, samples)
+            source, items = "point", None
+        else:
+            source, items = None, None
+        summary = credible(np, confidence[:, col])
+        dimensions[dim] = {
+            "source": source,
+            "evidence_items": items,
+            "confidence_mean": summary["mean"] if summary else None,
+            "confidence_ci90": summary["ci90"] if summary else None,
+        }
+
+    score_total, confidence_global, codes = calc_matrix(np, score_bruto, confidence, mode)
+    counts = np.bincount(codes, minlength=len(DECISIONS))
+    return {
+        "samples": samples,
+        "seed": seed,
+        "concentration": concentration,
+        "decision_probability": {name: round(float(count) / samples, 4) for name, count in zip(DECISIONS, counts)},
+        "score_total": credible(np, score_total),
+        "confidence_global": credible(np, confidence_global),
+        "dimensions": dimensions,
+    }
+
+
 def main():
     parser = argparse.ArgumentParser(description="Calculate idea scorecard.")
     parser.add_argument("--scores", required=False, help="JSON string with dimension scores")
@@ -145,8 +393,38 @@ def main():
     parser.add_argument("--idea", required=False, help="Path to IDEA.json")
     parser.add_argument("--evidence", required=False, help="Path to graded evidence JSON")
     parser.add_argument("--out", required=False, help="Output scorecard JSON path")
+    parser.add_argument("--sensitivity", action="store_true",
+                        help="Add a what-if analysis across all modes (requires NumPy)")
+    parser.add_argument("--samples", type=int, default=DEFAULT_SAMPLES,
+                        help=f"Random scenarios for --sensitivity (default: {DEFAULT_SAMPLES})")
+    parser.add_argument("--score-jitter", type=float, default=DEFAULT_JITTER["score_bruto"],
+                        help="Max ± change to each score_bruto in random scenarios "
+                             f"(default: {DEFAULT_JITTER['score_bruto']})")
+    parser.add_argument("--confidence-jitter", type=float, default=DEFAULT_JITTER["confidence"],
+                        help="Max ± change to each confidence in random scenarios "
+                             f"(default: {DEFAULT_JITTER['confidence']})")
+    parser.add_argument("--monte-carlo", action="store_true",
+                        help="Add decision probabilities and credible intervals from sampled "
+                             "confidence (requires NumPy)")
+    parser.add_argument("--mc-samples", type=int, default=DEFAULT_MC_SAMPLES,
+                        help=f"Samples for --monte-carlo (default: {DEFAULT_MC_SAMPLES})")
+    parser.add_argument("--concentration", type=float, default=DEFAULT_CONCENTRATION,
+                        help="Beta pseudo-observations per evidence item for --monte-carlo "
+                             f"(default: {DEFAULT_CONCENTRATION})")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="Random seed for --sensitivity and --monte-carlo (default: 0)")
     args = parser.parse_args()
 
+    if args.samples < 1:
+        print("ERROR: --samples must be at least 1", file=sys.stderr)
+        sys.exit(1)
+    if args.score_jitter < 0 or args.confidence_jitter < 0:
+        print("ERROR: jitter values must be non-negative", file=sys.stderr)
+        sys.exit(1)
+    if args.mc_samples < 1 or args.concentration <= 0:
+        print("ERROR: --mc-samples must be at least 1 and --concentration positive", file=sys.stderr)
+        sys.exit(1)
+
     # Resolve mode from IDEA if available.
     # Only IDEA.json is parsed for mode extraction; IDEA.md is accepted as a path
     # reference but does not trigger JSON parsing to avoid spurious warnings.
@@ -168,6 +446,7 @@ def main():
     # If only --evidence is provided without --scores, score_bruto stays null →
     # decision will be INSUFFICIENT_EVIDENCE, which is correct and expected.
     dim_scores: dict = {}
+    components: dict = {}
 
     if args.scores:
         try:
@@ -181,6 +460,7 @@ def main():
             evidence_data = json.loads(Path(args.evidence).read_text(encoding="utf-8"))
             # Expect aggregated_conf_by_dimension from grade_evidence.py output
             agg = evidence_data.get("aggregated_conf_by_dimension", {})
+            components = evidence_data.get("aggregated_components_by_dimension", {})
             for dim, conf in agg.items():
                 if dim not in dim_scores:
                     dim_scores[dim] = {}
@@ -199,6 +479,13 @@ def main():
         "scored_at": date.today().isoformat(),
         **result,
     }
+    if args.sensitivity:
+        jitter = {"score_bruto": args.score_jitter, "confidence": args.confidence_jitter}
+        scorecard["sensitivity"] = sensitivity(dim_scores, args.samples, jitter, args.seed)
+    if args.monte_carlo:
+        scorecard["uncertainty"] = propagate_confidence(
+            dim_scores, components, mode, args.mc_samples, args.concentration, args.seed
+        )
 
     output_json = json.dumps(scorecard, indent=2, ensure_ascii=False)
 
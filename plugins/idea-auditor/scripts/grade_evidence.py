@@ -82,6 +82,7 @@ def grade_single(item: dict) -> dict:
 
 
 VALID_DIMENSIONS = {"wedge", "friction", "loop", "timing", "trust", "migration"}
+COMPONENT_KEYS = ("source_diversity", "recency", "commitment", "consistency")
 
 # Explicit mapping for STATE filenames documented in README.
 # Multi-dimensional files (interviews, analytics) have no single mapping;
@@ -95,6 +96,21 @@ _FILENAME_DIMENSION_MAP: dict[str, str | None] = {
 }
 
 
+def aggregate_components(components_by_dim: dict[str, list[dict]]) -> dict:
+    """Mean of each confidence component per dimension, with the item count.
+
+    calc_scorecard.py --monte-carlo samples around these means; more items give
+    a tighter distribution.
+    """
+    return {
+        dim: {
+            "items": len(items),
+            **{key: round(sum(c[key] for c in items) / len(items), 3) for key in COMPONENT_KEYS},
+        }
+        for dim, items in components_by_dim.items()
+    }
+
+
 def infer_dimension_from_filename(filename: str) -> str | None:
     """Infer scoring dimension from filename.
 
@@ -127,6 +143,7 @@ def grade_file(path: Path, dimension_filter: str | None = None) -> dict:
 
     # Aggregate ConfDim per dimension
     dim_scores: dict[str, list[float]] = {}
+    dim_components: dict[str, list[dict]] = {}
     for item in graded:
         # Precedence: explicit field > filename inference > "unknown"
         dim = item.get("dimension") or filename_dim or "unknown"
@@ -135,13 +152,18 @@ def grade_file(path: Path, dimension_filter: str | None = None) -> dict:
         conf = item.get("confidence_components", {}).get("conf_dim")
         if conf is not None:
             dim_scores.setdefault(dim, []).append(conf)
+            dim_components.setdefault(dim, []).append(item["confidence_components"])
 
     aggregated = {
         dim: round(sum(scores) / len(scores), 3)
         for dim, scores in dim_scores.items()
     }
 
-    return {"items": graded, "aggregated_conf_by_dimension": aggregated}
+    return {
+        "items": graded,
+        "aggregated_conf_by_dimension": aggregated,
+        "aggregated_components_by_dimension": aggregate_components(dim_components),
+    }
 
 
 def main():
@@ -157,6 +179,7 @@ def main():
         # Collect all conf_dim values per dimension across ALL items (not per-file averages)
         # to avoid statistical bias when files have different item counts.
         dim_all_confs: dict[str, list[float]] = {}
+        dim_all_components: dict[str, list[dict]] = {}
         for f in sorted(path.glob("*.json")):
             result = grade_file(f, args.dimension)
             all_results["files"][f.name] = result["items"]
@@ -168,10 +191,12 @@ def main():
                 conf = item.get("confidence_components", {}).get("conf_dim")
                 if conf is not None:
                     dim_all_confs.setdefault(dim, []).append(conf)
+                    dim_all_components.setdefault(dim, []).append(item["confidence_components"])
         all_results["aggregated_conf_by_dimension"] = {
             dim: round(sum(confs) / len(confs), 3)
             for dim, confs in dim_all_confs.items()
         }
+        all_results["aggregated_components_by_dimension"] = aggregate_components(dim_all_components)
         output = all_results
     else:
         output = grade_file(path, args.dimension)
@@ -441,6 +441,68 @@ assert_output_contains \
     "python3 -c \"import json; d=json.load(open('$GRADED_CC_OUT')); print(str(d))\"" \
     "conf_dim"
 
+# ---------------------------------------------------------------------------
+# Scenario 10 — calc_scorecard.py --sensitivity / --monte-carlo (skipped without NumPy)
+# ---------------------------------------------------------------------------
+
+if python3 -c "import numpy" > /dev/null 2>&1; then
+    SENSITIVITY_OUT="$_TMP_DIR/scorecard_sensitivity.json"
+
+    assert_exit \
+        "S10: calc_scorecard.py --sensitivity exits 0" \
+        "python3 scripts/calc_scorecard.py \
+            --scores '{\"wedge\":{\"score_bruto\":3.5,\"confidence\":0.65},\"friction\":{\"score_bruto\":3.0,\"confidence\":0.5},\"loop\":{\"score_bruto\":2.5,\"confidence\":0.45},\"timing\":{\"score_bruto\":3.5,\"confidence\":0.6},\"trust\":{\"score_bruto\":4.0,\"confidence\":0.7}}' \
+            --mode OSS_CLI --sensitivity --samples 500 \
+            > '$SENSITIVITY_OUT'"
+
+    assert_json_field \
+        "S10: sensitivity base decision matches the scorecard decision" \
+        "$SENSITIVITY_OUT" \
+        "d['sensitivity']['modes']['OSS_CLI']['decision'] == d['decision']" \
+        "True"
+
+    assert_json_field \
+        "S10: sensitivity covers every scoring mode" \
+        "$SENSITIVITY_OUT" \
+        "sorted(d['sensitivity']['modes'])" \
+        "['B2B_SaaS', 'Consumer_Viral', 'Infra_Fork_Standard', 'OSS_CLI']"
+
+    assert_json_field \
+        "S10: lowering wedge score_bruto flips ITERATE to KILL" \
+        "$SENSITIVITY_OUT" \
+        "(lambda s: s['delta'] < 0 and s['flips_to'])(d['sensitivity']['modes']['OSS_CLI']['swing']['wedge']['score_bruto'])" \
+        "KILL"
+
+    MC_OUT="$_TMP_DIR/scorecard_monte_carlo.json"
+
+    assert_exit \
+        "S10: calc_scorecard.py --monte-carlo exits 0 with graded evidence" \
+        "python3 scripts/calc_scorecard.py \
+            --scores '{\"wedge\":{\"score_bruto\":3.5},\"friction\":{\"score_bruto\":3.0,\"confidence\":0.5},\"loop\":{\"score_bruto\":2.5,\"confidence\":0.45},\"timing\":{\"score_bruto\":3.5,\"confidence\":0.6},\"trust\":{\"score_bruto\":4.0,\"confidence\":0.7}}' \
+            --evidence '$GRADED_OUT' --mode OSS_CLI --monte-carlo --mc-samples 20000 \
+            > '$MC_OUT'"
+
+    assert_json_field \
+        "S10: decision probabilities sum to 1" \
+        "$MC_OUT" \
+        "round(sum(d['uncertainty']['decision_probability'].values()), 3)" \
+        "1.0"
+
+    assert_json_field \
+        "S10: graded wedge confidence is sampled from its components" \
+        "$MC_OUT" \
+        "d['uncertainty']['dimensions']['wedge']['source']" \
+        "components"
+
+    assert_json_field \
+        "S10: score_total ci90 brackets the median" \
+        "$MC_OUT" \
+        "(lambda c: c['ci90'][0] <= c['median'] <= c['ci90'][1])(d['uncertainty']['score_total'])" \
+        "True"
+else
+    $VERBOSE && echo "SKIP [S10: NumPy not installed]"
+fi
+
 # ---------------------------------------------------------------------------
 # Results
 # ---------------------------------------------------------------------------
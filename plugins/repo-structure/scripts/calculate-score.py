@@ -13,19 +13,28 @@ Usage:
     python3 calculate-score.py --path /path/to/repo
     python3 calculate-score.py --json-output
     python3 calculate-score.py --verbose
+    python3 calculate-score.py --secret-findings --fail-on-secrets
+    python3 calculate-score.py --fleet repos/ --workers 8 --summary summary.json
+    python3 calculate-score.py --cache-dir ~/.cache/repo-structure
 
 Output: JSON with scores, issues, and recommendations
 """
 
 import argparse
+import codecs
+import fnmatch
+import hashlib
 import json
+import math
 import os
 import re
+import sqlite3
 import subprocess
 import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
-from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 
 # Score weights per category (must sum to 100)
@@ -46,49 +55,6 @@ GRADE_THRESHOLDS = [
 ]
 
 
-def get_git_info() -> Dict[str, str]:
-    """Get git repository information."""
-    info = {
-        "commit_sha": "",
-        "branch": "",
-        "remote_url": "",
-    }
-    try:
-        # Get current commit
-        result = subprocess.run(
-            ["git", "rev-parse", "HEAD"],
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-        if result.returncode == 0:
-            info["commit_sha"] = result.stdout.strip()
-
-        # Get current branch
-        result = subprocess.run(
-            ["git", "rev-parse", "--abbrev-ref", "HEAD"],
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-        if result.returncode == 0:
-            info["branch"] = result.stdout.strip()
-
-        # Get remote URL
-        result = subprocess.run(
-            ["git", "remote", "get-url", "origin"],
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-        if result.returncode == 0:
-            info["remote_url"] = result.stdout.strip()
-    except (subprocess.TimeoutExpired, FileNotFoundError, subprocess.CalledProcessError):
-        pass
-
-    return info
-
-
 def check_file_exists(filepath: str) -> bool:
     """Check if a file exists."""
     return os.path.isfile(filepath)
@@ -99,12 +65,692 @@ def check_directory_exists(dirpath: str) -> bool:
     return os.path.isdir(dirpath)
 
 
+# ============================================================
+# Git Metadata
+# ============================================================
+
+class GitMetadata:
+    """
+    Git facts for one repository, gathered with as few processes as possible.
+
+    HEAD, the current branch and the origin URL are read straight from the
+    git directory (loose refs, packed-refs, config). Commit history comes
+    from a single streaming `git log` pass, optionally bounded by `since`,
+    that stops as soon as the community signals are decided. Everything is
+    computed lazily and memoized for the lifetime of the object.
+    """
+
+    # Bounds on the streaming `git log` pass: wall-clock seconds and commits read
+    LOG_TIMEOUT = 5
+    LOG_MAX_COUNT = 10000
+
+    def __init__(self, repo_path: Optional[str] = None, since: Optional[str] = None):
+        self.repo_path = os.path.abspath(repo_path or ".")
+        self.since = since
+        self._refs: Optional[Dict[str, str]] = None
+        self._log: Optional[Dict[str, Any]] = None
+        self.git_dir, self.common_dir = self._find_git_dir()
+
+    def _find_git_dir(self) -> Tuple[Optional[str], Optional[str]]:
+        path = self.repo_path
+        while True:
+            dot_git = os.path.join(path, ".git")
+            git_dir = None
+            if os.path.isdir(dot_git):
+                git_dir = dot_git
+            elif os.path.isfile(dot_git):
+                # Worktrees and submodules: ".git" file with "gitdir: <path>"
+                try:
+                    with open(dot_git) as f:
+                        content = f.read().strip()
+                except OSError:
+                    content = ""
+                if content.startswith("gitdir:"):
+                    git_dir = os.path.normpath(os.path.join(path, content[len("gitdir:"):].strip()))
+            if git_dir:
+                common_dir = git_dir
+                try:
+                    with open(os.path.join(git_dir, "commondir")) as f:
+                        common_dir = os.path.normpath(os.path.join(git_dir, f.read().strip()))
+                except OSError:
+                    pass
+                return git_dir, common_dir
+            parent = os.path.dirname(path)
+            if parent == path:
+                return None, None
+            path = parent
+
+    def _git(self, *args: str, timeout: int = 5) -> Optional[str]:
+        try:
+            result = subprocess.run(
+                ["git", *args],
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+                cwd=self.repo_path,
+            )
+        except (subprocess.TimeoutExpired, FileNotFoundError):
+            return None
+        return result.stdout.strip() if result.returncode == 0 else None
+
+    def _resolve_ref(self, ref: str) -> str:
+        for base in (self.git_dir, self.common_dir):
+            try:
+                with open(os.path.join(base, ref)) as f:
+                    return f.read().strip()
+            except OSError:
+                continue
+        try:
+            with open(os.path.join(self.common_dir, "packed-refs")) as f:
+                for line in f:
+                    if line.startswith(("#", "^")):
+                        continue
+                    sha, _, name = line.strip().partition(" ")
+                    if name == ref:
+                        return sha
+        except OSError:
+            pass
+        return ""
+
+    def _read_origin_url(self) -> Optional[str]:
+        """Return remote.origin.url from the repo config, or None to ask git."""
+        try:
+            with open(os.path.join(self.common_dir, "config")) as f:
+                lines = f.read().splitlines()
+        except OSError:
+            return None
+        section = ""
+        url = ""
+        for line in lines:
+            line = line.strip()
+            if line.startswith("["):
+                section = line.strip("[]").replace('"', "").lower()
+                if section.startswith("url ") or section.startswith("include"):
+                    # insteadOf rewrites and includes need git's own resolution
+                    return None
+            elif section == "remote origin" and "=" in line:
+                key, _, value = line.partition("=")
+                if key.strip().lower() == "url":
+                    url = value.strip()
+        return url
+
+    @property
+    def refs(self) -> Dict[str, str]:
+        """commit_sha and branch as `git rev-parse` would report them."""
+        if self._refs is None:
+            refs = {"commit_sha": "", "branch": ""}
+            if self.git_dir:
+                try:
+                    with open(os.path.join(self.git_dir, "HEAD")) as f:
+                        head = f.read().strip()
+                except OSError:
+                    head = ""
+                if head.startswith("ref:"):
+                    ref = head[len("ref:"):].strip()
+                    refs["commit_sha"] = self._resolve_ref(ref)
+                    if refs["commit_sha"]:
+                        refs["branch"] = ref[len("refs/heads/"):] if ref.startswith("refs/heads/") else ref
+                elif head:
+                    refs["commit_sha"] = head
+                    refs["branch"] = "HEAD"
+            self._refs = refs
+        return self._refs
+
+    @property
+    def remote_url(self) -> str:
+        if not self.git_dir:
+            return ""
+        url = self._read_origin_url()
+        if url is None:
+            url = self._git("remote", "get-url", "origin") or ""
+        return url
+
+    @property
+    def log(self) -> Dict[str, Any]:
+        """
+        Facts from one streaming `git log` pass over HEAD.
+
+        Returns head/tree hashes and time of the newest commit in the window
+        plus whether more than one author (mailmap-aware name, as used by
+        `git shortlog`) committed in it. Reading stops at the second author,
+        after LOG_MAX_COUNT commits, or when LOG_TIMEOUT expires (the git
+        process is killed and the facts gathered so far are kept).
+        """
+        if self._log is None:
+            facts: Dict[str, Any] = {"head": "", "tree": "", "last_commit": None, "multiple_authors": False}
+            if self.git_dir:
+                cmd = ["git", "log", f"--max-count={self.LOG_MAX_COUNT}", "--format=%H%x00%T%x00%ct%x00%aN", "HEAD"]
+                if self.since:
+                    cmd.insert(2, f"--since={self.since}")
+                try:
+                    proc = subprocess.Popen(
+                        cmd,
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.DEVNULL,
+                        text=True,
+                        errors="replace",
+                        cwd=self.repo_path,
+                    )
+                except OSError:
+                    proc = None
+                if proc is not None:
+                    first_author = None
+                    deadline = threading.Timer(self.LOG_TIMEOUT, proc.kill)
+                    deadline.start()
+                    try:
+                        for line in proc.stdout:
+                            parts = line.rstrip("\n").split("\0")
+                            if len(parts) != 4:
+                                continue
+                            if first_author is None:
+                                facts["head"], facts["tree"] = parts[0], parts[1]
+                                facts["last_commit"] = int(parts[2]) if parts[2].isdigit() else None
+                                first_author = parts[3]
+                            elif parts[3] != first_author:
+                                facts["multiple_authors"] = True
+                                break
+                    finally:
+                        deadline.cancel()
+                        proc.stdout.close()
+                        proc.terminate()
+                        try:
+                            proc.wait(timeout=self.LOG_TIMEOUT)
+                        except subprocess.TimeoutExpired:
+                            proc.kill()
+            self._log = facts
+        return self._log
+
+    @property
+    def tree_hash(self) -> str:
+        """HEAD^{tree}, from the log pass when HEAD falls inside the window."""
+        if self.log["tree"]:
+            return self.log["tree"]
+        return (self._git("rev-parse", "HEAD^{tree}") or "") if self.git_dir else ""
+
+    def is_clean(self) -> bool:
+        """True when `git status --porcelain` reports no changes."""
+        return self.git_dir is not None and self._git("status", "--porcelain", timeout=30) == ""
+
+
+def get_git_info(repo_path: Optional[str] = None, git: Optional[GitMetadata] = None) -> Dict[str, str]:
+    """Get git repository information (for `repo_path`, default: cwd)."""
+    git = git or GitMetadata(repo_path)
+    return {
+        "commit_sha": git.refs["commit_sha"],
+        "branch": git.refs["branch"],
+        "remote_url": git.remote_url,
+    }
+
+
+# ============================================================
+# Repository Index
+# ============================================================
+
+# Directories never descended into (VCS metadata, vendored deps, caches)
+PRUNED_DIRS = {
+    ".git", ".hg", ".svn", "node_modules", "vendor", "bower_components",
+    ".venv", "venv", "__pycache__", ".tox", ".nox", ".mypy_cache",
+    ".pytest_cache", ".ruff_cache", "site-packages", ".next", ".gradle",
+}
+
+# Maximum bytes read per file by the content cache
+MAX_CONTENT_BYTES = 1024 * 1024
+
+
+def _gitignore_glob(pattern: str) -> str:
+    """
+    Translate a gitignore glob into a regex body.
+
+    Unlike fnmatch, `*`, `?` and `[...]` never match "/"; only a `**`
+    path segment (leading `**/`, inner `/**/`, trailing `/**`) spans
+    directories.
+    """
+    out: List[str] = []
+    i, n = 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        if c == "*":
+            j = i
+            while j < n and pattern[j] == "*":
+                j += 1
+            whole_segment = (i == 0 or pattern[i - 1] == "/") and (j == n or pattern[j] == "/")
+            if j - i >= 2 and whole_segment:
+                if j == n:
+                    out.append(".*")
+                else:
+                    out.append("(?:[^/]*/)*")
+                    j += 1
+            else:
+                out.append("[^/]*")
+            i = j
+        elif c == "?":
+            out.append("[^/]")
+            i += 1
+        elif c == "[" and pattern.find("]", i + 2) != -1:
+            j = pattern.find("]", i + 2)
+            body = pattern[i + 1:j]
+            negate = body[0] in "!^"
+            body = "".join("\\" + ch if ch in "\\[&~|" else ch for ch in (body[1:] if negate else body))
+            out.append(f"[{'^/' if negate else ''}{body}]")
+            i = j + 1
+        elif c == "\\" and i + 1 < n:
+            out.append(re.escape(pattern[i + 1]))
+            i += 2
+        else:
+            out.append(re.escape(c))
+            i += 1
+    return "".join(out)
+
+
+class GitIgnore:
+    """Minimal .gitignore matcher (globs, negation, anchoring, dir-only)."""
+
+    def __init__(self):
+        self.rules: List[tuple] = []
+
+    def add_file(self, base: str, filepath: str) -> None:
+        """Load rules from a .gitignore located in `base` (repo-relative)."""
+        try:
+            with open(filepath, encoding="utf-8", errors="replace") as f:
+                lines = f.read().splitlines()
+        except OSError:
+            return
+        for line in lines:
+            line = line.rstrip()
+            if not line or line.startswith("#"):
+                continue
+            negate = line.startswith("!")
+            if negate:
+                line = line[1:]
+            dir_only = line.endswith("/")
+            line = line.rstrip("/")
+            # A leading or inner slash anchors the pattern to `base`
+            anchored = "/" in line
+            line = line.lstrip("/")
+            if not line:
+                continue
+            prefix = re.escape(f"{base}/") if base and anchored else ""
+            regex = re.compile(prefix + _gitignore_glob(line) + r"\Z")
+            self.rules.append((regex, negate, dir_only, anchored, base))
+
+    def ignored(self, rel_path: str, is_dir: bool) -> bool:
+        """Return True when the last matching rule ignores `rel_path`."""
+        result = False
+        name = rel_path.rsplit("/", 1)[-1]
+        for regex, negate, dir_only, anchored, base in self.rules:
+            if dir_only and not is_dir:
+                continue
+            if base and not rel_path.startswith(base + "/"):
+                continue
+            target = rel_path if anchored else name
+            if regex.match(target):
+                result = not negate
+        return result
+
+
+class RepoIndex:
+    """
+    Single-pass index of a repository tree with a lazy content cache.
+
+    The tree is walked once with os.scandir, pruning PRUNED_DIRS and
+    anything matched by .gitignore files. Every scorer queries this index
+    instead of walking or re-reading files, so each file is stat'd and
+    read at most once per scoring run.
+    """
+
+    def __init__(self, repo_path: str, max_bytes: int = MAX_CONTENT_BYTES, walk: bool = True):
+        self.root = repo_path
+        self.max_bytes = max_bytes
+        self.files: List[str] = []
+        self.entries: Dict[str, bool] = {}
+        self.children: Dict[str, List[str]] = {}
+        self._content: Dict[str, Optional[str]] = {}
+        self._json: Dict[str, Any] = {}
+        self._digests: Dict[str, str] = {}
+        self._deps: Optional[Dict[str, Any]] = None
+        if walk:
+            self._walk()
+
+    def _walk(self) -> None:
+        ignore = GitIgnore()
+        stack = [""]
+        while stack:
+            rel_dir = stack.pop()
+            abs_dir = os.path.join(self.root, rel_dir) if rel_dir else self.root
+            try:
+                with os.scandir(abs_dir) as it:
+                    entries = sorted(it, key=lambda e: e.name)
+            except OSError:
+                continue
+
+            if any(e.name == ".gitignore" for e in entries):
+                ignore.add_file(rel_dir, os.path.join(abs_dir, ".gitignore"))
+
+            self.children[rel_dir] = [e.name for e in entries]
+            subdirs = []
+            for entry in entries:
+                rel = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                    is_file = not is_dir and entry.is_file()
+                except OSError:
+                    continue
+                if is_dir:
+                    self.entries[rel] = True
+                    if entry.name not in PRUNED_DIRS and not ignore.ignored(rel, True):
+                        subdirs.append(rel)
+                elif is_file:
+                    self.entries[rel] = False
+                    if not ignore.ignored(rel, False):
+                        self.files.append(rel)
+            # Reverse so the stack pops subdirectories in sorted order
+            stack.extend(reversed(subdirs))
+
+    # --- dependency tracking (used by ScoreCache) ---
+
+    def track(self) -> Dict[str, Any]:
+        """Start recording every path, listing and content a scorer consults."""
+        self._deps = {"exists": {}, "stat": {}, "lists": {}, "scandir": {}, "content": set()}
+        return self._deps
+
+    def untrack(self) -> None:
+        """Stop recording dependencies."""
+        self._deps = None
+
+    def record_read(self, rel_path: str) -> None:
+        """Record that the content of `rel_path` was consulted."""
+        if self._deps is not None:
+            self._deps["content"].add(rel_path)
+
+    def note_digest(self, rel_path: str, digest: str) -> None:
+        """Store the sha256 of a file whose full content was already read."""
+        self._digests.setdefault(rel_path, digest)
+
+    def _record_list(self, key: str, result: List[str]) -> List[str]:
+        if self._deps is not None:
+            self._deps["lists"][key] = _digest_lines(result)
+        return result
+
+    def _list(self, key: str) -> List[str]:
+        kind, _, args = key.partition("\0")
+        if kind == "dir":
+            return self.children.get(args, [])
+        values = tuple(args.split("\0"))
+        if kind == "suffix":
+            return [f for f in self.files if f.endswith(values)]
+        return [
+            f for f in self.files
+            if any(fnmatch.fnmatchcase(f.rsplit("/", 1)[-1], p) for p in values)
+        ]
+
+    def fingerprint(self, rel_path: str) -> Optional[Dict[str, Any]]:
+        """Return size, mtime_ns and sha256 of a file, or None if unreadable."""
+        abs_path = os.path.join(self.root, rel_path)
+        try:
+            st = os.stat(abs_path)
+            digest = self._digests.get(rel_path)
+            if digest is None:
+                digest = _sha256_file(abs_path)
+        except OSError:
+            return None
+        return {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "sha256": digest}
+
+    def deps_valid(self, deps: Dict[str, Any]) -> bool:
+        """Check whether recorded dependencies still hold for this tree."""
+        for rel_path, state in deps["exists"].items():
+            if self.entries.get(rel_path) != state:
+                return False
+        for key, digest in deps["lists"].items():
+            if _digest_lines(self._list(key)) != digest:
+                return False
+        for rel_path, old in deps["content"].items():
+            new = self.fingerprint_if_changed(rel_path, old)
+            if new is None or new["sha256"] != old["sha256"]:
+                return False
+        return True
+
+    def deps_valid_on_clean_tree(self, deps: Dict[str, Any]) -> bool:
+        """
+        Check the dependencies a clean HEAD^{tree} hash does not cover.
+
+        Gitignored paths can appear or change without touching the tree
+        hash or `git status --porcelain`, yet existence checks, directory
+        listings and reads still see them. Re-check those against the disk
+        directly; suffix/glob listings skip ignored files and need no
+        check. Works on an index built with walk=False.
+        """
+        if "stat" not in deps or "scandir" not in deps:
+            return False
+        for rel_path, state in deps["stat"].items():
+            if _path_state(self.root, rel_path) != state:
+                return False
+        for rel_dir, digest in deps["scandir"].items():
+            if _digest_lines(_scandir_names(self.root, rel_dir)) != digest:
+                return False
+        for rel_path, old in deps["content"].items():
+            new = self.fingerprint_if_changed(rel_path, old)
+            if new is None or new["sha256"] != old["sha256"]:
+                return False
+        return True
+
+    def fingerprint_if_changed(self, rel_path: str, old: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Reuse `old` when size and mtime are unchanged, else re-hash the file."""
+        if old is None:
+            return None
+        try:
+            st = os.stat(os.path.join(self.root, rel_path))
+        except OSError:
+            return None
+        if st.st_size == old["size"] and st.st_mtime_ns == old["mtime_ns"]:
+            return old
+        return self.fingerprint(rel_path)
+
+    def export_deps(self, deps: Dict[str, Any]) -> Dict[str, Any]:
+        """Turn recorded dependencies into a JSON-serialisable manifest."""
+        return {
+            "exists": dict(deps["exists"]),
+            "stat": dict(deps["stat"]),
+            "lists": dict(deps["lists"]),
+            "scandir": dict(deps["scandir"]),
+            "content": {rel: self.fingerprint(rel) for rel in sorted(deps["content"])},
+        }
+
+    # --- queries ---
+
+    def is_file(self, rel_path: str) -> bool:
+        """Check if a repo-relative file exists."""
+        if self._deps is not None:
+            self._deps["exists"][rel_path] = self.entries.get(rel_path)
+            self._deps["stat"][rel_path] = _path_state(self.root, rel_path)
+        return self.entries.get(rel_path) is False
+
+    def is_dir(self, rel_path: str) -> bool:
+        """Check if a repo-relative directory exists."""
+        if self._deps is not None:
+            self._deps["exists"][rel_path] = self.entries.get(rel_path)
+            self._deps["stat"][rel_path] = _path_state(self.root, rel_path)
+        return self.entries.get(rel_path) is True
+
+    def listdir(self, rel_path: str) -> List[str]:
+        """Return entry names of an indexed directory."""
+        key = f"dir\0{rel_path}"
+        if self._deps is not None:
+            self._deps["scandir"][rel_path] = _digest_lines(_scandir_names(self.root, rel_path))
+        return self._record_list(key, self._list(key))
+
+    def with_suffix(self, *suffixes: str) -> List[str]:
+        """Return indexed files whose name ends with any of `suffixes`."""
+        key = "\0".join(("suffix",) + suffixes)
+        return self._record_list(key, self._list(key))
+
+    def matching(self, *patterns: str) -> List[str]:
+        """Return indexed files whose basename matches any glob pattern."""
+        key = "\0".join(("glob",) + patterns)
+        return self._record_list(key, self._list(key))
+
+    def read(self, rel_path: str) -> Optional[str]:
+        """Return file content (capped at max_bytes), or None if unreadable."""
+        self.record_read(rel_path)
+        if rel_path not in self._content:
+            try:
+                with open(os.path.join(self.root, rel_path), "rb") as f:
+                    data = f.read(self.max_bytes)
+                if len(data) < self.max_bytes:
+                    self.note_digest(rel_path, hashlib.sha256(data).hexdigest())
+                self._content[rel_path] = data.decode("utf-8", errors="replace")
+            except OSError:
+                self._content[rel_path] = None
+        return self._content[rel_path]
+
+    def load_json(self, rel_path: str) -> Optional[Any]:
+        """Return parsed JSON content, or None if missing or invalid."""
+        content = self.read(rel_path)
+        if rel_path not in self._json:
+            try:
+                self._json[rel_path] = json.loads(content) if content is not None else None
+            except json.JSONDecodeError:
+                self._json[rel_path] = None
+        return self._json[rel_path]
+
+    def remember(self, rel_path: str, content: str) -> None:
+        """Seed the content cache with text already read by another reader."""
+        if rel_path not in self._content and len(content) <= self.max_bytes:
+            self._content[rel_path] = content
+
+
+def _digest_lines(lines: List[str]) -> str:
+    return hashlib.sha256("\n".join(lines).encode("utf-8")).hexdigest()
+
+
+def _path_state(root: str, rel_path: str) -> Optional[bool]:
+    """On-disk state as RepoIndex.entries records it: True dir, False file, None neither."""
+    abs_path = os.path.join(root, rel_path)
+    if os.path.isdir(abs_path) and not os.path.islink(abs_path):
+        return True
+    return False if os.path.isfile(abs_path) else None
+
+
+def _scandir_names(root: str, rel_dir: str) -> List[str]:
+    """Sorted entry names of a directory, as RepoIndex.children records them."""
+    try:
+        return sorted(os.listdir(os.path.join(root, rel_dir) if rel_dir else root))
+    except OSError:
+        return []
+
+
+def _sha256_file(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+# ============================================================
+# Secret Scanner
+# ============================================================
+
+# Hardcoded-secret patterns, keyed by the name reported in findings
+SECRET_PATTERNS = {
+    "api_key": r'api[_-]?key\s*=\s*["\'][^"\']+["\']',
+    "secret_key": r'secret[_-]?key\s*=\s*["\'][^"\']+["\']',
+    "password": r'password\s*=\s*["\'][^"\']+["\']',
+}
+
+# Source files searched for hardcoded secrets
+SECRET_SCAN_SUFFIXES = ('.py', '.js', '.ts', '.go', '.rs')
+
+# Streaming window: chunk size and the overlap carried between chunks
+SCAN_CHUNK_BYTES = 256 * 1024
+SCAN_OVERLAP_CHARS = 4 * 1024
+
+
+class SecretScanner:
+    """
+    Streaming hardcoded-secret scanner.
+
+    All SECRET_PATTERNS are combined into one compiled alternation with a
+    named group per pattern. Files are decoded incrementally in fixed-size
+    chunks with an overlapping tail so matches spanning a chunk boundary
+    are still found, and huge minified bundles are never loaded whole.
+    A chunk is only handed to the regex when it contains one of the
+    literal anchors every pattern starts with.
+    """
+
+    ANCHORS = ("api", "secret", "password")
+
+    def __init__(self, patterns: Optional[Dict[str, str]] = None):
+        patterns = patterns if patterns is not None else SECRET_PATTERNS
+        self.regex = re.compile(
+            "|".join(f"(?P<{name}>{pattern})" for name, pattern in patterns.items()),
+            re.IGNORECASE,
+        )
+
+    def scan_file(self, index: RepoIndex, rel_path: str, first_only: bool = False) -> List[Dict[str, Any]]:
+        """Return hits in one file as {file, line, pattern} records."""
+        hits: List[Dict[str, Any]] = []
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        tail = ""
+        line_base = 1
+        hasher = hashlib.sha256()
+        index.record_read(rel_path)
+        try:
+            with open(os.path.join(index.root, rel_path), "rb") as f:
+                first = True
+                while True:
+                    data = f.read(SCAN_CHUNK_BYTES)
+                    hasher.update(data)
+                    window = tail + decoder.decode(data, final=not data)
+                    if first and len(data) < SCAN_CHUNK_BYTES:
+                        # Whole file fit in one chunk: share it with other scorers
+                        index.remember(rel_path, window)
+                    first = False
+
+                    lowered = window.lower()
+                    if any(anchor in lowered for anchor in self.ANCHORS):
+                        for match in self.regex.finditer(window):
+                            # Matches entirely inside the carried tail were already reported
+                            if match.end() <= len(tail):
+                                continue
+                            hits.append({
+                                "file": rel_path,
+                                "line": line_base + window.count("\n", 0, match.start()),
+                                "pattern": match.lastgroup,
+                            })
+                            if first_only:
+                                return hits
+
+                    if not data:
+                        index.note_digest(rel_path, hasher.hexdigest())
+                        break
+                    tail = window[-SCAN_OVERLAP_CHARS:]
+                    line_base += window.count("\n", 0, len(window) - len(tail))
+        except OSError:
+            pass
+        return hits
+
+    def scan(self, index: RepoIndex, first_only: bool = False) -> List[Dict[str, Any]]:
+        """
+        Scan every indexed source file.
+
+        With first_only=True the scan stops at the first hit, which is all
+        the security score needs to decide its outcome.
+        """
+        hits: List[Dict[str, Any]] = []
+        for rel_path in index.with_suffix(*SECRET_SCAN_SUFFIXES):
+            hits.extend(self.scan_file(index, rel_path, first_only))
+            if first_only and hits:
+                break
+        return hits
+
+
 # ============================================================
 # Documentation Scoring (25 pts)
 # ============================================================
 
-def score_documentation(repo_path: str) -> Dict[str, Any]:
+def score_documentation(repo_path: str, index: Optional[RepoIndex] = None) -> Dict[str, Any]:
     """Score documentation quality."""
+    index = index or RepoIndex(repo_path)
     scores: Dict[str, Any] = {
         "readme_completeness": 0,
         "api_documentation": 0,
@@ -112,10 +758,8 @@ def score_documentation(repo_path: str) -> Dict[str, Any]:
         "inline_documentation": 0,
     }
 
-    readme_path = os.path.join(repo_path, "README.md")
-    if os.path.exists(readme_path):
-        with open(readme_path) as f:
-            readme_content = f.read().lower()
+    if index.is_file("README.md"):
+        readme_content = (index.read("README.md") or "").lower()
 
         # README Completeness (12 pts)
         # Project title and description (2 pts)
@@ -148,17 +792,11 @@ def score_documentation(repo_path: str) -> Dict[str, Any]:
 
         # API Documentation (5 pts)
         # Function/method docstrings check (heuristic - look for docstring patterns)
-        python_files = list(Path(repo_path).rglob("*.py"))
+        python_files = index.with_suffix(".py")
+        sampled = [c for c in (index.read(f) for f in python_files[:10]) if c is not None]  # Check first 10 files
         docstring_count = 0
-        for py_file in python_files[:10]:  # Check first 10 files
-            try:
-                with open(py_file) as f:
-                    content = f.read()
-                    # Count function definitions with docstrings
-                    func_count = len(re.findall(r'def \w+\(', content))
-                    docstring_count += len(re.findall(r'"""[\s\S]*?"""|\'\'\'[\s\S]*?\'\'\'', content))
-            except Exception:
-                pass
+        for content in sampled:
+            docstring_count += len(re.findall(r'"""[\s\S]*?"""|\'\'\'[\s\S]*?\'\'\'', content))
 
         if docstring_count > 0 and len(python_files) > 0:
             # Calculate ratio
@@ -167,56 +805,41 @@ def score_documentation(repo_path: str) -> Dict[str, Any]:
 
         # Type annotations (1 pt)
         type_annotations = 0
-        for py_file in python_files[:10]:
-            try:
-                with open(py_file) as f:
-                    content = f.read()
-                    if re.search(r': \w+', content) or re.search(r'-> \w+', content):
-                        type_annotations += 1
-            except Exception:
-                pass
+        for content in sampled:
+            if re.search(r': \w+', content) or re.search(r'-> \w+', content):
+                type_annotations += 1
 
         if type_annotations > 0:
             scores["api_documentation"] += 1
 
         # Generated API docs (2 pts)
-        if check_directory_exists(os.path.join(repo_path, "docs")) or \
-           check_file_exists(os.path.join(repo_path, "docs/index.md")) or \
-           check_file_exists(os.path.join(repo_path, "api.md")):
+        if index.is_dir("docs") or index.is_file("docs/index.md") or index.is_file("api.md"):
             scores["api_documentation"] += 2
 
         # Additional Docs (5 pts)
         # CONTRIBUTING.md exists (2 pts)
-        if check_file_exists(os.path.join(repo_path, "CONTRIBUTING.md")):
+        if index.is_file("CONTRIBUTING.md"):
             scores["additional_docs"] += 2
 
         # Architecture/design docs (1 pt)
-        if check_file_exists(os.path.join(repo_path, "ARCHITECTURE.md")) or \
-           check_file_exists(os.path.join(repo_path, "docs/architecture.md")):
+        if index.is_file("ARCHITECTURE.md") or index.is_file("docs/architecture.md"):
             scores["additional_docs"] += 1
 
         # Changelog (1 pt)
-        if check_file_exists(os.path.join(repo_path, "CHANGELOG.md")) or \
-           check_file_exists(os.path.join(repo_path, "HISTORY.md")):
+        if index.is_file("CHANGELOG.md") or index.is_file("HISTORY.md"):
             scores["additional_docs"] += 1
 
         # Examples directory (1 pt)
-        if check_directory_exists(os.path.join(repo_path, "examples")) or \
-           check_directory_exists(os.path.join(repo_path, "example")):
+        if index.is_dir("examples") or index.is_dir("example"):
             scores["additional_docs"] += 1
 
         # Inline Documentation (3 pts)
         # Comment density (heuristic - check Python files)
         comment_density = 0
-        for py_file in python_files[:10]:
-            try:
-                with open(py_file) as f:
-                    lines = f.readlines()
-                    total_lines = len(lines)
-                    comment_lines = len([l for l in lines if l.strip().startswith('#')])
-                    comment_density += comment_lines / max(total_lines, 1)
-            except Exception:
-                pass
+        for content in sampled:
+            lines = content.splitlines()
+            comment_lines = len([l for l in lines if l.strip().startswith('#')])
+            comment_density += comment_lines / max(len(lines), 1)
 
         if comment_density > 0 and len(python_files) > 0:
             avg_density = comment_density / len(python_files)
@@ -232,8 +855,18 @@ def score_documentation(repo_path: str) -> Dict[str, Any]:
 # Security Scoring (25 pts)
 # ============================================================
 
-def score_security(repo_path: str) -> Dict[str, Any]:
-    """Score security practices."""
+def score_security(
+    repo_path: str,
+    index: Optional[RepoIndex] = None,
+    secret_findings: Optional[List[Dict[str, Any]]] = None,
+) -> Dict[str, Any]:
+    """
+    Score security practices.
+
+    When `secret_findings` is a list, every hardcoded-secret hit is
+    appended to it instead of stopping at the first one.
+    """
+    index = index or RepoIndex(repo_path)
     scores = {
         "security_policy": 0,
         "dependency_management": 0,
@@ -242,101 +875,80 @@ def score_security(repo_path: str) -> Dict[str, Any]:
     }
 
     # Security Policy (8 pts)
-    security_md_path = os.path.join(repo_path, "SECURITY.md")
-    if check_file_exists(security_md_path):
+    if index.is_file("SECURITY.md"):
         scores["security_policy"] += 3
 
         # Check for vulnerability reporting process
-        with open(security_md_path) as f:
-            security_content = f.read().lower()
-            if "vulnerability" in security_content or "report" in security_content:
-                scores["security_policy"] += 2
+        security_content = (index.read("SECURITY.md") or "").lower()
+        if "vulnerability" in security_content or "report" in security_content:
+            scores["security_policy"] += 2
 
-            # Check for supported versions
-            if "version" in security_content or "support" in security_content:
-                scores["security_policy"] += 2
+        # Check for supported versions
+        if "version" in security_content or "support" in security_content:
+            scores["security_policy"] += 2
 
-            # Check for security contact
-            if "email" in security_content or "contact" in security_content:
-                scores["security_policy"] += 1
+        # Check for security contact
+        if "email" in security_content or "contact" in security_content:
+            scores["security_policy"] += 1
 
     # Dependency Management (8 pts)
     # Dependabot/Renovate configured (3 pts)
-    dependabot_path = os.path.join(repo_path, ".github/dependabot.yml")
-    renovate_path = os.path.join(repo_path, ".github/renovate.json")
-    if check_file_exists(dependabot_path) or check_file_exists(renovate_path):
+    dependabot_path = ".github/dependabot.yml"
+    if index.is_file(dependabot_path) or index.is_file(".github/renovate.json"):
         scores["dependency_management"] += 3
 
     # Dependency lockfiles present (2 pts)
     lockfiles = ["package-lock.json", "yarn.lock", "requirements.lock", "Pipfile.lock",
                  "Cargo.lock", "go.sum", "composer.lock"]
-    if any(check_file_exists(os.path.join(repo_path, lf)) for lf in lockfiles):
+    if any(index.is_file(lf) for lf in lockfiles):
         scores["dependency_management"] += 2
 
     # Code scanning (6 pts)
     # CodeQL or equivalent enabled (3 pts)
-    workflows_dir = os.path.join(repo_path, ".github/workflows")
-    codeql_workflow = os.path.join(workflows_dir, "codeql.yml")
-    if check_file_exists(codeql_workflow):
+    workflows_dir = ".github/workflows"
+    if index.is_file(f"{workflows_dir}/codeql.yml"):
         scores["code_scanning"] += 3
-    elif check_directory_exists(workflows_dir):
+    elif index.is_dir(workflows_dir):
         # Check for any security-related workflow
-        for wf in os.listdir(workflows_dir):
+        for wf in index.listdir(workflows_dir):
             if "security" in wf.lower() or "scan" in wf.lower():
                 scores["code_scanning"] += 2
                 break
 
     # SAST tool configured (2 pts)
     sast_tools = [".secrets.baseline", ".eslintignore", ".golangci.yml"]
-    if any(check_file_exists(os.path.join(repo_path, st)) for st in sast_tools):
+    if any(index.is_file(st) for st in sast_tools):
         scores["code_scanning"] += 2
 
     # Secret scanning enabled (1 pt)
-    if check_file_exists(dependabot_path):
-        with open(dependabot_path) as f:
-            if "secret" in f.read().lower():
-                scores["code_scanning"] += 1
+    if index.is_file(dependabot_path):
+        if "secret" in (index.read(dependabot_path) or "").lower():
+            scores["code_scanning"] += 1
 
     # Best Practices (3 pts)
     # No hardcoded secrets (heuristic check)
-    secrets_found = False
-    sensitive_patterns = [
-        r'api[_-]?key\s*=\s*["\'][^"\']+["\']',
-        r'secret[_-]?key\s*=\s*["\'][^"\']+["\']',
-        r'password\s*=\s*["\'][^"\']+["\']',
-    ]
-    for pattern in sensitive_patterns:
-        for root, dirs, files in os.walk(repo_path):
-            for file in files:
-                if file.endswith(('.py', '.js', '.ts', '.go', '.rs')):
-                    try:
-                        with open(os.path.join(root, file)) as f:
-                            if re.search(pattern, f.read(), re.IGNORECASE):
-                                secrets_found = True
-                    except Exception:
-                        pass
+    # Stop at the first hit unless the caller asked for every finding
+    hits = SecretScanner().scan(index, first_only=secret_findings is None)
+    if secret_findings is not None:
+        secret_findings.extend(hits)
 
-    if not secrets_found:
+    if not hits:
         scores["best_practices"] += 1
 
     # Input validation check (heuristic)
     validation_found = False
-    for py_file in Path(repo_path).rglob("*.py"):
-        try:
-            with open(py_file) as f:
-                content = f.read()
-                if re.search(r'validate|check.*input|sanitize', content, re.IGNORECASE):
-                    validation_found = True
-                    break
-        except Exception:
-            pass
+    for py_file in index.with_suffix(".py"):
+        content = index.read(py_file)
+        if content and re.search(r'validate|check.*input|sanitize', content, re.IGNORECASE):
+            validation_found = True
+            break
 
     if validation_found:
         scores["best_practices"] += 1
 
     # Secure defaults (heuristic - check for config files)
     config_files = ["settings.py", "config.py", "config.yml", "config.yaml", "config.json"]
-    if any(check_file_exists(os.path.join(repo_path, cf)) for cf in config_files):
+    if any(index.is_file(cf) for cf in config_files):
         scores["best_practices"] += 1
 
     return scores
@@ -346,8 +958,9 @@ def score_security(repo_path: str) -> Dict[str, Any]:
 # CI/CD Scoring (25 pts)
 # ============================================================
 
-def score_cicd(repo_path: str) -> Dict[str, Any]:
+def score_cicd(repo_path: str, index: Optional[RepoIndex] = None) -> Dict[str, Any]:
     """Score CI/CD setup."""
+    index = index or RepoIndex(repo_path)
     scores = {
         "automated_testing": 0,
         "continuous_integration": 0,
@@ -355,49 +968,36 @@ def score_cicd(repo_path: str) -> Dict[str, Any]:
         "deployment": 0,
     }
 
-    workflows_dir = os.path.join(repo_path, ".github/workflows")
+    workflows_dir = ".github/workflows"
+    pkg = index.load_json("package.json") if index.is_file("package.json") else None
 
     # Automated Testing (10 pts)
     # Test suite exists (3 pts)
-    has_test_suite = False
-    if check_directory_exists(os.path.join(repo_path, "tests")) or \
-       check_directory_exists(os.path.join(repo_path, "test")):
-        has_test_suite = True
+    has_test_suite = index.is_dir("tests") or index.is_dir("test")
 
     # Check for test files
-    test_files = list(Path(repo_path).rglob("test_*.py")) + \
-                 list(Path(repo_path).rglob("*_test.py")) + \
-                 list(Path(repo_path).rglob("*.spec.ts")) + \
-                 list(Path(repo_path).rglob("*.test.ts"))
+    test_files = index.matching("test_*.py", "*_test.py", "*.spec.ts", "*.test.ts")
 
     if len(test_files) > 0 or has_test_suite:
         scores["automated_testing"] += 3
 
     # Tests pass check (heuristic - look for test command in package.json or Makefile)
     tests_pass = False
-    if check_file_exists(os.path.join(repo_path, "package.json")):
-        with open(os.path.join(repo_path, "package.json")) as f:
-            pkg = json.load(f)
-            if "test" in pkg.get("scripts", {}):
-                tests_pass = True
+    if isinstance(pkg, dict) and "test" in pkg.get("scripts", {}):
+        tests_pass = True
 
     if tests_pass:
         scores["automated_testing"] += 3
 
     # Code coverage >70% (heuristic - look for coverage config)
     coverage_found = False
-    coverage_files = [
-        os.path.join(repo_path, ".coveragerc"),
-        os.path.join(repo_path, "pyproject.toml"),
-        os.path.join(repo_path, ".coveragerc"),
-        os.path.join(workflows_dir, "test.yml") if check_directory_exists(workflows_dir) else None,
-    ]
+    coverage_files = [".coveragerc", "pyproject.toml", f"{workflows_dir}/test.yml"]
     for cf in coverage_files:
-        if cf and check_file_exists(cf):
-            with open(cf) as f:
-                if "coverage" in f.read().lower() or "pytest-cov" in f.read().lower():
-                    coverage_found = True
-                    break
+        if index.is_file(cf):
+            content = (index.read(cf) or "").lower()
+            if "coverage" in content or "pytest-cov" in content:
+                coverage_found = True
+                break
 
     # Coverage >90% (additional 2 pts) - heuristic
     if coverage_found:
@@ -406,29 +1006,21 @@ def score_cicd(repo_path: str) -> Dict[str, Any]:
     # Continuous Integration (8 pts)
     # CI workflow configured (3 pts)
     ci_workflows = [
-        os.path.join(workflows_dir, "test.yml"),
-        os.path.join(workflows_dir, "ci.yml"),
-        os.path.join(workflows_dir, "build.yml"),
+        f"{workflows_dir}/test.yml",
+        f"{workflows_dir}/ci.yml",
+        f"{workflows_dir}/build.yml",
     ]
-    if any(check_file_exists(wf) for wf in ci_workflows):
+    ci_contents = [index.read(wf) or "" for wf in ci_workflows if index.is_file(wf)]
+    if ci_contents:
         scores["continuous_integration"] += 3
 
     # Runs on PR (2 pts)
-    for wf in ci_workflows:
-        if check_file_exists(wf):
-            with open(wf) as f:
-                if "pull_request" in f.read() or "push" in f.read():
-                    scores["continuous_integration"] += 2
-                    break
+    if any("pull_request" in c or "push" in c for c in ci_contents):
+        scores["continuous_integration"] += 2
 
     # Multiple OS/versions tested (2 pts)
-    for wf in ci_workflows:
-        if check_file_exists(wf):
-            with open(wf) as f:
-                content = f.read()
-                if "matrix" in content or "python-version" in content or "node-version" in content:
-                    scores["continuous_integration"] += 2
-                    break
+    if any("matrix" in c or "python-version" in c or "node-version" in c for c in ci_contents):
+        scores["continuous_integration"] += 2
 
     # Status checks required for merge (1 pt) - heuristic
     # Check if there's a branch protection pattern in workflows
@@ -438,7 +1030,7 @@ def score_cicd(repo_path: str) -> Dict[str, Any]:
     # Linter configured (2 pts)
     linters = [".flake8", ".eslintrc.json", ".eslintrc.yml", "pyproject.toml",
                ".golangci.yml", "Cargo.toml"]
-    if any(check_file_exists(os.path.join(repo_path, l)) for l in linters):
+    if any(index.is_file(l) for l in linters):
         scores["code_quality"] += 2
 
     # Linter passing (heuristic)
@@ -446,29 +1038,22 @@ def score_cicd(repo_path: str) -> Dict[str, Any]:
 
     # Formatter configured (1 pt)
     formatters = [".prettierrc", "pyproject.toml", "ruff.toml", ".EditorConfig"]
-    if any(check_file_exists(os.path.join(repo_path, f)) for f in formatters):
+    if any(index.is_file(f) for f in formatters):
         scores["code_quality"] += 1
 
     # Deployment (3 pts)
     # Automated release workflow (2 pts)
-    release_workflows = [
-        os.path.join(workflows_dir, "release.yml"),
-        os.path.join(workflows_dir, "publish.yml"),
-    ]
-    if any(check_file_exists(wf) for wf in release_workflows):
+    release_workflows = [f"{workflows_dir}/release.yml", f"{workflows_dir}/publish.yml"]
+    if any(index.is_file(wf) for wf in release_workflows):
         scores["deployment"] += 2
 
     # Package published (heuristic - look for package registry config)
     published = False
-    if check_file_exists(os.path.join(repo_path, "package.json")):
-        with open(os.path.join(repo_path, "package.json")) as f:
-            pkg = json.load(f)
-            if pkg.get("publishConfig") or pkg.get("homepage"):
-                published = True
-    if check_file_exists(os.path.join(repo_path, "pyproject.toml")):
-        with open(os.path.join(repo_path, "pyproject.toml")) as f:
-            if "pypi" in f.read().lower():
-                published = True
+    if isinstance(pkg, dict) and (pkg.get("publishConfig") or pkg.get("homepage")):
+        published = True
+    if index.is_file("pyproject.toml"):
+        if "pypi" in (index.read("pyproject.toml") or "").lower():
+            published = True
 
     if published:
         scores["deployment"] += 1
@@ -480,8 +1065,23 @@ def score_cicd(repo_path: str) -> Dict[str, Any]:
 # Community Scoring (25 pts)
 # ============================================================
 
-def score_community(repo_path: str) -> Dict[str, Any]:
+def get_git_activity(repo_path: str, git: Optional[GitMetadata] = None) -> Dict[str, bool]:
+    """Derive the git-history signals used by community scoring."""
+    log = (git or GitMetadata(repo_path)).log
+    recent = False
+    if log["last_commit"] is not None:
+        days_since = (datetime.now().timestamp() - log["last_commit"]) / 86400
+        recent = days_since < 30
+    return {"recent_commit": recent, "multiple_contributors": log["multiple_authors"]}
+
+
+def score_community(
+    repo_path: str,
+    index: Optional[RepoIndex] = None,
+    git_activity: Optional[Dict[str, bool]] = None,
+) -> Dict[str, Any]:
     """Score community health."""
+    index = index or RepoIndex(repo_path)
     scores = {
         "license": 0,
         "contribution_process": 0,
@@ -491,111 +1091,268 @@ def score_community(repo_path: str) -> Dict[str, Any]:
 
     # License (6 pts)
     license_files = ["LICENSE", "LICENSE.md", "LICENSE.txt"]
-    if any(check_file_exists(os.path.join(repo_path, lf)) for lf in license_files):
+    if any(index.is_file(lf) for lf in license_files):
         scores["license"] += 3
 
         # Check for OSI-approved license
         for lf in license_files:
-            if check_file_exists(os.path.join(repo_path, lf)):
-                with open(os.path.join(repo_path, lf)) as f:
-                    content = f.read()
-                    if any(lic in content for lic in ["MIT", "Apache", "GPL", "BSD", "ISC", "BSD-3-Clause"]):
-                        scores["license"] += 2
-                    break
+            if index.is_file(lf):
+                content = index.read(lf) or ""
+                if any(lic in content for lic in ["MIT", "Apache", "GPL", "BSD", "ISC", "BSD-3-Clause"]):
+                    scores["license"] += 2
+                break
 
         # License in package manifest (1 pt)
-        if check_file_exists(os.path.join(repo_path, "package.json")):
-            with open(os.path.join(repo_path, "package.json")) as f:
-                if "license" in json.load(f):
-                    scores["license"] += 1
+        pkg = index.load_json("package.json") if index.is_file("package.json") else None
+        if isinstance(pkg, dict) and "license" in pkg:
+            scores["license"] += 1
 
     # Contribution Process (8 pts)
     # CONTRIBUTING.md present (3 pts)
-    if check_file_exists(os.path.join(repo_path, "CONTRIBUTING.md")):
+    if index.is_file("CONTRIBUTING.md"):
         scores["contribution_process"] += 3
 
     # Clear contribution workflow (2 pts)
-    if check_file_exists(os.path.join(repo_path, "CONTRIBUTING.md")):
-        with open(os.path.join(repo_path, "CONTRIBUTING.md")) as f:
-            content = f.read().lower()
-            if "fork" in content and "pull" in content:
-                scores["contribution_process"] += 2
+    if index.is_file("CONTRIBUTING.md"):
+        content = (index.read("CONTRIBUTING.md") or "").lower()
+        if "fork" in content and "pull" in content:
+            scores["contribution_process"] += 2
 
     # Issue/PR templates (2 pts)
-    issue_templates = [
-        os.path.join(repo_path, ".github/ISSUE_TEMPLATE"),
-        os.path.join(repo_path, ".github/PULL_REQUEST_TEMPLATE.md"),
-    ]
-    if any(check_directory_exists(t) or check_file_exists(t) for t in issue_templates):
+    issue_templates = [".github/ISSUE_TEMPLATE", ".github/PULL_REQUEST_TEMPLATE.md"]
+    if any(index.is_dir(t) or index.is_file(t) for t in issue_templates):
         scores["contribution_process"] += 2
 
     # Code of Conduct (1 pt)
-    if check_file_exists(os.path.join(repo_path, "CODE_OF_CONDUCT.md")):
+    if index.is_file("CODE_OF_CONDUCT.md"):
         scores["contribution_process"] += 1
 
     # Community Health (6 pts)
     # CODE_OF_CONDUCT.md (3 pts)
-    if check_file_exists(os.path.join(repo_path, "CODE_OF_CONDUCT.md")):
+    if index.is_file("CODE_OF_CONDUCT.md"):
         scores["community_health"] += 3
 
     # Active maintenance (1 pt) - check recent commits
-    try:
-        result = subprocess.run(
-            ["git", "log", "-1", "--format=%ct"],
-            capture_output=True,
-            text=True,
-            timeout=5,
-            cwd=repo_path,
-        )
-        if result.returncode == 0:
-            last_commit = int(result.stdout.strip())
-            current_time = datetime.now().timestamp()
-            days_since = (current_time - last_commit) / 86400
-            if days_since < 30:
-                scores["community_health"] += 1
-    except Exception:
-        pass
+    git_activity = git_activity if git_activity is not None else get_git_activity(repo_path)
+    if git_activity["recent_commit"]:
+        scores["community_health"] += 1
 
     # Multiple contributors (1 pt) - heuristic
-    try:
-        result = subprocess.run(
-            ["git", "shortlog", "-sn", "HEAD"],
-            capture_output=True,
-            text=True,
-            timeout=5,
-            cwd=repo_path,
-        )
-        if result.returncode == 0:
-            contributors = len(result.stdout.strip().split("\n"))
-            if contributors > 1:
-                scores["community_health"] += 1
-    except Exception:
-        pass
+    if git_activity["multiple_contributors"]:
+        scores["community_health"] += 1
 
     # Documentation Quality (5 pts)
     # README professionally written (2 pts)
-    if check_file_exists(os.path.join(repo_path, "README.md")):
+    if index.is_file("README.md"):
         scores["documentation_quality"] += 2
 
     # No broken links (heuristic - skip for now, would need external check)
     scores["documentation_quality"] += 1
 
     # Badges up-to-date (1 pt)
-    if check_file_exists(os.path.join(repo_path, "README.md")):
-        with open(os.path.join(repo_path, "README.md")) as f:
-            content = f.read()
-            if "shields.io" in content or "img.shields.io" in content:
-                scores["documentation_quality"] += 1
+    if index.is_file("README.md"):
+        content = index.read("README.md") or ""
+        if "shields.io" in content or "img.shields.io" in content:
+            scores["documentation_quality"] += 1
 
     return scores
 
 
+# ============================================================
+# Score Cache
+# ============================================================
+
+# Bump whenever a scoring rule changes so cached breakdowns are discarded
+SCORER_VERSION = "1"
+
+CACHE_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS category_results (
+    scope TEXT NOT NULL,
+    category TEXT NOT NULL,
+    scorer_version TEXT NOT NULL,
+    breakdown TEXT NOT NULL,
+    deps TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    PRIMARY KEY (scope, category, scorer_version)
+);
+"""
+
+
+def default_cache_dir() -> str:
+    """Return the default cache directory ($XDG_CACHE_HOME/repo-structure)."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "repo-structure")
+
+
+def get_clean_tree_hash(repo_path: str, git: Optional[GitMetadata] = None) -> Optional[str]:
+    """
+    Return `HEAD^{tree}` when the working tree is clean.
+
+    Uncommitted or untracked changes are not part of the tree object, so
+    a dirty working tree returns None and falls back to per-file checks.
+    """
+    git = git or GitMetadata(repo_path)
+    if not git.is_clean():
+        return None
+    return git.tree_hash or None
+
+
+class ScoreCache:
+    """
+    Persistent SQLite cache of per-category score breakdowns.
+
+    Each entry stores the breakdown plus the dependency manifest recorded
+    while scoring it: existence checks, file listings and the sha256 of
+    every file read (and, for community, the git-activity signals).
+    Entries live under two scopes: `tree:<HEAD^{tree}>` for clean
+    checkouts, reused without walking the tree once the gitignored
+    paths they consulted still stat, list and hash the same, and
+    `repo:<abs path>` for everything else, reused per category when its
+    dependencies still hold.
+    """
+
+    def __init__(self, cache_dir: str):
+        os.makedirs(cache_dir, exist_ok=True)
+        self.conn = sqlite3.connect(os.path.join(cache_dir, "scores.sqlite3"), timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(CACHE_SCHEMA_SQL)
+
+    def load(self, scope: str) -> Dict[str, Dict[str, Any]]:
+        """Return {category: {"breakdown", "deps"}} stored for `scope`."""
+        rows = self.conn.execute(
+            "SELECT category, breakdown, deps FROM category_results WHERE scope = ? AND scorer_version = ?",
+            (scope, SCORER_VERSION),
+        )
+        return {
+            category: {"breakdown": json.loads(breakdown), "deps": json.loads(deps)}
+            for category, breakdown, deps in rows
+        }
+
+    def store(self, scope: str, entries: Dict[str, Dict[str, Any]]) -> None:
+        """Insert or replace the category entries of `scope`."""
+        now = datetime.utcnow().isoformat() + "Z"
+        with self.conn:
+            self.conn.executemany(
+                """
+                INSERT OR REPLACE INTO category_results
+                    (scope, category, scorer_version, breakdown, deps, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    (scope, category, SCORER_VERSION,
+                     json.dumps(entry["breakdown"], sort_keys=True),
+                     json.dumps(entry["deps"], sort_keys=True), now)
+                    for category, entry in entries.items()
+                ],
+            )
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+def score_categories(
+    repo_path: str,
+    cache: Optional[ScoreCache] = None,
+    secret_findings: Optional[List[Dict[str, Any]]] = None,
+    git: Optional[GitMetadata] = None,
+) -> Tuple[Dict[str, Dict[str, Any]], List[str]]:
+    """
+    Compute the breakdown of every category, reusing cached ones when valid.
+
+    Returns (breakdowns, reused categories). The repository is only walked
+    when at least one category has to be validated or recomputed.
+    """
+    categories = ["documentation", "security", "ci_cd", "community"]
+    git = git or GitMetadata(repo_path)
+    git_activity = get_git_activity(repo_path, git)
+    tree_hash = get_clean_tree_hash(repo_path, git) if cache else None
+    repo_scope = f"repo:{repo_path}"
+
+    cached: Dict[str, Dict[str, Any]] = {}
+    trusted = False
+    if cache and tree_hash:
+        cached = cache.load(f"tree:{tree_hash}")
+        trusted = len(cached) == len(categories)
+    if cache and not trusted:
+        cached = cache.load(repo_scope)
+
+    index: Optional[RepoIndex] = None
+    probe: Optional[RepoIndex] = None
+    breakdowns: Dict[str, Dict[str, Any]] = {}
+    entries: Dict[str, Dict[str, Any]] = {}
+    reused: List[str] = []
+
+    for category in categories:
+        entry = cached.get(category)
+        if category == "security" and secret_findings is not None:
+            # Findings are not cached, so a detailed scan always runs
+            entry = None
+        if entry is not None and entry["deps"].get("git", git_activity) != git_activity:
+            entry = None
+        if entry is not None and not trusted:
+            index = index or RepoIndex(repo_path)
+            if not index.deps_valid(entry["deps"]):
+                entry = None
+        if entry is not None and trusted:
+            probe = probe or RepoIndex(repo_path, walk=False)
+            if not probe.deps_valid_on_clean_tree(entry["deps"]):
+                entry = None
+
+        if entry is not None:
+            breakdowns[category] = entry["breakdown"]
+            entries[category] = entry
+            reused.append(category)
+            continue
+
+        index = index or RepoIndex(repo_path)
+        deps = index.track()
+        if category == "documentation":
+            breakdown = score_documentation(repo_path, index)
+        elif category == "security":
+            breakdown = score_security(repo_path, index, secret_findings)
+        elif category == "ci_cd":
+            breakdown = score_cicd(repo_path, index)
+        else:
+            breakdown = score_community(repo_path, index, git_activity)
+        index.untrack()
+
+        breakdowns[category] = breakdown
+        if cache:
+            manifest = index.export_deps(deps)
+            if category == "community":
+                manifest["git"] = git_activity
+            entries[category] = {"breakdown": breakdown, "deps": manifest}
+
+    if cache:
+        if len(reused) < len(categories):
+            cache.store(repo_scope, entries)
+        if tree_hash and not (trusted and len(reused) == len(categories)):
+            cache.store(f"tree:{tree_hash}", entries)
+
+    return breakdowns, reused
+
+
 # ============================================================
 # Main Scoring Logic
 # ============================================================
 
-def calculate_score(repo_path: str, weights: Optional[Dict[str, int]] = None) -> Dict[str, Any]:
-    """Calculate overall quality score for a repository."""
+def calculate_score(
+    repo_path: str,
+    weights: Optional[Dict[str, int]] = None,
+    secret_details: bool = False,
+    cache: Optional[ScoreCache] = None,
+    git_since: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Calculate overall quality score for a repository.
+
+    With secret_details=True the security category also carries a
+    `secret_findings` list with every hardcoded-secret hit (file, line,
+    pattern name) instead of stopping the scan at the first one.
+    With a ScoreCache, unchanged categories are reused (see ScoreCache).
+    `git_since` bounds the commit history read for community scoring
+    (any `git log --since` value, e.g. "1 year ago").
+    """
     raw = weights if weights is not None else DEFAULT_WEIGHTS
     total_weight = sum(raw.values())
     if total_weight != 100:
@@ -603,11 +1360,14 @@ def calculate_score(repo_path: str, weights: Optional[Dict[str, int]] = None) ->
     else:
         local_weights = {k: float(v) for k, v in raw.items()}
 
-    # Get category scores
-    doc_scores = score_documentation(repo_path)
-    sec_scores = score_security(repo_path)
-    cicd_scores = score_cicd(repo_path)
-    com_scores = score_community(repo_path)
+    # Get category scores; the tree is indexed once and shared by every scorer
+    secret_findings: Optional[List[Dict[str, Any]]] = [] if secret_details else None
+    git = GitMetadata(repo_path, since=git_since)
+    breakdowns, reused = score_categories(repo_path, cache, secret_findings, git)
+    doc_scores = breakdowns["documentation"]
+    sec_scores = breakdowns["security"]
+    cicd_scores = breakdowns["ci_cd"]
+    com_scores = breakdowns["community"]
 
     # Calculate category totals
     doc_total = sum(doc_scores.values())
@@ -742,7 +1502,7 @@ def calculate_score(repo_path: str, weights: Optional[Dict[str, int]] = None) ->
         "community": 25,
     }
 
-    return {
+    result = {
         "score": round(overall_score, 1),
         "max_score": 100,
         "grade": grade,
@@ -780,8 +1540,163 @@ def calculate_score(repo_path: str, weights: Optional[Dict[str, int]] = None) ->
         },
         "issues": issues,
         "recommendations": recommendations,
-        "git_info": get_git_info()
+        "git_info": get_git_info(repo_path, git)
     }
+    if secret_findings is not None:
+        result["categories"]["security"]["secret_findings"] = secret_findings
+    if cache is not None:
+        result["cache"] = {"scorer_version": SCORER_VERSION, "reused": reused}
+    return result
+
+
+# ============================================================
+# Fleet Scoring
+# ============================================================
+
+def discover_fleet(target: str) -> List[str]:
+    """
+    Resolve a fleet target into repository paths.
+
+    A directory yields its immediate subdirectories; a file is read as a
+    list of repository paths, one per line (blank lines and `#` comments
+    are skipped, relative paths resolve against the list file).
+    """
+    if os.path.isdir(target):
+        return sorted(
+            os.path.abspath(entry.path) for entry in os.scandir(target)
+            if entry.is_dir() and not entry.name.startswith(".")
+        )
+    base = os.path.dirname(os.path.abspath(target))
+    repos = []
+    with open(target) as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith("#"):
+                repos.append(os.path.join(base, os.path.expanduser(line)))
+    return repos
+
+
+def _score_fleet_repo(
+    repo_path: str,
+    weights: Optional[Dict[str, int]],
+    cache_dir: Optional[str] = None,
+    git_since: Optional[str] = None,
+    secret_details: bool = False,
+) -> Dict[str, Any]:
+    """Score one fleet repository in a worker process."""
+    if not os.path.isdir(repo_path):
+        return {"repo": repo_path, "error": "Path is not a directory"}
+    cache = None
+    try:
+        cache = ScoreCache(cache_dir) if cache_dir else None
+        result = calculate_score(
+            repo_path, weights, secret_details=secret_details, cache=cache, git_since=git_since
+        )
+        return {"repo": repo_path, **result}
+    except Exception as exc:
+        return {"repo": repo_path, "error": f"{type(exc).__name__}: {exc}"}
+    finally:
+        if cache is not None:
+            cache.close()
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    rank = max(math.ceil(pct / 100 * len(values)), 1)
+    return values[rank - 1]
+
+
+def _secret_hits(result: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Hardcoded-secret hits of one scored result (empty unless scanned for)."""
+    if "error" in result:
+        return []
+    return result["categories"]["security"].get("secret_findings", [])
+
+
+def summarize_fleet(results: List[Dict[str, Any]], secret_details: bool = False) -> Dict[str, Any]:
+    """
+    Aggregate fleet results: grade distribution and per-category percentiles.
+
+    With secret_details=True the summary also lists every repository with
+    hardcoded-secret hits and its hit count.
+    """
+    scored = [r for r in results if "error" not in r]
+    grades = {grade: 0 for _, grade, _ in GRADE_THRESHOLDS}
+    for r in scored:
+        grades[r["grade"]] += 1
+
+    series: Dict[str, List[float]] = {"overall": sorted(r["score"] for r in scored)}
+    for category in DEFAULT_WEIGHTS:
+        series[category] = sorted(r["categories"][category]["percentage"] for r in scored)
+
+    percentiles = {}
+    for name, values in series.items():
+        if not values:
+            continue
+        percentiles[name] = {
+            "min": values[0],
+            "p25": _percentile(values, 25),
+            "p50": _percentile(values, 50),
+            "p75": _percentile(values, 75),
+            "p90": _percentile(values, 90),
+            "max": values[-1],
+            "mean": round(sum(values) / len(values), 1),
+        }
+
+    summary = {
+        "repositories": len(results),
+        "scored": len(scored),
+        "failed": [{"repo": r["repo"], "error": r["error"]} for r in results if "error" in r],
+        "grade_distribution": grades,
+        "percentiles": percentiles,
+    }
+    if secret_details:
+        summary["secrets"] = [
+            {"repo": r["repo"], "hits": len(_secret_hits(r))} for r in scored if _secret_hits(r)
+        ]
+    return summary
+
+
+def run_fleet(
+    repos: List[str],
+    weights: Optional[Dict[str, int]] = None,
+    workers: Optional[int] = None,
+    summary_path: Optional[str] = None,
+    cache_dir: Optional[str] = None,
+    git_since: Optional[str] = None,
+    secret_details: bool = False,
+    fail_on_secrets: bool = False,
+) -> int:
+    """
+    Score many repositories in one process pool.
+
+    One compact JSON line per repository is written to stdout as soon as it
+    finishes; the aggregate summary goes to `summary_path` (or stderr).
+    Returns 2 if `fail_on_secrets` and any repository has a hardcoded
+    secret, else 1 if any repository failed to score, else 0.
+    """
+    secret_details = secret_details or fail_on_secrets
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(_score_fleet_repo, repo, weights, cache_dir, git_since, secret_details)
+            for repo in repos
+        ]
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            sys.stdout.write(json.dumps(result, ensure_ascii=False) + "\n")
+            sys.stdout.flush()
+
+    summary = json.dumps(summarize_fleet(results, secret_details), indent=2, ensure_ascii=False)
+    if summary_path:
+        with open(summary_path, "w", encoding="utf-8") as f:
+            f.write(summary + "\n")
+    else:
+        print(summary, file=sys.stderr)
+    if fail_on_secrets and any(_secret_hits(r) for r in results):
+        return 2
+    return 1 if any("error" in r for r in results) else 0
 
 
 def main():
@@ -808,8 +1723,70 @@ def main():
         action="store_true",
         help="Show detailed breakdown"
     )
+    parser.add_argument(
+        "--secret-findings",
+        action="store_true",
+        help="Scan every source file and report hardcoded-secret hits with line numbers"
+    )
+    parser.add_argument(
+        "--fail-on-secrets",
+        action="store_true",
+        help="Exit with status 2 when any hardcoded secret is found (implies --secret-findings)"
+    )
+    parser.add_argument(
+        "--fleet",
+        metavar="DIR_OR_LIST",
+        help="Score many repositories: a directory of repos or a file listing repo paths"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Worker processes for --fleet (default: CPU count)"
+    )
+    parser.add_argument(
+        "--summary",
+        metavar="FILE",
+        help="Write the --fleet aggregate summary to FILE (default: stderr)"
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help=f"Reuse results for unchanged repositories/categories (cache in {default_cache_dir()})"
+    )
+    parser.add_argument(
+        "--cache-dir",
+        metavar="DIR",
+        help="Enable the score cache in DIR instead of the default location"
+    )
+    parser.add_argument(
+        "--git-since",
+        metavar="WHEN",
+        help="Only read commit history newer than WHEN (git log --since, e.g. '1 year ago')"
+    )
 
     args = parser.parse_args()
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
+
+    # Parse custom weights
+    weights = None
+    if args.weights:
+        try:
+            weights = json.loads(args.weights)
+        except json.JSONDecodeError:
+            print(f"Error: Invalid JSON for weights: {args.weights}", file=sys.stderr)
+            sys.exit(1)
+
+    cache_dir = args.cache_dir or (default_cache_dir() if args.cache else None)
+
+    if args.fleet:
+        if not os.path.exists(args.fleet):
+            print(f"Error: Fleet target not found: {args.fleet}", file=sys.stderr)
+            sys.exit(1)
+        return run_fleet(
+            discover_fleet(args.fleet), weights, args.workers, args.summary, cache_dir, args.git_since,
+            secret_details=args.secret_findings, fail_on_secrets=args.fail_on_secrets,
+        )
 
     # Validate path
     repo_path = os.path.abspath(args.path)
@@ -821,17 +1798,17 @@ def main():
     if not os.path.isdir(os.path.join(repo_path, ".git")):
         print(f"Warning: {repo_path} is not a git repository", file=sys.stderr)
 
-    # Parse custom weights
-    weights = None
-    if args.weights:
-        try:
-            weights = json.loads(args.weights)
-        except json.JSONDecodeError:
-            print(f"Error: Invalid JSON for weights: {args.weights}", file=sys.stderr)
-            sys.exit(1)
-
     # Calculate score
-    result = calculate_score(repo_path, weights)
+    secret_details = args.secret_findings or args.fail_on_secrets
+    cache = ScoreCache(cache_dir) if cache_dir else None
+    try:
+        result = calculate_score(
+            repo_path, weights, secret_details=secret_details, cache=cache, git_since=args.git_since
+        )
+    finally:
+        if cache is not None:
+            cache.close()
+    secret_hits = result["categories"]["security"].get("secret_findings", [])
 
     # Output
     if args.json_output:
@@ -867,6 +1844,15 @@ def main():
                 for issue in result["issues"]:
                     print(f"[{issue['severity'].upper()}] {issue['message']} (Impact: {issue['impact']})")
 
+        if secret_hits:
+            print(f"\n{'=' * 50}")
+            print("HARDCODED SECRETS")
+            print(f"{'=' * 50}")
+            for hit in secret_hits:
+                print(f"{hit['file']}:{hit['line']} ({hit['pattern']})")
+
+    if args.fail_on_secrets and secret_hits:
+        return 2
     return 0
 
 
@@ -14,35 +14,76 @@ Variable resolution order:
 1. --vars or --vars-file (highest priority)
 2. git config (user.name, user.email, remote.origin.url)
 3. Default/fallback values
+
+Batch mode (--batch manifest.json) renders many template/output pairs in
+one process, detecting project facts once for the whole batch:
+    {"vars": {"PROJECT_NAME": "demo"},
+     "items": [{"template": "README.md.template", "output": "README.md"}]}
 """
 
 import argparse
+import functools
 import json
 import os
 import re
 import sys
+import tempfile
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 
 import subprocess as _subprocess
 
 
-def get_git_config(key: str, default: str = "") -> str:
-    """Get value from git config, return default if not set."""
+# Detector results memoized while a project-facts snapshot is active
+_FACTS: Optional[Dict[str, Any]] = None
+
+
+def project_fact(func):
+    """Memoize a zero-argument detector while a facts snapshot is active."""
+    @functools.wraps(func)
+    def wrapper():
+        if _FACTS is None:
+            return func()
+        if func.__name__ not in _FACTS:
+            _FACTS[func.__name__] = func()
+        return _FACTS[func.__name__]
+    return wrapper
+
+
+@project_fact
+def read_git_config() -> Dict[str, str]:
+    """Read the whole effective git config with a single `git config --list`."""
+    config: Dict[str, str] = {}
     try:
         result = _subprocess.run(
-            ["git", "config", key],
+            ["git", "config", "--list", "-z"],
             capture_output=True,
             text=True,
             check=True
         )
-        return result.stdout.strip()
     except (_subprocess.CalledProcessError, FileNotFoundError):
-        return default
+        return config
+    for entry in result.stdout.split("\0"):
+        if entry:
+            key, _, value = entry.partition("\n")
+            # Later entries win, as with `git config <key>`
+            config[key] = value
+    return config
+
+
+def get_git_config(key: str, default: str = "") -> str:
+    """Get value from git config, return default if not set."""
+    # Section and variable names are case-insensitive; subsections are not
+    section, _, rest = key.partition(".")
+    subsection, _, name = rest.rpartition(".")
+    normalized = ".".join(p for p in (section.lower(), subsection, name.lower()) if p)
+    return read_git_config().get(normalized, default)
 
 
+@project_fact
 def get_project_name() -> str:
     """Extract project name from git remote or directory name."""
     try:
@@ -60,6 +101,7 @@ def get_project_name() -> str:
     return Path.cwd().name
 
 
+@project_fact
 def get_github_username() -> Optional[str]:
     """Get GitHub username from git remote."""
     try:
@@ -76,6 +118,7 @@ def get_github_username() -> Optional[str]:
     return None
 
 
+@project_fact
 def detect_license() -> str:
     """Detect license type from LICENSE file."""
     license_files = ["LICENSE", "LICENSE.md", "LICENSE.txt"]
@@ -95,6 +138,7 @@ def detect_license() -> str:
     return "MIT"
 
 
+@project_fact
 def get_version() -> str:
     """Get version from package.json or pyproject.toml."""
     # Try package.json
@@ -120,6 +164,7 @@ def get_version() -> str:
     return "0.1.0"
 
 
+@project_fact
 def detect_primary_language() -> str:
     """Detect primary programming language."""
     # Check for Python
@@ -149,6 +194,7 @@ def detect_primary_language() -> str:
     return "Unknown"
 
 
+@project_fact
 def detect_tech_stack() -> list:
     """Detect technology stack."""
     stack = []
@@ -196,11 +242,13 @@ def detect_tech_stack() -> list:
     return stack
 
 
+@project_fact
 def has_ci() -> bool:
     """Check if CI/CD is configured."""
     return os.path.isdir(".github/workflows") or os.path.exists(".gitlab-ci.yml")
 
 
+@project_fact
 def has_tests() -> bool:
     """Check if tests are configured."""
     if os.path.isdir("tests") or os.path.isdir("test"):
@@ -217,16 +265,19 @@ def has_tests() -> bool:
     return False
 
 
+@project_fact
 def has_docker() -> bool:
     """Check if Docker is configured."""
     return os.path.exists("Dockerfile") or os.path.exists("docker-compose.yml")
 
 
+@project_fact
 def has_license() -> bool:
     """Check if LICENSE file exists."""
     return any(os.path.exists(f) for f in ["LICENSE", "LICENSE.md", "LICENSE.txt"])
 
 
+@project_fact
 def is_library() -> bool:
     """Check if project is a library."""
     if os.path.exists("setup.py"):
@@ -248,6 +299,7 @@ def is_library() -> bool:
     return False
 
 
+@project_fact
 def is_cli() -> bool:
     """Check if project is a CLI tool."""
     if os.path.exists("package.json"):
@@ -266,6 +318,7 @@ def is_cli() -> bool:
     return False
 
 
+@project_fact
 def detect_has_coverage() -> bool:
     """Detect if project has coverage tooling configured."""
     coverage_indicators = [".coveragerc", "coverage.xml", ".coverage"]
@@ -292,6 +345,7 @@ def detect_has_coverage() -> bool:
     return False
 
 
+@project_fact
 def detect_has_linter() -> bool:
     """Detect if project has a linter configured."""
     linter_files = [
@@ -321,6 +375,7 @@ def detect_has_linter() -> bool:
     return False
 
 
+@project_fact
 def detect_has_config_file() -> bool:
     """Detect if project has a meaningful config file."""
     config_files = [
@@ -332,6 +387,7 @@ def detect_has_config_file() -> bool:
     return any(os.path.exists(f) for f in config_files)
 
 
+@project_fact
 def detect_has_discussions() -> bool:
     """Detect if GitHub Discussions is referenced in project files."""
     for fname in ["README.md", ".github/CONTRIBUTING.md", "CONTRIBUTING.md"]:
@@ -346,6 +402,7 @@ def detect_has_discussions() -> bool:
     return False
 
 
+@project_fact
 def detect_has_issues() -> bool:
     """Detect if GitHub Issues is enabled (presence of issue templates or references)."""
     if os.path.isdir(".github/ISSUE_TEMPLATE"):
@@ -362,6 +419,38 @@ def detect_has_issues() -> bool:
     return False
 
 
+@project_fact
+def detect_has_ruff() -> bool:
+    """Detect if Ruff is configured in pyproject.toml."""
+    if os.path.exists("pyproject.toml"):
+        try:
+            with open("pyproject.toml", encoding="utf-8") as f:
+                return "[tool.ruff" in f.read()
+        except (OSError, UnicodeDecodeError):
+            return False
+    return False
+
+
+@contextmanager
+def project_facts_snapshot() -> Iterator[Dict[str, Any]]:
+    """
+    Detect every project fact once and serve all lookups from that snapshot.
+
+    The snapshot is taken eagerly on entry, so files written while it is
+    active (e.g. a batch rendering a CI workflow) do not change the
+    conditions seen by templates rendered later in the same batch.
+    """
+    global _FACTS
+    previous = _FACTS
+    _FACTS = {}
+    try:
+        for detector in PROJECT_DETECTORS:
+            detector()
+        yield _FACTS
+    finally:
+        _FACTS = previous
+
+
 def resolve_variables(
     provided_vars: dict,
     mock: bool = False
@@ -479,14 +568,7 @@ def resolve_variables(
     if "PYTEST" not in vars:
         vars["PYTEST"] = primary == "python"
     if "RUFF" not in vars:
-        ruff_present = False
-        if os.path.exists("pyproject.toml"):
-            try:
-                with open("pyproject.toml", encoding="utf-8") as f:
-                    ruff_present = "[tool.ruff" in f.read()
-            except (OSError, UnicodeDecodeError):
-                ruff_present = False
-        vars["RUFF"] = ruff_present
+        vars["RUFF"] = detect_has_ruff()
 
     # Coverage command default
     if "COVERAGE_COMMAND" not in vars:
@@ -535,62 +617,205 @@ def evaluate_condition(condition: str, vars: dict) -> bool:
     return bool(vars.get(condition, ""))
 
 
-def render_template(template_content: str, vars: dict) -> str:
-    """Render template with variable substitution and conditionals."""
-
-    def process_conditionals(content: str, is_negated: bool) -> str:
-        """Process conditional blocks recursively (positive or negated pass)."""
-        if is_negated:
-            # Match {{^COND}}...{{/COND}}
-            pattern = r'\{\{\^([A-Z_][A-Z0-9_]*)\}\}(.*?)\{\{/\1\}\}'
+# Every memoized detector, evaluated up front by project_facts_snapshot()
+PROJECT_DETECTORS = [
+    read_git_config, get_project_name, get_github_username, detect_license,
+    get_version, detect_primary_language, detect_tech_stack, has_ci, has_tests,
+    has_docker, has_license, is_library, is_cli, detect_has_coverage,
+    detect_has_linter, detect_has_config_file, detect_has_discussions,
+    detect_has_issues, detect_has_ruff,
+]
+
+
+# ============================================================
+# Template Engine
+# ============================================================
+
+# One tag grammar for sections ({{#X}}, {{^X}}), closers ({{/X}}) and variables
+TAG_PATTERN = re.compile(r'\{\{([#^/]?)([A-Z_][A-Z0-9_]*)\}\}')
+
+# AST node kinds: ("text", str) | ("var", name, raw) | ("section", name, inverted, children)
+TEXT, VAR, SECTION = "text", "var", "section"
+
+# Compiled templates by path -> (mtime_ns, size, ast)
+_TEMPLATE_CACHE: Dict[str, Tuple[int, int, list]] = {}
+
+
+def compile_template(template_content: str) -> list:
+    """
+    Compile a template into an AST in one pass over its tags.
+
+    Sections nest Mustache-style: a closer pairs with the innermost open
+    section of the same name, so a section nested in itself pairs inner
+    with inner. Any section still open inside it is left unclosed. An
+    unclosed section keeps its opening tag as literal text and its body
+    renders unconditionally. A closer with no open section is literal
+    text too. Well-formed templates render as they did under the old
+    regex-based renderer. Crossing tags ({{#A}}{{#B}}{{/A}}{{/B}}) and
+    self-nested sections do not. In that example {{#B}} and {{/B}} stay
+    literal, and B's body renders whenever A's does.
+    """
+    root: list = []
+    # Frames: (name, inverted, children, raw opening tag)
+    stack: List[Tuple[Optional[str], bool, list, str]] = [(None, False, root, "")]
+    pos = 0
+
+    def flatten_top() -> None:
+        _, _, children, raw = stack.pop()
+        parent = stack[-1][2]
+        parent.append((TEXT, raw))
+        parent.extend(children)
+
+    for match in TAG_PATTERN.finditer(template_content):
+        if match.start() > pos:
+            stack[-1][2].append((TEXT, template_content[pos:match.start()]))
+        pos = match.end()
+        sigil, name = match.group(1), match.group(2)
+
+        if sigil in ("#", "^"):
+            stack.append((name, sigil == "^", [], match.group(0)))
+        elif sigil == "/":
+            if any(frame[0] == name for frame in stack[1:]):
+                while stack[-1][0] != name:
+                    flatten_top()
+                name, inverted, children, _ = stack.pop()
+                stack[-1][2].append((SECTION, name, inverted, children))
+            else:
+                stack[-1][2].append((TEXT, match.group(0)))
         else:
-            # Match {{#COND}}...{{/COND}}
-            pattern = r'\{\{#([A-Z_][A-Z0-9_]*)\}\}(.*?)\{\{/\1\}\}'
-
-        def replace_match(match):
-            condition = match.group(1)
-            block_content = match.group(2)
-            include = evaluate_condition(condition, vars)
-            if is_negated:
-                include = not include
-            return block_content if include else ""
-
-        # Keep processing until no more conditionals (handles nested blocks)
-        prev_content = None
-        while prev_content != content:
-            prev_content = content
-            content = re.sub(pattern, replace_match, content, flags=re.DOTALL)
-
-        return content
+            stack[-1][2].append((VAR, name, match.group(0)))
+
+    if pos < len(template_content):
+        stack[-1][2].append((TEXT, template_content[pos:]))
+    while len(stack) > 1:
+        flatten_top()
+    return root
+
+
+def compile_template_file(path: str) -> list:
+    """Compile a template file, reusing the cached AST while path+mtime match."""
+    st = os.stat(path)
+    key = os.path.abspath(path)
+    cached = _TEMPLATE_CACHE.get(key)
+    if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+    with open(path) as f:
+        ast = compile_template(f.read())
+    _TEMPLATE_CACHE[key] = (st.st_mtime_ns, st.st_size, ast)
+    return ast
+
+
+def render_ast(ast: list, vars: dict) -> str:
+    """Render a compiled template in time linear to its size."""
+    out: List[str] = []
+    conditions: Dict[str, bool] = {}
+
+    def walk(nodes: list) -> None:
+        for node in nodes:
+            kind = node[0]
+            if kind is TEXT:
+                out.append(node[1])
+            elif kind is VAR:
+                name = node[1]
+                out.append(str(vars[name]) if name in vars else node[2])
+            else:
+                name, inverted, children = node[1], node[2], node[3]
+                if name not in conditions:
+                    conditions[name] = bool(evaluate_condition(name, vars))
+                if conditions[name] != inverted:
+                    walk(children)
+
+    walk(ast)
+    return "".join(out)
 
-    def process_variables(content: str) -> str:
-        """Process simple variable substitution."""
-        pattern = r'\{\{([A-Z_][A-Z0-9_]*)\}\}'
 
-        def replace_var(match):
-            var_name = match.group(1)
-            return str(vars.get(var_name, match.group(0)))
-
-        return re.sub(pattern, replace_var, content)
-
-    # Step 1: Process negated conditionals {{^COND}}...{{/COND}}
-    template_content = process_conditionals(template_content, is_negated=True)
-
-    # Step 2: Process positive conditionals {{#COND}}...{{/COND}}
-    template_content = process_conditionals(template_content, is_negated=False)
+def render_template(template_content: str, vars: dict) -> str:
+    """Render template with variable substitution and conditionals."""
+    return render_ast(compile_template(template_content), vars)
 
-    # Step 3: Simple variable substitution
-    template_content = process_variables(template_content)
 
-    return template_content
+def write_atomic(path: str, content: str) -> None:
+    """Write content to path via a temp file and rename, creating parent dirs."""
+    output_path = Path(path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        mode = os.stat(output_path).st_mode & 0o7777
+    except FileNotFoundError:
+        # mkstemp creates 0600 files; match what a plain open() would give
+        umask = os.umask(0)
+        os.umask(umask)
+        mode = 0o666 & ~umask
+    fd, tmp_path = tempfile.mkstemp(dir=output_path.parent, prefix=f".{output_path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(content)
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def load_batch_manifest(path: str) -> Tuple[dict, List[dict]]:
+    """
+    Load a batch manifest.
+
+    Either a list of {"template", "output", "vars"?} items, or an object
+    {"vars": {...}, "items": [...]} whose shared vars apply to every item
+    (item vars take precedence).
+    """
+    with open(path) as f:
+        manifest = json.load(f)
+    if isinstance(manifest, list):
+        shared, items = {}, manifest
+    else:
+        shared, items = manifest.get("vars", {}), manifest.get("items", [])
+    for i, item in enumerate(items):
+        if not isinstance(item, dict) or "template" not in item or "output" not in item:
+            raise ValueError(f"item {i} needs 'template' and 'output'")
+    return shared, items
+
+
+def render_batch(shared_vars: dict, items: List[dict], mock: bool = False) -> int:
+    """
+    Render every manifest item in one process.
+
+    Project facts are detected once for the whole batch, variables are
+    resolved once per distinct set of provided vars, compiled templates
+    are shared, and each output is written atomically. Returns the number
+    of failed items.
+    """
+    failures = 0
+    resolved: Dict[str, dict] = {}
+    with project_facts_snapshot():
+        for item in items:
+            provided = {**shared_vars, **item.get("vars", {})}
+            key = json.dumps(provided, sort_keys=True, default=str)
+            if key not in resolved:
+                resolved[key] = resolve_variables(provided, mock=mock)
+            try:
+                ast = compile_template_file(item["template"])
+                write_atomic(item["output"], render_ast(ast, resolved[key]))
+                print(f"Template rendered to: {item['output']}")
+            except FileNotFoundError:
+                print(f"Error: Template file not found: {item['template']}", file=sys.stderr)
+                failures += 1
+            except Exception as e:
+                print(f"Error rendering {item['template']} -> {item['output']}: {e}", file=sys.stderr)
+                failures += 1
+    return failures
 
 
 def main():
     parser = argparse.ArgumentParser(
         description="Template rendering with Mustache-style variable substitution"
     )
-    parser.add_argument("--template", required=True, help="Template file path")
-    parser.add_argument("--output", required=True, help="Output file path")
+    parser.add_argument("--template", help="Template file path")
+    parser.add_argument("--output", help="Output file path")
+    parser.add_argument("--batch", metavar="MANIFEST", help="JSON manifest of template/output pairs to render")
     parser.add_argument("--vars", help="Comma-separated key=value pairs")
     parser.add_argument("--vars-file", help="JSON file with variables")
     parser.add_argument("--prompt-missing", action="store_true", help="Prompt for missing variables")
@@ -598,6 +823,8 @@ def main():
     parser.add_argument("--strict", action="store_true", help="Fail on missing variables")
 
     args = parser.parse_args()
+    if not args.batch and not (args.template and args.output):
+        parser.error("--template and --output are required unless --batch is given")
 
     # Parse provided variables
     provided_vars = {}
@@ -616,13 +843,22 @@ def main():
             print(f"Error reading vars file: {e}", file=sys.stderr)
             sys.exit(1)
 
+    if args.batch:
+        try:
+            shared_vars, items = load_batch_manifest(args.batch)
+        except Exception as e:
+            print(f"Error reading batch manifest: {e}", file=sys.stderr)
+            sys.exit(1)
+        # Command-line vars act as defaults under the manifest's own vars
+        failures = render_batch({**provided_vars, **shared_vars}, items, mock=args.mock_vars)
+        return 1 if failures else 0
+
     # Resolve all variables
     vars = resolve_variables(provided_vars, mock=args.mock_vars)
 
-    # Read template
+    # Read and compile template
     try:
-        with open(args.template) as f:
-            template_content = f.read()
+        ast = compile_template_file(args.template)
     except FileNotFoundError:
         print(f"Error: Template file not found: {args.template}", file=sys.stderr)
         sys.exit(1)
@@ -631,17 +867,12 @@ def main():
         sys.exit(1)
 
     # Render template
-    rendered = render_template(template_content, vars)
-
-    # Ensure output directory exists
-    output_path = Path(args.output)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
+    rendered = render_ast(ast, vars)
 
-    # Write output
+    # Write output atomically (creates the output directory)
     try:
-        with open(output_path, "w") as f:
-            f.write(rendered)
-        print(f"Template rendered to: {output_path}")
+        write_atomic(args.output, rendered)
+        print(f"Template rendered to: {args.output}")
     except Exception as e:
         print(f"Error writing output: {e}", file=sys.stderr)
         sys.exit(1)
@@ -6,6 +6,7 @@
 # Usage:
 #   bash scripts/generate-template.sh --template X --output Y --vars "key=val,..."
 #   bash scripts/generate-template.sh --template X --output Y --vars-file vars.json
+#   bash scripts/generate-template.sh --batch manifest.json
 #   bash scripts/generate-template.sh --help
 #
 # Exit codes:
@@ -42,6 +43,10 @@ while [[ $# -gt 0 ]]; do
             args+=("--output" "$2")
             shift 2
             ;;
+        --batch)
+            args+=("--batch" "$2")
+            shift 2
+            ;;
         --vars)
             args+=("--vars" "$2")
             shift 2
@@ -68,8 +73,9 @@ while [[ $# -gt 0 ]]; do
             echo "Template rendering script with Mustache-style variable substitution"
             echo ""
             echo "Options:"
-            echo "  --template FILE      Template file path (required)"
-            echo "  --output FILE        Output file path (required)"
+            echo "  --template FILE      Template file path (required unless --batch)"
+            echo "  --output FILE        Output file path (required unless --batch)"
+            echo "  --batch FILE         JSON manifest of template/output pairs to render"
             echo "  --vars \"k=v,k=v\"    Comma-separated key=value pairs"
             echo "  --vars-file FILE     JSON file with variables"
             echo "  --prompt-missing     Prompt for missing variables"
@@ -0,0 +1,298 @@
+#!/usr/bin/env bash
+# run_script_tests.sh — Regression tests for the repo-structure scripts.
+#
+# Checks that calculate-score.py:
+#   1. ignores exactly what git ignores (anchoring, globs within a segment, **)
+#   2. validates --workers and applies the secret gate in --fleet mode
+#   3. bounds the streaming git log pass by commit count and wall-clock time
+# and that generate-template.py:
+#   4. renders every shipped template as the regex renderer it replaced did,
+#      and handles self-nested and crossing section tags as documented
+#   5. renders --batch manifests atomically and exits 1 when an item fails
+#
+# Usage:
+#   bash tests/run_script_tests.sh          # from plugin root
+#   bash tests/run_script_tests.sh --verbose
+
+set -uo pipefail
+cd "$(dirname "$0")/.." || exit 1
+
+VERBOSE=false
+[[ "${1:-}" == "--verbose" ]] && VERBOSE=true
+
+PASS=0
+FAIL=0
+ERRORS=()
+
+_TMP_DIR=$(mktemp -d "${TMPDIR:-/tmp}/repo-structure-tests.XXXXXX") || exit 1
+trap 'rm -rf "$_TMP_DIR"' EXIT
+
+assert() {
+    local name="$1"
+    local cmd="$2"
+    local expect_exit="${3:-0}"
+
+    local actual_exit=0
+    eval "$cmd" > /dev/null 2>&1 || actual_exit=$?
+
+    if [[ $actual_exit -eq $expect_exit ]]; then
+        PASS=$((PASS + 1))
+        $VERBOSE && echo "PASS [$name]"
+    else
+        FAIL=$((FAIL + 1))
+        ERRORS+=("FAIL [$name]: expected exit=$expect_exit, got exit=$actual_exit  cmd: $cmd")
+    fi
+}
+
+# Loads the hyphenated scripts as modules for the Python checks below
+PRELUDE='
+import importlib.util, json, os, subprocess, sys
+
+def load(name):
+    spec = importlib.util.spec_from_file_location(name.replace("-", "_"), f"scripts/{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+TMP = os.environ["TMP_DIR"]
+'
+
+# check NAME < python-snippet — passes when the snippet exits 0
+check() {
+    local name="$1"
+    local output
+    if output=$({ echo "$PRELUDE"; cat; } | TMP_DIR="$_TMP_DIR" python3 - 2>&1); then
+        PASS=$((PASS + 1))
+        $VERBOSE && echo "PASS [$name]"
+    else
+        FAIL=$((FAIL + 1))
+        ERRORS+=("FAIL [$name]: $output")
+    fi
+}
+
+# ---------------------------------------------------------------------------
+# 1. .gitignore matching follows git
+# ---------------------------------------------------------------------------
+
+check "anchored dir-only pattern ignores only the top-level dir" <<'PYEOF'
+cs = load("calculate-score")
+ignore = cs.GitIgnore()
+path = os.path.join(TMP, "anchored.gitignore")
+open(path, "w").write("/build/\n")
+ignore.add_file("", path)
+assert ignore.ignored("build", True)
+assert not ignore.ignored("src/build", True)
+assert not ignore.ignored("build", False)
+PYEOF
+
+check "single * does not cross directories" <<'PYEOF'
+cs = load("calculate-score")
+ignore = cs.GitIgnore()
+path = os.path.join(TMP, "star.gitignore")
+open(path, "w").write("/*.log\ndocs/*.md\n")
+ignore.add_file("", path)
+assert ignore.ignored("a.log", False)
+assert not ignore.ignored("src/a.log", False)
+assert ignore.ignored("docs/a.md", False)
+assert not ignore.ignored("docs/sub/a.md", False)
+PYEOF
+
+check "** spans directories" <<'PYEOF'
+cs = load("calculate-score")
+ignore = cs.GitIgnore()
+path = os.path.join(TMP, "globstar.gitignore")
+open(path, "w").write("docs/**/*.md\n**/logs\n")
+ignore.add_file("", path)
+assert ignore.ignored("docs/a.md", False)
+assert ignore.ignored("docs/sub/deep/a.md", False)
+assert ignore.ignored("logs", True)
+assert ignore.ignored("src/logs", True)
+PYEOF
+
+check "indexed files match git ls-files" <<'PYEOF'
+cs = load("calculate-score")
+repo = os.path.join(TMP, "ignore-repo")
+rules = "/build/\n/*.log\ndocs/*.md\na/**/b\n*.tmp\n!keep.tmp\nfoo?.txt\n[!x].d\n"
+paths = [
+    "build/o", "src/build/o", "a.log", "src/a.log", "docs/a.md", "docs/sub/a.md",
+    "a/x/b/f", "a/b/f", "x.tmp", "keep.tmp", "foo1.txt", "foo/1.txt", "y.d", "x.d",
+]
+for rel in paths:
+    os.makedirs(os.path.join(repo, os.path.dirname(rel)), exist_ok=True)
+    open(os.path.join(repo, rel), "w").close()
+open(os.path.join(repo, ".gitignore"), "w").write(rules)
+subprocess.run(["git", "init", "-q", repo], check=True)
+listed = subprocess.run(
+    ["git", "-C", repo, "ls-files", "-co", "--exclude-standard"],
+    capture_output=True, text=True, check=True,
+).stdout.split()
+indexed = cs.RepoIndex(repo).files
+assert sorted(indexed) == sorted(listed), (sorted(set(indexed) ^ set(listed)))
+PYEOF
+
+# ---------------------------------------------------------------------------
+# 2. Fleet mode
+# ---------------------------------------------------------------------------
+
+FLEET_DIR="$_TMP_DIR/fleet"
+mkdir -p "$FLEET_DIR/clean" "$FLEET_DIR/leaky"
+echo "# clean" > "$FLEET_DIR/clean/README.md"
+echo 'api_key = "sk-live-123"' > "$FLEET_DIR/leaky/settings.py"
+
+assert "--workers 0 is a usage error" \
+    "python3 scripts/calculate-score.py --fleet '$FLEET_DIR' --workers 0" 2
+assert "fleet without the secret gate succeeds" \
+    "python3 scripts/calculate-score.py --fleet '$FLEET_DIR' --workers 1 --summary '$_TMP_DIR/fleet.json'"
+assert "fleet --fail-on-secrets exits 2 on a hit" \
+    "python3 scripts/calculate-score.py --fleet '$FLEET_DIR' --workers 1 --fail-on-secrets --summary '$_TMP_DIR/fleet-secrets.json'" 2
+check "fleet summary lists the repository with secrets" <<'PYEOF'
+summary = json.load(open(os.path.join(TMP, "fleet-secrets.json")))
+assert [entry["repo"].rsplit("/", 1)[-1] for entry in summary["secrets"]] == ["leaky"], summary["secrets"]
+assert "secrets" not in json.load(open(os.path.join(TMP, "fleet.json")))
+PYEOF
+
+# ---------------------------------------------------------------------------
+# 3. git log pass is bounded
+# ---------------------------------------------------------------------------
+
+check "git log pass stops at the deadline" <<'PYEOF'
+import time
+cs = load("calculate-score")
+repo = os.path.join(TMP, "slow-git")
+fake_bin = os.path.join(TMP, "fake-bin")
+os.makedirs(os.path.join(repo, ".git"))
+os.makedirs(fake_bin)
+# A git whose log prints one commit and then stalls
+fake_git = os.path.join(fake_bin, "git")
+with open(fake_git, "w") as f:
+    f.write('#!/bin/sh\necho "$@" > "$(dirname "$0")/args"\n'
+            'printf "h\\000t\\0001700000000\\000Ann\\n"\nexec sleep 60\n')
+os.chmod(fake_git, 0o755)
+os.environ["PATH"] = fake_bin + os.pathsep + os.environ["PATH"]
+cs.GitMetadata.LOG_TIMEOUT = 1
+started = time.monotonic()
+facts = cs.GitMetadata(repo).log
+elapsed = time.monotonic() - started
+assert elapsed < 10, elapsed
+assert facts["head"] == "h" and facts["last_commit"] == 1700000000, facts
+assert f"--max-count={cs.GitMetadata.LOG_MAX_COUNT}" in open(os.path.join(fake_bin, "args")).read()
+PYEOF
+
+# ---------------------------------------------------------------------------
+# 4. Template compiler
+# ---------------------------------------------------------------------------
+
+check "shipped templates render as the regex renderer did" <<'PYEOF'
+import glob, random, re
+gt = load("generate-template")
+
+def regex_render(content, vars, evaluate):
+    """The renderer compile_template/render_ast replaced: inverted, then positive
+    sections until nothing changes, then variables."""
+    for sigil, negated in (("\\^", True), ("#", False)):
+        pattern = r"\{\{" + sigil + r"([A-Z_][A-Z0-9_]*)\}\}(.*?)\{\{/\1\}\}"
+        def replace(match):
+            include = evaluate(match.group(1), vars)
+            return match.group(2) if include != negated else ""
+        previous = None
+        while previous != content:
+            previous = content
+            content = re.sub(pattern, replace, content, flags=re.DOTALL)
+    return re.sub(r"\{\{([A-Z_][A-Z0-9_]*)\}\}", lambda m: str(vars.get(m.group(1), m.group(0))), content)
+
+templates = sorted(glob.glob("skills/repository-templates/templates/**/*.template", recursive=True))
+assert templates
+vars = {"PROJECT_NAME": "demo", "GITHUB_USERNAME": "octo", "AUTHOR_NAME": "Ann", "YEAR": 2026}
+rng = random.Random(7)
+for path in templates:
+    content = open(path).read()
+    names = sorted(set(re.findall(r"\{\{[#^/]([A-Z_][A-Z0-9_]*)\}\}", content)))
+    assignments = [dict.fromkeys(names, True), dict.fromkeys(names, False)]
+    assignments += [{name: rng.random() < 0.5 for name in names} for _ in range(20)]
+    for truth in assignments:
+        evaluate = lambda name, _vars, truth=truth: truth[name]
+        gt.evaluate_condition = evaluate
+        expected = regex_render(content, vars, evaluate)
+        assert gt.render_template(content, vars) == expected, (path, truth)
+PYEOF
+
+check "self-nested and crossing sections behave as documented" <<'PYEOF'
+gt = load("generate-template")
+gt.evaluate_condition = lambda name, vars: vars[name]
+render = gt.render_template
+# A closer pairs with the innermost open section of its name
+assert render("{{#A}}1{{#A}}2{{/A}}3{{/A}}", {"A": True}) == "123"
+assert render("{{#A}}1{{#A}}2{{/A}}3{{/A}}", {"A": False}) == ""
+# Crossing tags: B stays literal and its body renders whenever A's does
+assert render("{{#A}}a{{#B}}b{{/A}}c{{/B}}", {"A": True, "B": False}) == "a{{#B}}bc{{/B}}"
+assert render("{{#A}}a{{#B}}b{{/A}}c{{/B}}", {"A": False, "B": True}) == "c{{/B}}"
+# Unclosed sections and stray closers are literal text
+assert render("{{#A}}x", {"A": False}) == "{{#A}}x"
+assert render("x{{/A}}", {"A": True}) == "x{{/A}}"
+PYEOF
+
+# ---------------------------------------------------------------------------
+# 5. Batch rendering
+# ---------------------------------------------------------------------------
+
+BATCH_DIR="$_TMP_DIR/batch"
+mkdir -p "$BATCH_DIR/out"
+printf 'Hello {{PROJECT_NAME}}\n' > "$BATCH_DIR/hello.template"
+printf 'stale\n' > "$BATCH_DIR/out/existing.md"
+chmod 640 "$BATCH_DIR/out/existing.md"
+cat > "$BATCH_DIR/manifest.json" <<JSONEOF
+{
+  "vars": {"PROJECT_NAME": "demo"},
+  "items": [
+    {"template": "$BATCH_DIR/hello.template", "output": "$BATCH_DIR/out/existing.md"},
+    {"template": "$BATCH_DIR/missing.template", "output": "$BATCH_DIR/out/missing.md"},
+    {"template": "$BATCH_DIR/hello.template", "output": "$BATCH_DIR/out/nested/new.md",
+     "vars": {"PROJECT_NAME": "other"}}
+  ]
+}
+JSONEOF
+
+assert "a failing batch item makes --batch exit 1" \
+    "python3 scripts/generate-template.py --batch '$BATCH_DIR/manifest.json'" 1
+check "the other batch items are still written, atomically" <<'PYEOF'
+import glob, stat
+out = os.path.join(TMP, "batch", "out")
+assert open(os.path.join(out, "existing.md")).read() == "Hello demo\n"
+assert stat.S_IMODE(os.stat(os.path.join(out, "existing.md")).st_mode) == 0o640
+assert open(os.path.join(out, "nested", "new.md")).read() == "Hello other\n"
+assert not os.path.exists(os.path.join(out, "missing.md"))
+leftovers = glob.glob(os.path.join(out, "**", ".*.tmp"), recursive=True)
+assert not leftovers, leftovers
+PYEOF
+
+check "a failed write keeps the old file and removes the temp file" <<'PYEOF'
+import glob
+gt = load("generate-template")
+target = os.path.join(TMP, "batch", "atomic.md")
+open(target, "w").write("old\n")
+def broken_replace(src, dst):
+    raise OSError("disk full")
+gt.os.replace = broken_replace
+try:
+    gt.write_atomic(target, "new\n")
+except OSError:
+    pass
+else:
+    raise AssertionError("write_atomic swallowed the error")
+assert open(target).read() == "old\n"
+assert not glob.glob(os.path.join(TMP, "batch", ".atomic.md.*")), "temp file left behind"
+PYEOF
+
+# ---------------------------------------------------------------------------
+# Results
+# ---------------------------------------------------------------------------
+
+echo ""
+echo "Script tests: $PASS passed, $FAIL failed"
+
+if [[ $FAIL -gt 0 ]]; then
+    for err in "${ERRORS[@]}"; do
+        echo "$err"
+    done
+    exit 1
+fi